@@ -0,0 +1,78 @@
+"""
+Compares TransactionService.add_transactions against one add_transaction
+per row.
+
+Usage:
+    python -m benchmarks.bench_bulk_import [--rows N] [--single-rows N]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from src.database.db_manager import DatabaseManager
+from src.database.migration_manager import MigrationManager
+from src.models.category import Category
+from src.models.payment_method.credit import Credit
+from src.models.transaction.expense import Expense
+from src.services.transaction_service import TransactionService
+
+
+def make_expenses(count: int, payment_method: Credit, category: Category):
+    start = datetime(2020, 1, 1)
+    for i in range(count):
+        yield Expense(
+            amount=10 + i % 90,
+            description=f"Compra {i}",
+            date=start + timedelta(minutes=i),
+            payment_method=payment_method,
+            category=category,
+        )
+
+
+def setup(db_file: str) -> tuple[TransactionService, Credit, Category]:
+    db = DatabaseManager(db_file)
+    MigrationManager(db).apply_all_pending()
+    service = TransactionService(db=db)
+    card = service.payment_service.add_payment_method(
+        Credit(name="Cartão", credit_limit=10**12)
+    )
+    category = service.category_service.add_category(Category(name="Mercado"))
+    return service, card, category
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--single-rows", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        service, card, category = setup(str(Path(tmp) / "single.db"))
+        start = time.perf_counter()
+        for expense in make_expenses(args.single_rows, card, category):
+            service.add_transaction(expense)
+        single = args.single_rows / (time.perf_counter() - start)
+
+        service, card, category = setup(str(Path(tmp) / "bulk.db"))
+        start = time.perf_counter()
+        saved = service.add_transactions(make_expenses(args.rows, card, category))
+        bulk_elapsed = time.perf_counter() - start
+        bulk = saved / bulk_elapsed
+
+        DatabaseManager.close_all_pools()
+
+    print(f"add_transaction:  {single:10.0f} rows/s")
+    print(
+        f"add_transactions: {bulk:10.0f} rows/s "
+        f"({saved:,} rows in {bulk_elapsed:.1f}s)"
+    )
+    print(
+        f"estimated time for {args.rows:,} rows one by one: "
+        f"{args.rows / single:.0f}s ({bulk / single:.0f}x slower)"
+    )
+
+
+if __name__ == "__main__":
+    main()
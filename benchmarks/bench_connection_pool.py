@@ -0,0 +1,46 @@
+"""
+Compares queries/sec of pooled connections against connect-per-call.
+
+Usage:
+    python -m benchmarks.bench_connection_pool [--queries N]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from src.database.db_manager import DatabaseManager
+from src.database.migration_manager import MigrationManager
+
+
+def run(db: DatabaseManager, queries: int) -> float:
+    """Runs a mix of point selects and inserts and returns queries/sec"""
+    start = time.perf_counter()
+    for i in range(queries):
+        if i % 10 == 0:
+            db.insert("INSERT INTO categories (name) VALUES (?);", (f"Cat {i}",))
+        else:
+            db.select_one("SELECT id, name FROM categories WHERE id = ?;", (1,))
+    return queries / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = str(Path(tmp) / "bench.db")
+        MigrationManager(DatabaseManager(db_file)).apply_all_pending()
+
+        per_call = run(DatabaseManager(db_file, pooled=False), args.queries)
+        pooled = run(DatabaseManager(db_file), args.queries)
+        DatabaseManager.close_all_pools()
+
+    print(f"connect-per-call: {per_call:10.0f} queries/s")
+    print(f"pooled:           {pooled:10.0f} queries/s")
+    print(f"speedup:          {pooled / per_call:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
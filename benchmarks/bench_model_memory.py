@@ -0,0 +1,106 @@
+"""
+Measures bytes retained per loaded transaction with the __slots__ models.
+
+The "__dict__" row uses subclasses of the models that declare no
+__slots__, which brings the per-instance dict back. They still carry the
+slot storage, so the reported saving is a lower bound of the old layout.
+
+Usage:
+    python -m benchmarks.bench_model_memory [--rows N]
+"""
+
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from benchmarks.synthetic import create_ledger
+from src.database.db_manager import DatabaseManager
+from src.models.category import Category
+from src.models.money import Money
+from src.models.payment_method.credit import Credit
+from src.models.transaction.expense import Expense
+from src.models.transaction.income import Income
+from src.models.transaction.transaction_type import TransactionType
+
+QUERY = """
+    SELECT id, amount_cents, description, date, payment_method_id, category_id,
+           type
+    FROM transactions;
+"""
+
+
+class DictExpense(Expense):
+    pass
+
+
+class DictIncome(Income):
+    pass
+
+
+def load(db: DatabaseManager, expense_cls: type, income_cls: type) -> list:
+    """Builds one model per row, sharing payment methods and categories"""
+    payment_methods = {i: Credit(id=i, name=f"Conta {i}") for i in range(1, 7)}
+    categories = {i: Category(id=i, name=f"Categoria {i}") for i in range(1, 21)}
+    loaded = []
+    for row in db.select_iter(QUERY, row_format="tuple"):
+        id, cents, description, date, payment_id, category_id, type = row
+        amount = Money.from_cents(cents)
+        if type == TransactionType.EXPENSE:
+            loaded.append(
+                expense_cls(
+                    id=id,
+                    amount=amount,
+                    description=description,
+                    date=datetime.fromisoformat(date),
+                    payment_method=payment_methods[payment_id],
+                    category=categories[category_id],
+                )
+            )
+        else:
+            loaded.append(
+                income_cls(
+                    id=id,
+                    amount=amount,
+                    description=description,
+                    date=datetime.fromisoformat(date),
+                    payment_method=payment_methods[payment_id],
+                )
+            )
+    return loaded
+
+
+def retained_bytes(db: DatabaseManager, expense_cls: type, income_cls: type) -> int:
+    """Returns the memory still held by the loaded list"""
+    gc.collect()
+    tracemalloc.start()
+    loaded = load(db, expense_cls, income_cls)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loaded
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building a {args.rows:,}-row ledger...")
+        db = create_ledger(str(Path(tmp) / "bench.db"), args.rows)
+
+        before = retained_bytes(db, DictExpense, DictIncome) / args.rows
+        after = retained_bytes(db, Expense, Income) / args.rows
+
+        print(f"{'layout':<10} {'bytes/transaction':>18}")
+        print(f"{'__dict__':<10} {before:18.0f}")
+        print(f"{'__slots__':<10} {after:18.0f}")
+        print(f"saved {before - after:.0f} bytes ({1 - after / before:.0%})")
+
+        DatabaseManager.close_all_pools()
+
+
+if __name__ == "__main__":
+    main()
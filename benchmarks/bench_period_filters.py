@@ -0,0 +1,80 @@
+"""
+Compares strftime() month filters against sargable date ranges.
+
+Usage:
+    python -m benchmarks.bench_period_filters [--rows N] [--repeat N]
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from benchmarks.synthetic import create_ledger
+from src.database.db_manager import DatabaseManager
+from utils.period import Period
+
+# Month filter used by the repository before the Period facility
+STRFTIME_FILTER = "strftime('%m', date) = ? AND strftime('%Y', date) = ?"
+
+QUERIES = {
+    "total expenses": """
+        SELECT SUM(amount_cents) AS total FROM transactions
+        WHERE type = 'EXPENSE' AND {filter};
+    """,
+    "per category": """
+        SELECT category_id, SUM(amount_cents) AS total FROM transactions
+        WHERE type = 'EXPENSE' AND {filter}
+        GROUP BY category_id;
+    """,
+    "per payment method": """
+        SELECT payment_method_id, SUM(amount_cents) AS total FROM transactions
+        WHERE payment_method_id IS NOT NULL AND {filter}
+        GROUP BY payment_method_id;
+    """,
+    "count": "SELECT COUNT(id) AS total FROM transactions WHERE {filter};",
+}
+
+
+def timed(db: DatabaseManager, query: str, params: tuple, repeat: int) -> float:
+    """Returns the best run time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        db.select(query, params)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.now()
+    strftime_params = (f"{now.month:02d}", str(now.year))
+    range_filter, range_params = Period.current_month().sql("date")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building a {args.rows:,}-row ledger...")
+        db = create_ledger(str(Path(tmp) / "bench.db"), args.rows)
+
+        print(f"{'query':<20} {'strftime (ms)':>14} {'range (ms)':>11} {'speedup':>8}")
+        for name, template in QUERIES.items():
+            before = timed(
+                db,
+                template.format(filter=STRFTIME_FILTER),
+                strftime_params,
+                args.repeat,
+            )
+            after = timed(
+                db, template.format(filter=range_filter), range_params, args.repeat
+            )
+            print(f"{name:<20} {before:14.1f} {after:11.1f} {before / after:7.1f}x")
+
+        DatabaseManager.close_all_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Measures mixed read/write throughput under each PRAGMA profile.
+
+One writer thread inserts transactions (one commit each) while reader
+threads run the metrics aggregates, for a fixed time per profile.
+
+Usage:
+    python -m benchmarks.bench_pragma_profiles [--seconds N] [--readers N]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from benchmarks.synthetic import create_ledger
+from src.database.db_manager import DatabaseManager
+from src.database.pragma_profile import PragmaProfile
+from src.repositories.transaction_repository import TransactionRepository
+
+# What DatabaseManager used before profiles existed
+SQLITE_DEFAULTS = PragmaProfile(
+    "sqlite_defaults",
+    journal_mode="DELETE",
+    synchronous="FULL",
+    cache_size=-2_000,
+    mmap_size=0,
+    temp_store="DEFAULT",
+    busy_timeout=5_000,
+)
+
+PROFILES = [
+    SQLITE_DEFAULTS,
+    PragmaProfile.DESKTOP,
+    PragmaProfile.BULK_IMPORT,
+    PragmaProfile.TEST,
+]
+
+
+def run(db_file: str, profile: PragmaProfile, seconds: float, readers: int):
+    """Returns (writes/s, reads/s) for one profile"""
+    db = DatabaseManager(db_file, pool_size=readers + 1, profile=profile)
+    repo = TransactionRepository(db=db)
+    stop = threading.Event()
+    counts = {"writes": 0, "reads": 0}
+    lock = threading.Lock()
+
+    def writer():
+        while not stop.is_set():
+            db.insert(
+                """
+                INSERT INTO transactions (amount_cents, description, date, type,
+                                          category_id, payment_method_id)
+                VALUES (?, ?, ?, 'EXPENSE', 1, 1);
+                """,
+                (1250, "Benchmark", datetime.now().isoformat()),
+            )
+            with lock:
+                counts["writes"] += 1
+
+    def reader():
+        while not stop.is_set():
+            repo.get_total_expenses_for_current_month()
+            repo.count_month_transactions()
+            with lock:
+                counts["reads"] += 2
+
+    threads = [threading.Thread(target=writer)]
+    threads += [threading.Thread(target=reader) for _ in range(readers)]
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    db.close()
+    return counts["writes"] / seconds, counts["reads"] / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--readers", type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'profile':<16} {'writes/s':>10} {'reads/s':>10}")
+    for profile in PROFILES:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_file = str(Path(tmp) / "bench.db")
+            create_ledger(db_file, args.rows).close()
+            writes, reads = run(db_file, profile, args.seconds, args.readers)
+        print(f"{profile.name:<16} {writes:10.0f} {reads:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Compares description search with LIKE '%...%' against the FTS5 index.
+
+Queries are the successive prefixes typed into the search box, so the
+numbers show what search-as-you-type costs per keystroke.
+
+Usage:
+    python -m benchmarks.bench_search [--rows N] [--repeat N] [--budget-ms MS]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+from benchmarks.synthetic import create_ledger
+from src.database.db_manager import DatabaseManager
+from src.repositories.transaction_repository import TransactionRepository
+
+TYPED = ["m", "me", "mer", "merc", "mercado", "mercado c", "mercado central"]
+# Rare terms, where LIKE has to read the whole table to fill the page
+RARE = ["123456", "hortifruti 99999", "inexistente"]
+
+# What a search without the index would have to run
+LIKE_QUERY = """
+    SELECT id FROM transactions
+    WHERE description LIKE ?
+    ORDER BY date DESC
+    LIMIT ?;
+"""
+
+
+def timed(run: Callable[[], list], repeat: int) -> tuple[float, int]:
+    """Returns (best time in ms, number of results)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = run()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, len(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building a {args.rows:,}-row ledger...")
+        db = create_ledger(str(Path(tmp) / "bench.db"), args.rows)
+        repo = TransactionRepository(db)
+
+        print(f"{'typed':<18} {'LIKE (ms)':>10} {'FTS5 (ms)':>10} {'results':>8}")
+        over_budget = []
+        for text in TYPED + RARE:
+            like_ms, _ = timed(
+                lambda: db.select(LIKE_QUERY, (f"%{text}%", args.limit)), args.repeat
+            )
+            fts_ms, found = timed(
+                lambda: repo.search(text, limit=args.limit), args.repeat
+            )
+            if fts_ms > args.budget_ms:
+                over_budget.append(text)
+            print(f"{text!r:<18} {like_ms:10.2f} {fts_ms:10.2f} {found:8}")
+
+        if over_budget:
+            print(f"Over the {args.budget_ms:.0f} ms budget: {over_budget}")
+        DatabaseManager.close_all_pools()
+
+
+if __name__ == "__main__":
+    main()
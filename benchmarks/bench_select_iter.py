@@ -0,0 +1,70 @@
+"""
+Compares peak memory of select() against the streaming select_iter().
+
+Usage:
+    python -m benchmarks.bench_select_iter [--rows N] [--batch-size N]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Iterable
+from benchmarks.synthetic import create_ledger
+from src.database.db_manager import DatabaseManager
+
+QUERY = """
+    SELECT id, amount_cents, description, date, payment_method_id, category_id,
+           current_installment, total_installments, type
+    FROM transactions
+    ORDER BY date DESC;
+"""
+
+
+def measure(read: Callable[[], Iterable]) -> tuple[float, float, int]:
+    """Consumes the rows and returns (peak MiB, seconds, total in cents)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    total = sum(row[1] for row in read())
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / (1024 * 1024), elapsed, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Building a {args.rows:,}-row ledger...")
+        db = create_ledger(str(Path(tmp) / "bench.db"), args.rows)
+
+        modes = {
+            "select (dicts)": lambda: (
+                tuple(row.values()) for row in db.select(QUERY)
+            ),
+            "select_iter (Row)": lambda: db.select_iter(
+                QUERY, batch_size=args.batch_size
+            ),
+            "select_iter (tuple)": lambda: db.select_iter(
+                QUERY, batch_size=args.batch_size, row_format="tuple"
+            ),
+        }
+
+        print(f"{'mode':<22} {'peak (MiB)':>11} {'time (s)':>9}")
+        totals = set()
+        for name, read in modes.items():
+            peak, elapsed, total = measure(read)
+            totals.add(total)
+            print(f"{name:<22} {peak:11.1f} {elapsed:9.2f}")
+        assert len(totals) == 1, "modes returned different results"
+
+        DatabaseManager.close_all_pools()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Measures the cold import time of the application with `python -X importtime`.
+
+Each run starts a fresh interpreter that imports `main` (everything the app
+loads before drawing its first frame). Exits with status 1 when the median
+exceeds the budget or when a module that should load lazily shows up.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs N] [--budget-ms MS] [--top N]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+TARGET = "main"
+
+# Only needed by screens that are not visible at launch
+LAZY_MODULES = ("matplotlib", "tkcalendar", "numpy")
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def import_times() -> dict[str, tuple[int, int]]:
+    """Runs one cold import and returns {module: (self us, cumulative us)}"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {TARGET}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [import_times() for _ in range(args.runs)]
+    totals = [run[TARGET][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)
+    print(f"{'module':<48} {'self (ms)':>10} {'cumulative (ms)':>16}")
+    for name, (own, cumulative) in slowest[: args.top]:
+        print(f"{name:<48} {own / 1000:10.1f} {cumulative / 1000:16.1f}")
+    print()
+    print(
+        f"import {TARGET}: median {median:.1f} ms over {args.runs} runs "
+        f"(min {min(totals):.1f}, max {max(totals):.1f}), "
+        f"budget {args.budget_ms:.0f} ms"
+    )
+
+    failed = False
+    eager = sorted(
+        {name.split(".")[0] for run in runs for name in run} & set(LAZY_MODULES)
+    )
+    if eager:
+        print(f"FAIL: imported at startup: {', '.join(eager)}")
+        failed = True
+    if median > args.budget_ms:
+        print(f"FAIL: startup exceeds the budget by {median - args.budget_ms:.1f} ms")
+        failed = True
+    if failed:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
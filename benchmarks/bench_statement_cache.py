@@ -0,0 +1,85 @@
+"""
+Measures the parse/plan time the statement cache saves for each named query.
+
+Every query in the registry runs on a connection with cached_statements=0
+(compiled on every call) and on one with the default cache (compiled once).
+Parameters are all bound to NULL, so reads find nothing and writes touch
+no row: what is left is mostly the cost of preparing the statement.
+Everything runs inside a transaction that is rolled back at the end.
+
+Usage:
+    python -m benchmarks.bench_statement_cache [--calls N]
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from src.database.connection_pool import ConnectionPool
+from src.database.db_manager import DatabaseManager
+from src.database.migration_manager import MigrationManager
+from src.database.query_registry import QUERIES
+
+# Importing the repositories registers their queries
+import src.repositories.category_repository  # noqa: F401
+import src.repositories.payment_method_repository  # noqa: F401
+import src.repositories.transaction_repository  # noqa: F401
+
+
+def per_call_us(conn: sqlite3.Connection, sql: str, calls: int) -> float:
+    """Average time of one execution, in microseconds"""
+    params = (None,) * sql.count("?")
+    start = time.perf_counter()
+    for _ in range(calls):
+        try:
+            conn.execute(sql, params).fetchall()
+        except sqlite3.IntegrityError:
+            pass
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+def run_all(pool: ConnectionPool, calls: int) -> dict[str, float]:
+    """Times every registered query on one connection of `pool`"""
+    with pool.connection() as conn:
+        conn.execute("BEGIN;")
+        try:
+            return {
+                name: per_call_us(conn, sql, calls) for name, sql in QUERIES.items()
+            }
+        finally:
+            conn.rollback()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_file = str(Path(tmp) / "bench.db")
+        MigrationManager(DatabaseManager(db_file)).apply_all_pending()
+        DatabaseManager.close_all_pools()
+
+        pools = {
+            "uncached": ConnectionPool(db_file, pool_size=1, cached_statements=0),
+            "cached": ConnectionPool(db_file, pool_size=1),
+        }
+        times = {label: run_all(pool, args.calls) for label, pool in pools.items()}
+        for pool in pools.values():
+            pool.close()
+
+    print(f"{'query':<32} {'uncached (us)':>14} {'cached (us)':>12} {'saved (us)':>11}")
+    total_saved = 0.0
+    for name in QUERIES:
+        cold_us, warm_us = times["uncached"][name], times["cached"][name]
+        total_saved += cold_us - warm_us
+        print(f"{name:<32} {cold_us:14.1f} {warm_us:12.1f} {cold_us - warm_us:11.1f}")
+    print(
+        f"{len(QUERIES)} queries, {ConnectionPool.DEFAULT_CACHED_STATEMENTS} "
+        f"cached statements: {total_saved:.1f} us saved per call of each"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Builds synthetic ledgers shared by the benchmarks"""
+
+import random
+import sqlite3
+from datetime import datetime, timedelta
+from src.database.db_manager import DatabaseManager
+from src.database.migration_manager import MigrationManager
+
+# Words combined into descriptions, so text search has realistic selectivity
+MERCHANTS = [
+    "Mercado",
+    "Padaria",
+    "Farmácia",
+    "Posto",
+    "Restaurante",
+    "Café",
+    "Livraria",
+    "Academia",
+    "Cinema",
+    "Uber",
+    "Aluguel",
+    "Condomínio",
+    "Energia",
+    "Internet",
+    "Celular",
+    "Salário",
+    "Freelance",
+    "Pet Shop",
+    "Hortifruti",
+    "Açougue",
+    "Lanchonete",
+    "Pizzaria",
+    "Sorveteria",
+    "Papelaria",
+    "Ótica",
+    "Barbearia",
+    "Lavanderia",
+    "Estacionamento",
+]
+PLACES = [
+    "Central",
+    "do Bairro",
+    "São João",
+    "Boa Vista",
+    "Jardim",
+    "Santa Clara",
+    "Primavera",
+    "Aurora",
+    "Horizonte",
+    "Vila Nova",
+    "Esperança",
+    "Bela Vista",
+]
+
+
+def create_ledger(
+    db_file: str, rows: int, days: int = 5 * 365, seed: int = 42
+) -> DatabaseManager:
+    """
+    Creates a migrated database with `rows` random transactions spread over
+    the last `days` days, 20 categories and 6 payment methods.
+    """
+    db = DatabaseManager(db_file)
+    MigrationManager(db).apply_all_pending()
+
+    rng = random.Random(seed)
+    # Separate stream: descriptions do not shift the other random columns
+    words = random.Random(seed + 1)
+    now = datetime.now()
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.executemany(
+            "INSERT INTO categories (name) VALUES (?);",
+            [(f"Categoria {i}",) for i in range(1, 21)],
+        )
+        conn.executemany(
+            """
+            INSERT INTO payment_methods
+                (name, type, balance_cents, credit_limit_cents)
+            VALUES (?, ?, ?, ?);
+            """,
+            [
+                (f"Conta {i}", "CREDIT" if i % 2 else "DEBIT", 0, 100_000_000)
+                for i in range(1, 7)
+            ],
+        )
+
+        def generate():
+            for i in range(rows):
+                expense = rng.random() < 0.8
+                yield (
+                    round(rng.uniform(1, 500) * 100),
+                    f"{words.choice(MERCHANTS)} {words.choice(PLACES)} {i}",
+                    (now - timedelta(seconds=rng.randrange(days * 86400))).isoformat(),
+                    "EXPENSE" if expense else "INCOME",
+                    rng.randint(1, 20) if expense else None,
+                    rng.randint(1, 6),
+                )
+
+        conn.executemany(
+            """
+            INSERT INTO transactions (
+                amount_cents, description, date, type, category_id,
+                payment_method_id
+            ) VALUES (?, ?, ?, ?, ?, ?);
+            """,
+            generate(),
+        )
+        conn.commit()
+        conn.execute("ANALYZE;")
+    finally:
+        conn.close()
+    return db
@@ -1,5 +1,9 @@
+from src.container import ServiceContainer
+from src.database.migration_manager import MigrationManager
 from views.main_window import MainWindow
 
 if __name__ == "__main__":
-    app = MainWindow()
+    container = ServiceContainer.default()
+    MigrationManager(container.db).apply_all_pending()
+    app = MainWindow(container)
     app.mainloop()
@@ -5,6 +5,7 @@ Script to manage the system's migrations
 
 import argparse
 from src.database.migration_manager import MigrationManager
+from src.repositories.monthly_aggregate_repository import MonthlyAggregateRepository
 
 
 def main():
@@ -25,6 +26,16 @@ def main():
         "--down", type=str, metavar="MIGRATION", help="Reverts an specific migration"
     )
     group.add_argument("--status", action="store_true", help="Shows migrations status")
+    group.add_argument(
+        "--rebuild-aggregates",
+        action="store_true",
+        help="Recomputes the monthly aggregates from the transactions table",
+    )
+    group.add_argument(
+        "--check-aggregates",
+        action="store_true",
+        help="Compares the monthly aggregates against the transactions table",
+    )
 
     args = parser.parse_args()
 
@@ -40,6 +51,26 @@ def main():
         print("\n=== Migrations status ===")
         print("Applied migrations:", manager.__get_applied_migrations())
         print("Pending migrations:", manager.__get_pending_migrations())
+    elif args.rebuild_aggregates:
+        if MonthlyAggregateRepository().rebuild():
+            print("✅ Monthly aggregates rebuilt")
+        else:
+            print("❌ Failed to rebuild monthly aggregates")
+    elif args.check_aggregates:
+        mismatches = MonthlyAggregateRepository().check_consistency()
+        for row in mismatches:
+            print(
+                f"{row['year_month']} {row['type']} "
+                f"category={row['category_id']} "
+                f"payment_method={row['payment_method_id']}: "
+                f"aggregated {row['total_cents']} ({row['count']}), "
+                f"raw {row['raw_total_cents']} ({row['raw_count']})"
+            )
+        print(
+            "✅ Monthly aggregates are consistent"
+            if not mismatches
+            else f"❌ {len(mismatches)} inconsistent monthly aggregates"
+        )
     else:
         parser.print_help()
 
@@ -0,0 +1,231 @@
+from datetime import date
+from typing import Optional
+import numpy as np
+from src.database.db_manager import DatabaseManager
+from src.models.transaction.transaction_type import TransactionType
+from utils.period import Period
+
+# date(1970, 1, 1).toordinal(): desloca ordinais para dias desde a época Unix
+_EPOCH_ORDINAL = 719_163
+
+# julianday('0001-01-01') é 1721425.5 e o ordinal desse dia é 1
+_JULIAN_OFFSET = 1_721_424.5
+
+
+class TransactionFrame:
+    """
+    Visão colunar das transações em arrays NumPy, para métricas.
+
+    Cada transação ocupa uma posição nas colunas ids, dates (ordinal do dia),
+    amounts (centavos), types (código em TYPE_CODES), category_ids e
+    payment_method_ids (0 quando ausentes). As linhas ficam ordenadas por
+    data, o que permite recortar períodos com busca binária.
+    """
+
+    __slots__ = (
+        "ids",
+        "dates",
+        "amounts",
+        "types",
+        "category_ids",
+        "payment_method_ids",
+    )
+
+    TYPE_CODES = {TransactionType.INCOME: 0, TransactionType.EXPENSE: 1}
+
+    COLUMNS = __slots__
+
+    # Colunas aceitas como chave de agrupamento
+    GROUP_KEYS = ("types", "category_ids", "payment_method_ids", "dates")
+
+    BUCKETS = ("day", "week", "month", "year")
+
+    _QUERY = f"""
+        SELECT
+            id,
+            CAST(julianday(substr(date, 1, 10)) - {_JULIAN_OFFSET} AS INTEGER),
+            amount_cents,
+            CASE type WHEN '{TransactionType.EXPENSE}' THEN 1 ELSE 0 END,
+            COALESCE(category_id, 0),
+            COALESCE(payment_method_id, 0)
+        FROM transactions
+        {{where}}
+        ORDER BY date, id;
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        dates: np.ndarray,
+        amounts: np.ndarray,
+        types: np.ndarray,
+        category_ids: np.ndarray,
+        payment_method_ids: np.ndarray,
+    ):
+        """
+        Args:
+            ids: IDs das transações
+            dates: Datas como ordinais (date.toordinal()), em ordem crescente
+            amounts: Valores em centavos
+            types: Códigos de tipo (veja TYPE_CODES)
+            category_ids: IDs das categorias (0 sem categoria)
+            payment_method_ids: IDs dos métodos de pagamento (0 sem método)
+        """
+        columns = (ids, dates, amounts, types, category_ids, payment_method_ids)
+        if len({len(column) for column in columns}) > 1:
+            raise ValueError("All TransactionFrame columns must have the same length")
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.dates = np.asarray(dates, dtype=np.int64)
+        self.amounts = np.asarray(amounts, dtype=np.int64)
+        self.types = np.asarray(types, dtype=np.int8)
+        self.category_ids = np.asarray(category_ids, dtype=np.int64)
+        self.payment_method_ids = np.asarray(payment_method_ids, dtype=np.int64)
+
+    @classmethod
+    def empty(cls) -> "TransactionFrame":
+        """Frame sem transações"""
+        return cls(*(np.empty(0, dtype=np.int64) for _ in cls.COLUMNS))
+
+    @classmethod
+    def load(
+        cls,
+        db: Optional[DatabaseManager] = None,
+        period: Optional[Period] = None,
+        batch_size: int = 50_000,
+    ) -> "TransactionFrame":
+        """
+        Carrega as transações direto do SQLite para as colunas.
+
+        As conversões (data para ordinal, valor para centavos, tipo para
+        código) são feitas pelo próprio SQLite, então cada lote de linhas
+        vira um único array inteiro sem passar por objetos Transaction.
+
+        Args:
+            db: Gerenciador de banco de dados (usa o padrão se omitido)
+            period: Período opcional; sem ele todo o histórico é carregado
+            batch_size: Quantidade de linhas convertidas por vez
+        """
+        db = db or DatabaseManager()
+        where, params = "", ()
+        if period is not None:
+            condition, params = period.sql("date")
+            where = f"WHERE {condition}"
+
+        rows = db.select_iter(
+            cls._QUERY.format(where=where),
+            params,
+            batch_size=batch_size,
+            row_format="tuple",
+        )
+        chunks = []
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                chunks.append(np.array(batch, dtype=np.int64))
+                batch = []
+        if batch:
+            chunks.append(np.array(batch, dtype=np.int64))
+        if not chunks:
+            return cls.empty()
+
+        table = np.concatenate(chunks)
+        return cls(*(table[:, i] for i in range(len(cls.COLUMNS))))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def total(self) -> int:
+        """Soma dos valores, em centavos"""
+        return int(self.amounts.sum())
+
+    def take(self, selector: np.ndarray | slice) -> "TransactionFrame":
+        """Novo frame com as linhas escolhidas por máscara, índices ou fatia"""
+        return TransactionFrame(
+            *(getattr(self, column)[selector] for column in self.COLUMNS)
+        )
+
+    def of_type(self, transaction_type: str) -> "TransactionFrame":
+        """Filtra por tipo de transação (INCOME ou EXPENSE)"""
+        if transaction_type not in self.TYPE_CODES:
+            raise ValueError(f"Unknown transaction type: {transaction_type}")
+        return self.take(self.types == self.TYPE_CODES[transaction_type])
+
+    def expenses(self) -> "TransactionFrame":
+        return self.of_type(TransactionType.EXPENSE)
+
+    def incomes(self) -> "TransactionFrame":
+        return self.of_type(TransactionType.INCOME)
+
+    def within(self, period: Period) -> "TransactionFrame":
+        """Recorta o período [start, end) com busca binária nas datas"""
+        start, end = np.searchsorted(
+            self.dates, (period.start.toordinal(), period.end.toordinal())
+        )
+        return self.take(slice(start, end))
+
+    def bucket(self, unit: str = "month") -> np.ndarray:
+        """
+        Agrupa as datas em períodos, de forma vetorizada.
+
+        Args:
+            unit: "day", "week", "month" ou "year"
+
+        Returns:
+            Array datetime64 com o início do período de cada transação
+            (semanas começam na segunda-feira)
+        """
+        if unit not in self.BUCKETS:
+            raise ValueError(f"Unknown bucket unit: {unit}")
+        days = self.dates - _EPOCH_ORDINAL
+        if unit == "week":
+            # 1970-01-01 foi uma quinta-feira, três dias após a segunda
+            days = days - (days + 3) % 7
+        days = days.astype("datetime64[D]")
+        if unit in ("day", "week"):
+            return days
+        return days.astype("datetime64[M]" if unit == "month" else "datetime64[Y]")
+
+    def __keys(self, by: str | np.ndarray) -> np.ndarray:
+        """Resolve a chave de agrupamento: nome de coluna ou array próprio"""
+        if isinstance(by, str):
+            if by not in self.GROUP_KEYS:
+                raise ValueError(f"Cannot group by: {by}")
+            return getattr(self, by)
+        keys = np.asarray(by)
+        if len(keys) != len(self):
+            raise ValueError("Group keys must have one entry per transaction")
+        return keys
+
+    def group_sum(self, by: str | np.ndarray) -> dict[int | date, int]:
+        """
+        Soma os valores (em centavos) por chave.
+
+        Args:
+            by: Nome de coluna em GROUP_KEYS ou array de chaves, como o
+                retornado por bucket()
+
+        Returns:
+            Dicionário {chave: total em centavos}, em ordem crescente de chave;
+            chaves de bucket() viram datetime.date
+        """
+        keys, inverse = np.unique(self.__keys(by), return_inverse=True)
+        # bincount soma em float64, exato para totais abaixo de 2**53 centavos
+        totals = np.rint(
+            np.bincount(inverse, weights=self.amounts, minlength=len(keys))
+        ).astype(np.int64)
+        return {key.item(): int(total) for key, total in zip(keys, totals)}
+
+    def group_count(self, by: str | np.ndarray) -> dict[int | date, int]:
+        """
+        Conta as transações por chave.
+
+        Returns:
+            Dicionário {chave: quantidade}, em ordem crescente de chave
+        """
+        keys, counts = np.unique(self.__keys(by), return_counts=True)
+        return {key.item(): int(count) for key, count in zip(keys, counts)}
+
+    def __repr__(self) -> str:
+        return f"TransactionFrame({len(self)} transactions)"
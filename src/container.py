@@ -0,0 +1,207 @@
+import threading
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Optional, TypeVar
+from src.database.data_version_watcher import DataVersionWatcher
+from src.database.db_manager import DatabaseManager
+from src.database.pragma_profile import PragmaProfile
+from src.database.query_instrumentation import QueryInstrumentation
+from src.repositories.category_repository import CategoryRepository
+from src.repositories.monthly_aggregate_repository import MonthlyAggregateRepository
+from src.repositories.payment_method_repository import PaymentMethodRepository
+from src.repositories.repository_cache import RepositoryCache
+from src.repositories.transaction_repository import TransactionRepository
+from src.services.category_service import CategoryService
+from src.services.payment_method_service import PaymentMethodService
+from src.services.transaction_service import TransactionService
+
+T = TypeVar("T")
+
+
+class ServiceContainer:
+    """
+    Grafo único de dependências da aplicação.
+
+    Cada componente (gerenciador de banco, repositórios e serviços) é criado
+    uma única vez, na primeira vez em que é pedido, e compartilhado por
+    todas as telas. A criação é protegida por lock, então threads diferentes
+    sempre recebem a mesma instância.
+    """
+
+    _default: Optional["ServiceContainer"] = None
+    _default_lock = threading.Lock()
+
+    def __init__(
+        self,
+        db_file: Optional[str] = None,
+        profile: Optional[PragmaProfile | str] = None,
+        pool_size: int = 5,
+        cache_size: int = 256,
+        cached_statements: Optional[int] = None,
+        instrumentation: Optional[QueryInstrumentation] = None,
+    ):
+        """
+        Args:
+            db_file: Arquivo do banco (usa o padrão do DatabaseManager se omitido)
+            profile: Perfil de PRAGMAs das conexões
+            pool_size: Tamanho do pool de conexões
+            cache_size: Entradas por cache de repositório (0 desativa os caches)
+            cached_statements: Instruções compiladas mantidas por conexão
+                               (padrão do ConnectionPool)
+            instrumentation: Medição das consultas (None desativa)
+        """
+        self._db_file = db_file
+        self._profile = profile
+        self._pool_size = pool_size
+        self._cache_size = cache_size
+        self._cached_statements = cached_statements
+        self._instrumentation = instrumentation
+        self._instances: dict[str, object] = {}
+        # Reentrante: a fábrica de um serviço pede seus repositórios
+        self._lock = threading.RLock()
+
+    @classmethod
+    def default(cls) -> "ServiceContainer":
+        """
+        Container compartilhado pelo processo, criado no primeiro uso.
+
+        A instrumentação das consultas é ligada pelas variáveis de ambiente
+        lidas em QueryInstrumentation.from_environment().
+        """
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls(
+                        instrumentation=QueryInstrumentation.from_environment()
+                    )
+        return cls._default
+
+    @classmethod
+    def set_default(cls, container: Optional["ServiceContainer"]) -> None:
+        """Define (ou limpa, com None) o container compartilhado"""
+        with cls._default_lock:
+            cls._default = container
+
+    def _get(self, name: str, factory: Callable[[], T]) -> T:
+        """Retorna a instância `name`, criando-a uma única vez"""
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = factory()
+                    self._instances[name] = instance
+        return instance
+
+    # --- Banco de dados ---
+    @property
+    def db(self) -> DatabaseManager:
+        def build() -> DatabaseManager:
+            kwargs = {
+                "pool_size": self._pool_size,
+                "profile": self._profile,
+                "cached_statements": self._cached_statements,
+                "instrumentation": self._instrumentation,
+            }
+            if self._db_file:
+                kwargs["db_file"] = self._db_file
+            return DatabaseManager(**kwargs)
+
+        return self._get("db", build)
+
+    @property
+    def instrumentation(self) -> Optional[QueryInstrumentation]:
+        return self._instrumentation
+
+    def action(self, name: str) -> ContextManager:
+        """
+        Agrupa as consultas feitas no bloco sob a ação de interface `name`.
+
+        Sem instrumentação, não faz nada.
+        """
+        if self._instrumentation is None:
+            return nullcontext()
+        return self._instrumentation.action(name)
+
+    # --- Caches ---
+    def _build_cache(self) -> Optional[RepositoryCache]:
+        """Cache de leitura que também percebe gravações de outros processos"""
+        if self._cache_size <= 0:
+            return None
+        watcher = None
+        if self.db.db_file != ":memory:":
+            # Gravações feitas pelo pool deste processo não limpam o cache
+            watcher = DataVersionWatcher(self.db.db_file, self.db.pool)
+        return RepositoryCache(self._cache_size, watcher)
+
+    @property
+    def category_cache(self) -> Optional[RepositoryCache]:
+        return self._get("category_cache", self._build_cache)
+
+    @property
+    def payment_method_cache(self) -> Optional[RepositoryCache]:
+        return self._get("payment_method_cache", self._build_cache)
+
+    # --- Repositórios ---
+    @property
+    def category_repository(self) -> CategoryRepository:
+        return self._get(
+            "category_repository",
+            lambda: CategoryRepository(self.db, cache=self.category_cache),
+        )
+
+    @property
+    def payment_method_repository(self) -> PaymentMethodRepository:
+        return self._get(
+            "payment_method_repository",
+            lambda: PaymentMethodRepository(self.db, cache=self.payment_method_cache),
+        )
+
+    @property
+    def transaction_repository(self) -> TransactionRepository:
+        return self._get(
+            "transaction_repository", lambda: TransactionRepository(self.db)
+        )
+
+    @property
+    def monthly_aggregate_repository(self) -> MonthlyAggregateRepository:
+        return self._get(
+            "monthly_aggregate_repository",
+            lambda: MonthlyAggregateRepository(self.db),
+        )
+
+    # --- Serviços ---
+    @property
+    def category_service(self) -> CategoryService:
+        return self._get(
+            "category_service",
+            lambda: CategoryService(repo=self.category_repository),
+        )
+
+    @property
+    def payment_method_service(self) -> PaymentMethodService:
+        return self._get(
+            "payment_method_service",
+            lambda: PaymentMethodService(repo=self.payment_method_repository),
+        )
+
+    @property
+    def transaction_service(self) -> TransactionService:
+        return self._get(
+            "transaction_service",
+            lambda: TransactionService(
+                repo=self.transaction_repository,
+                payment_service=self.payment_method_service,
+                category_service=self.category_service,
+            ),
+        )
+
+    def close(self) -> None:
+        """Fecha o pool de conexões e descarta as instâncias criadas"""
+        with self._lock:
+            instances = dict(self._instances)
+            self._instances.clear()
+        for name in ("category_cache", "payment_method_cache"):
+            if instances.get(name) is not None:
+                instances[name].close()
+        if instances.get("db") is not None:
+            instances["db"].close()
@@ -0,0 +1,226 @@
+import sqlite3
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from queue import Empty, LifoQueue
+from typing import Iterator, Optional
+from src.database.pragma_profile import PragmaProfile
+
+
+class PoolClosedError(sqlite3.Error):
+    """Raised when a connection is requested from a closed pool"""
+
+
+class PoolTimeoutError(sqlite3.Error):
+    """Raised when no connection becomes available in time"""
+
+
+class ConnectionPool:
+    """
+    Keeps a bounded set of open SQLite connections for one database file.
+
+    A thread holds the same connection for nested acquisitions, so a
+    repository call made inside another one reuses the outer connection.
+    Idle connections are health checked before being handed out again.
+    Since connections live as long as the pool, their statement caches
+    stay warm: each query shape is compiled once per connection.
+    """
+
+    # Compiled statements kept per connection: every registered query plus
+    # room for the shapes generated by TransactionFilter
+    DEFAULT_CACHED_STATEMENTS = 256
+
+    def __init__(
+        self,
+        db_file: str,
+        pool_size: int = 5,
+        timeout: float = 10.0,
+        health_check_interval: float = 30.0,
+        profile: Optional[PragmaProfile | str] = None,
+        cached_statements: Optional[int] = None,
+    ):
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if cached_statements is None:
+            cached_statements = self.DEFAULT_CACHED_STATEMENTS
+        if cached_statements < 0:
+            raise ValueError("cached_statements cannot be negative")
+        self._db_file = db_file
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+        self._profile = PragmaProfile.get(profile)
+        self._cached_statements = cached_statements
+        self._idle: LifoQueue = LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._all: set[sqlite3.Connection] = set()
+        self._last_used: dict[int, float] = {}
+        self._local = threading.local()
+        self._closed = False
+        # Watchers told about each commit made through the pool
+        self._commit_watchers: list = []
+
+    @property
+    def db_file(self) -> str:
+        return self._db_file
+
+    @property
+    def size(self) -> int:
+        """Returns the number of connections currently open"""
+        with self._lock:
+            return len(self._all)
+
+    @property
+    def profile(self) -> PragmaProfile:
+        return self._profile
+
+    @property
+    def cached_statements(self) -> int:
+        """Size of each connection's compiled statement cache"""
+        return self._cached_statements
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _connect(self) -> sqlite3.Connection:
+        """Opens and configures a new connection"""
+        conn = sqlite3.connect(
+            self._db_file,
+            check_same_thread=False,
+            cached_statements=self._cached_statements,
+        )
+        conn.execute("PRAGMA foreign_keys = ON;")
+        self._profile.apply(conn)
+        conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._all.add(conn)
+        return conn
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        """Closes a connection and forgets about it"""
+        with self._lock:
+            self._all.discard(conn)
+            self._last_used.pop(id(conn), None)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def _is_healthy(self, conn: sqlite3.Connection) -> bool:
+        """Checks that an idle connection is still usable"""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            last_used = self._last_used.get(id(conn), 0.0)
+            if time.monotonic() - last_used >= self._health_check_interval:
+                conn.execute("SELECT 1;").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def _checkout(self) -> sqlite3.Connection:
+        """Takes an idle connection or opens a new one within the pool size"""
+        if self._closed:
+            raise PoolClosedError("Connection pool is closed")
+        if not self._slots.acquire(timeout=self._timeout):
+            raise PoolTimeoutError(
+                f"No connection available after {self._timeout}s "
+                f"(pool_size={self._pool_size})"
+            )
+        try:
+            while True:
+                try:
+                    conn = self._idle.get_nowait()
+                except Empty:
+                    return self._connect()
+                if self._is_healthy(conn):
+                    return conn
+                self._discard(conn)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _checkin(self, conn: sqlite3.Connection, broken: bool) -> None:
+        """Returns a connection to the idle set"""
+        try:
+            if broken or self._closed:
+                self._discard(conn)
+                return
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                self._discard(conn)
+                return
+            self._last_used[id(conn)] = time.monotonic()
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Lends a connection to the current thread.
+
+        Nested calls on the same thread get the connection already held.
+        """
+        held = getattr(self._local, "conn", None)
+        if held is not None:
+            self._local.depth += 1
+            try:
+                yield held
+            finally:
+                self._local.depth -= 1
+            return
+
+        conn = self._checkout()
+        self._local.conn = conn
+        self._local.depth = 1
+        broken = False
+        try:
+            yield conn
+        except (sqlite3.InterfaceError, sqlite3.ProgrammingError):
+            broken = True
+            raise
+        finally:
+            self._local.conn = None
+            self._local.depth = 0
+            self._checkin(conn, broken)
+
+    def watch_commits(self, watcher) -> None:
+        """Wraps every commit made through commit() in watcher.own_commit()"""
+        with self._lock:
+            self._commit_watchers = [*self._commit_watchers, watcher]
+
+    def unwatch_commits(self, watcher) -> None:
+        with self._lock:
+            self._commit_watchers = [
+                w for w in self._commit_watchers if w is not watcher
+            ]
+
+    def commit(self, conn: sqlite3.Connection) -> None:
+        """Commits a pooled connection, letting the watchers record it"""
+        watchers = self._commit_watchers
+        if not watchers or not conn.in_transaction:
+            conn.commit()
+            return
+        with ExitStack() as stack:
+            for watcher in watchers:
+                stack.enter_context(watcher.own_commit())
+            conn.commit()
+
+    def close(self) -> None:
+        """Closes every connection and refuses new checkouts"""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except Empty:
+                break
+            self._discard(conn)
+        with self._lock:
+            remaining = list(self._all)
+        for conn in remaining:
+            self._discard(conn)
@@ -0,0 +1,72 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from src.database.connection_pool import ConnectionPool
+
+
+class DataVersionWatcher:
+    """
+    Detects commits made to a database by other processes.
+
+    Keeps one dedicated connection and polls PRAGMA data_version on it. The
+    value changes whenever any other connection commits, so commits made
+    through this process's pool are recorded as they happen (see
+    own_commit) and do not count as changes.
+    """
+
+    def __init__(self, db_file: str, pool: Optional[ConnectionPool] = None):
+        """
+        Args:
+            db_file: Path of the SQLite database
+            pool: Pool whose commits are this process's own (None counts
+                  every commit as external)
+        """
+        self._db_file = db_file
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._version = self._read()
+        # An external commit seen while recording one of ours
+        self._pending = False
+        self._pool = pool
+        if pool is not None:
+            pool.watch_commits(self)
+
+    def _read(self) -> int:
+        return self._conn.execute("PRAGMA data_version;").fetchone()[0]
+
+    @property
+    def db_file(self) -> str:
+        return self._db_file
+
+    @contextmanager
+    def own_commit(self) -> Iterator[None]:
+        """
+        Wraps a commit of this process so it is not reported as external.
+
+        Entered while the committing connection still holds the write
+        lock, so a version change found here can only come from another
+        process; the version read after the commit becomes the baseline.
+        """
+        with self._lock:
+            if self._read() != self._version:
+                self._pending = True
+            yield
+            self._version = self._read()
+
+    def changed(self) -> bool:
+        """Returns True once for each batch of external commits since the last call"""
+        with self._lock:
+            version = self._read()
+            if version == self._version and not self._pending:
+                return False
+            self._version = version
+            self._pending = False
+            return True
+
+    def close(self) -> None:
+        """Stops watching the pool and closes the dedicated connection"""
+        if self._pool is not None:
+            self._pool.unwatch_commits(self)
+        with self._lock:
+            self._conn.close()
@@ -1,18 +1,208 @@
+import os
 import sqlite3
-from typing import Optional
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+from src.database.connection_pool import ConnectionPool
+from src.database.pragma_profile import PragmaProfile
+from src.database.query_instrumentation import NULL_PROBE, QueryInstrumentation
 
 
 class DatabaseManager:
-    def __init__(self, db_file="src/database/expense-tracker.db"):
+    _pools: dict[str, ConnectionPool] = {}
+    _pools_lock = threading.Lock()
+    # Unit of work active on each thread, by database file
+    _units = threading.local()
+
+    def __init__(
+        self,
+        db_file="src/database/expense-tracker.db",
+        pooled: bool = True,
+        pool_size: int = 5,
+        profile: Optional[PragmaProfile | str] = None,
+        cached_statements: Optional[int] = None,
+        instrumentation: Optional[QueryInstrumentation] = None,
+    ):
+        """
+        Args:
+            db_file: Path of the SQLite database
+            pooled: Keeps connections open in a shared pool; False opens a
+                    new connection per call
+            pool_size: Maximum number of pooled connections
+            profile: PRAGMA profile, or its name, applied to each pooled
+                     connection ("desktop" by default). The first manager
+                     to open a database decides the profile of its pool.
+            cached_statements: Compiled statements kept per connection
+                               (ConnectionPool.DEFAULT_CACHED_STATEMENTS by
+                               default; 0 disables the cache). Like the
+                               profile, decided by the first manager.
+            instrumentation: Receives the timing, row count and caller of
+                             every statement (None disables it)
+        """
         self._db_file = db_file
+        self._pooled = pooled
+        self._pool_size = pool_size
+        self._profile = PragmaProfile.get(profile)
+        self._cached_statements = cached_statements
+        self._instrumentation = instrumentation
+
+    @staticmethod
+    def _key_for(db_file: str) -> str:
+        """Identifies a database file regardless of how its path was written"""
+        return db_file if db_file == ":memory:" else os.path.abspath(db_file)
+
+    @classmethod
+    def _pool_for(
+        cls,
+        db_file: str,
+        pool_size: int,
+        profile: PragmaProfile,
+        cached_statements: Optional[int] = None,
+    ) -> ConnectionPool:
+        """Returns the pool shared by every manager of the same database file"""
+        key = cls._key_for(db_file)
+        with cls._pools_lock:
+            pool = cls._pools.get(key)
+            if pool is None or pool.closed:
+                pool = ConnectionPool(
+                    db_file,
+                    pool_size=pool_size,
+                    profile=profile,
+                    cached_statements=cached_statements,
+                )
+                cls._pools[key] = pool
+            return pool
+
+    @classmethod
+    def close_all_pools(cls) -> None:
+        """Closes every pooled connection (used on application shutdown)"""
+        with cls._pools_lock:
+            pools = list(cls._pools.values())
+            cls._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    @property
+    def db_file(self) -> str:
+        """Path of the SQLite database"""
+        return self._db_file
+
+    @property
+    def pool(self) -> Optional[ConnectionPool]:
+        """Returns the shared pool, or None in connect-per-call mode"""
+        if not self._pooled:
+            return None
+        return self._pool_for(
+            self._db_file, self._pool_size, self._profile, self._cached_statements
+        )
+
+    @property
+    def instrumentation(self) -> Optional[QueryInstrumentation]:
+        return self._instrumentation
+
+    def close(self) -> None:
+        """Closes the pool used by this manager"""
+        if self._pooled:
+            self.pool.close()
+
+    def __active_units(self) -> dict[str, sqlite3.Connection]:
+        if not hasattr(self._units, "connections"):
+            self._units.connections = {}
+        return self._units.connections
+
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the current thread is inside a unit of work on this database"""
+        return self._key_for(self._db_file) in self.__active_units()
 
-    def __get_connection(self):
-        """Returns a database connection"""
-        conn = sqlite3.connect(self._db_file)
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Runs every call made inside the block as one unit of work.
+
+        Opens a single BEGIN IMMEDIATE transaction that every manager of the
+        same database file joins on this thread, nested units included.
+        Commits once at the end, or rolls everything back if an error
+        escapes the block. Inside the unit, database errors are raised
+        instead of printed so they abort it.
+        """
+        units = self.__active_units()
+        key = self._key_for(self._db_file)
+        if key in units:
+            yield units[key]
+            return
+
+        with self.__open_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE;")
+            units[key] = conn
+            try:
+                yield conn
+                self.__commit(conn)
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                del units[key]
+
+    @contextmanager
+    def __open_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yields a pooled connection, or a new one in connect-per-call mode"""
+        if self._pooled:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+
+        conn = sqlite3.connect(
+            self._db_file,
+            cached_statements=(
+                ConnectionPool.DEFAULT_CACHED_STATEMENTS
+                if self._cached_statements is None
+                else self._cached_statements
+            ),
+        )
         conn.execute("PRAGMA foreign_keys = ON;")
         # Configure to return rows as dicts
         conn.row_factory = sqlite3.Row
-        return conn
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def __commit(self, conn: sqlite3.Connection) -> None:
+        """Commits through the pool, so its commit watchers can record it"""
+        if self._pooled:
+            self.pool.commit(conn)
+        else:
+            conn.commit()
+
+    @contextmanager
+    def __get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Yields a database connection, committing on success"""
+        unit = self.__active_units().get(self._key_for(self._db_file))
+        if unit is not None:
+            # The unit of work decides when to commit
+            yield unit
+            return
+
+        with self.__open_connection() as conn:
+            try:
+                yield conn
+                self.__commit(conn)
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def __measure(self, label: str, query: str):
+        """Probe that times the statement, or a no-op one when not instrumented"""
+        if self._instrumentation is None:
+            return NULL_PROBE
+        return self._instrumentation.probe(label, query)
+
+    def __handle_error(self, label: str, err: sqlite3.Error) -> None:
+        """Reports an error, re-raising it inside a unit of work"""
+        if self.in_transaction:
+            raise err
+        print(f"[{label} ERROR] {err}")
 
     def __get_columns(self, cursor: sqlite3.Cursor) -> list[str]:
         """Returns the cursor's columns names"""
@@ -22,72 +212,142 @@ class DatabaseManager:
 
     def insert(self, query: str, params: tuple) -> int | None:
         """Executes an insertion e returns the generated id"""
+        probe = self.__measure("INSERT", query)
         try:
-            with self.__get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
+            with probe, self.__get_connection() as conn:
+                cursor = conn.execute(query, params)
+                probe.rows = cursor.rowcount
                 return cursor.lastrowid
         except sqlite3.Error as err:
-            print(f"[INSERT ERROR] {err}")
+            self.__handle_error("INSERT", err)
             return None
 
+    def insert_many(self, query: str, params_seq: Iterable[tuple]) -> int:
+        """Executes an insertion for every params tuple and returns the rows count"""
+        return self.__run_many("INSERT", query, params_seq)
+
+    def execute_many(self, query: str, params_seq: Iterable[tuple]) -> int:
+        """
+        Executes an UPDATE or DELETE for every params tuple in a single
+        executemany and returns the affected rows count. Events and errors
+        are labelled with the statement's verb.
+        """
+        label = query.split(None, 1)[0].upper() if query.strip() else "EXECUTE"
+        return self.__run_many(label, query, params_seq)
+
+    def __run_many(self, label: str, query: str, params_seq: Iterable[tuple]) -> int:
+        probe = self.__measure(label, query)
+        try:
+            with probe, self.__get_connection() as conn:
+                cursor = conn.executemany(query, params_seq)
+                probe.rows = cursor.rowcount
+                return cursor.rowcount
+        except sqlite3.Error as err:
+            self.__handle_error(label, err)
+            return 0
+
     def select(self, query: str, params: tuple = ()) -> list[any]:
         """Executes a search and returns its results"""
+        probe = self.__measure("SELECT", query)
         try:
-            with self.__get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
+            with probe, self.__get_connection() as conn:
+                cursor = conn.execute(query, params)
                 columns = self.__get_columns(cursor=cursor)
-                return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                results = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                probe.rows = len(results)
+                return results
         except sqlite3.Error as err:
-            print(f"[SELECT ERROR] {err}")
+            self.__handle_error("SELECT", err)
             return []
 
-    def select_one(self, query: str, params: tuple = ()) -> Optional[dict[str, any]]:
-        """Executes a search and retruns only one result"""
+    def select_iter(
+        self,
+        query: str,
+        params: tuple = (),
+        batch_size: int = 500,
+        row_format: str = "row",
+    ) -> Iterator[sqlite3.Row | tuple]:
+        """
+        Executes a search and yields its rows lazily, batch_size at a time.
+
+        Rows come as sqlite3.Row (row_format="row") or plain tuples
+        (row_format="tuple"), without building a dict per row. The
+        connection stays checked out until the generator is exhausted or
+        closed, so consume it on the thread that created it. When
+        instrumented, the time recorded runs until the rows are consumed.
+        """
+        if row_format not in ("row", "tuple"):
+            raise ValueError(f"Invalid row_format: {row_format}")
+        probe = self.__measure("SELECT", query)
+        return self.__iter_rows(query, params, batch_size, row_format, probe)
+
+    def __iter_rows(
+        self, query: str, params: tuple, batch_size: int, row_format: str, probe
+    ) -> Iterator[sqlite3.Row | tuple]:
         try:
-            with self.__get_connection() as conn:
+            with probe, self.__get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.row_factory = sqlite3.Row if row_format == "row" else None
+                cursor.arraysize = batch_size
                 cursor.execute(query, params)
+                while True:
+                    rows = cursor.fetchmany()
+                    if not rows:
+                        break
+                    probe.rows += len(rows)
+                    yield from rows
+        except sqlite3.Error as err:
+            self.__handle_error("SELECT", err)
+
+    def select_one(self, query: str, params: tuple = ()) -> Optional[dict[str, any]]:
+        """Executes a search and retruns only one result"""
+        probe = self.__measure("SELECT", query)
+        try:
+            with probe, self.__get_connection() as conn:
+                cursor = conn.execute(query, params)
                 columns = self.__get_columns(cursor)
                 row = cursor.fetchone()
+                probe.rows = 1 if row else 0
                 return dict(zip(columns, row)) if row else None
         except sqlite3.Error as err:
-            print(f"[SELECT ERROR] {err}")
+            self.__handle_error("SELECT", err)
             return None
 
     def update(self, query: str, params: tuple) -> int:
         """Executes an update and returns the affected rows number"""
+        probe = self.__measure("UPDATE", query)
         try:
-            with self.__get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
+            with probe, self.__get_connection() as conn:
+                cursor = conn.execute(query, params)
+                probe.rows = cursor.rowcount
                 return cursor.rowcount
         except sqlite3.Error as err:
-            print(f"[UPDATE ERROR] {err}")
+            self.__handle_error("UPDATE", err)
             return 0
 
     def delete(self, query: str, params: tuple) -> int:
         """Executes an exclusion and returns the affected rows number"""
+        probe = self.__measure("DELETE", query)
         try:
-            with self.__get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                conn.commit()
+            with probe, self.__get_connection() as conn:
+                cursor = conn.execute(query, params)
+                probe.rows = cursor.rowcount
                 return cursor.rowcount
         except sqlite3.Error as err:
-            print(f"[DELETE ERROR] {err}")
+            self.__handle_error("DELETE", err)
             return 0
 
     def execute_script(self, script: str) -> bool:
         """Executes a SQL script with multiple commands"""
         try:
-            with self.__get_connection() as conn:
+            if self.in_transaction:
+                # executescript() would commit the unit of work halfway
+                raise sqlite3.ProgrammingError(
+                    "Scripts cannot run inside a unit of work"
+                )
+            with self.__measure("SCRIPT", script), self.__get_connection() as conn:
                 conn.executescript(script)
-                conn.commit()
                 return True
         except sqlite3.Error as err:
-            print(f"[SCRIPT ERROR] {err}")
+            self.__handle_error("SCRIPT", err)
             return False
@@ -26,7 +26,7 @@ class MigrationManager:
     def __get_applied_migrations(self) -> list[str]:
         """Returns the migrations already applied"""
         results = self._db.select("SELECT name FROM migrations ORDER BY id")
-        return [row[0] for row in results]
+        return [row["name"] for row in results]
 
     def __get_pending_migrations(self) -> list[str]:
         """Returns pending migrations"""
@@ -0,0 +1,13 @@
+def up():
+    """Creates the index used by the keyset pagination of transactions"""
+    return """
+    CREATE INDEX IF NOT EXISTS idx_transactions_date_id
+        ON transactions (date, id);
+    """
+
+
+def down():
+    """Removes the pagination index"""
+    return """
+        DROP INDEX IF EXISTS idx_transactions_date_id;
+    """
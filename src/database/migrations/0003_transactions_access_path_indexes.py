@@ -0,0 +1,24 @@
+def up():
+    """Creates the indexes used by the transaction aggregate queries"""
+    return """
+    -- Totais por tipo em um intervalo de datas
+    CREATE INDEX IF NOT EXISTS idx_transactions_type_date
+        ON transactions (type, date);
+
+    -- Totais e contagens por categoria
+    CREATE INDEX IF NOT EXISTS idx_transactions_category_type_date
+        ON transactions (category_id, type, date);
+
+    -- Totais por método de pagamento
+    CREATE INDEX IF NOT EXISTS idx_transactions_payment_method_date
+        ON transactions (payment_method_id, date);
+    """
+
+
+def down():
+    """Removes the aggregate indexes"""
+    return """
+        DROP INDEX IF EXISTS idx_transactions_payment_method_date;
+        DROP INDEX IF EXISTS idx_transactions_category_type_date;
+        DROP INDEX IF EXISTS idx_transactions_type_date;
+    """
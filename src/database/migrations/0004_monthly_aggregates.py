@@ -0,0 +1,98 @@
+def up():
+    """
+    Creates the monthly_aggregates table, kept up to date by triggers on
+    transactions, and fills it with the existing rows.
+
+    Missing categories and payment methods are stored as 0 so they take
+    part in the primary key.
+    """
+    return """
+    CREATE TABLE monthly_aggregates (
+        year_month TEXT NOT NULL,
+        type TEXT NOT NULL,
+        category_id INTEGER NOT NULL DEFAULT 0,
+        payment_method_id INTEGER NOT NULL DEFAULT 0,
+        total FLOAT NOT NULL DEFAULT 0.0,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (year_month, type, category_id, payment_method_id)
+    ) WITHOUT ROWID;
+
+    INSERT INTO monthly_aggregates
+        (year_month, type, category_id, payment_method_id, total, count)
+    SELECT substr(date, 1, 7), type,
+           COALESCE(category_id, 0), COALESCE(payment_method_id, 0),
+           SUM(amount), COUNT(*)
+    FROM transactions
+    GROUP BY 1, 2, 3, 4;
+
+    CREATE TRIGGER trg_transactions_aggregate_insert
+    AFTER INSERT ON transactions
+    BEGIN
+        INSERT INTO monthly_aggregates
+            (year_month, type, category_id, payment_method_id, total, count)
+        VALUES (
+            substr(NEW.date, 1, 7), NEW.type,
+            COALESCE(NEW.category_id, 0), COALESCE(NEW.payment_method_id, 0),
+            NEW.amount, 1
+        )
+        ON CONFLICT (year_month, type, category_id, payment_method_id)
+        DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END;
+
+    CREATE TRIGGER trg_transactions_aggregate_delete
+    AFTER DELETE ON transactions
+    BEGIN
+        UPDATE monthly_aggregates
+        SET total = total - OLD.amount, count = count - 1
+        WHERE year_month = substr(OLD.date, 1, 7)
+          AND type = OLD.type
+          AND category_id = COALESCE(OLD.category_id, 0)
+          AND payment_method_id = COALESCE(OLD.payment_method_id, 0);
+
+        DELETE FROM monthly_aggregates
+        WHERE year_month = substr(OLD.date, 1, 7)
+          AND type = OLD.type
+          AND category_id = COALESCE(OLD.category_id, 0)
+          AND payment_method_id = COALESCE(OLD.payment_method_id, 0)
+          AND count <= 0;
+    END;
+
+    CREATE TRIGGER trg_transactions_aggregate_update
+    AFTER UPDATE OF amount, date, type, category_id, payment_method_id
+    ON transactions
+    BEGIN
+        UPDATE monthly_aggregates
+        SET total = total - OLD.amount, count = count - 1
+        WHERE year_month = substr(OLD.date, 1, 7)
+          AND type = OLD.type
+          AND category_id = COALESCE(OLD.category_id, 0)
+          AND payment_method_id = COALESCE(OLD.payment_method_id, 0);
+
+        DELETE FROM monthly_aggregates
+        WHERE year_month = substr(OLD.date, 1, 7)
+          AND type = OLD.type
+          AND category_id = COALESCE(OLD.category_id, 0)
+          AND payment_method_id = COALESCE(OLD.payment_method_id, 0)
+          AND count <= 0;
+
+        INSERT INTO monthly_aggregates
+            (year_month, type, category_id, payment_method_id, total, count)
+        VALUES (
+            substr(NEW.date, 1, 7), NEW.type,
+            COALESCE(NEW.category_id, 0), COALESCE(NEW.payment_method_id, 0),
+            NEW.amount, 1
+        )
+        ON CONFLICT (year_month, type, category_id, payment_method_id)
+        DO UPDATE SET total = total + excluded.total, count = count + 1;
+    END;
+    """
+
+
+def down():
+    """Removes the monthly aggregates and their triggers"""
+    return """
+        DROP TRIGGER IF EXISTS trg_transactions_aggregate_update;
+        DROP TRIGGER IF EXISTS trg_transactions_aggregate_delete;
+        DROP TRIGGER IF EXISTS trg_transactions_aggregate_insert;
+        DROP TABLE IF EXISTS monthly_aggregates;
+    """
@@ -0,0 +1,162 @@
+"""
+Moves every monetary column from FLOAT reais to INTEGER cents.
+
+transactions.amount, payment_methods.balance and payment_methods.credit_limit
+become amount_cents, balance_cents and credit_limit_cents, and
+monthly_aggregates.total becomes total_cents. The backfill runs in id ranges
+of CHUNK_SIZE rows, each one its own short transaction, so large ledgers are
+converted without holding them in memory. Every step checks the current
+schema first, so an interrupted run can simply be applied again.
+"""
+
+CHUNK_SIZE = 50_000
+
+# (table, float column, cents column, NOT NULL)
+MONEY_COLUMNS = [
+    ("transactions", "amount", "amount_cents", True),
+    ("payment_methods", "balance", "balance_cents", True),
+    ("payment_methods", "credit_limit", "credit_limit_cents", False),
+]
+
+# Rounds float reais to cents. The inner ROUND(..., 4) drops binary noise
+# first, so 0.285 becomes 29 cents (as in Python's Money) instead of 28
+TO_CENTS = "CAST(ROUND(ROUND({column} * 100, 4)) AS INTEGER)"
+TO_REAIS = "{column} / 100.0"
+
+AGGREGATE_TRIGGERS = [
+    "trg_transactions_aggregate_insert",
+    "trg_transactions_aggregate_delete",
+    "trg_transactions_aggregate_update",
+]
+
+
+def aggregates_schema(total: str, total_type: str, amount: str) -> str:
+    """monthly_aggregates table, backfill and triggers for the given columns"""
+    key_old = """
+        WHERE year_month = substr(OLD.date, 1, 7)
+          AND type = OLD.type
+          AND category_id = COALESCE(OLD.category_id, 0)
+          AND payment_method_id = COALESCE(OLD.payment_method_id, 0)"""
+    remove_old = f"""
+        UPDATE monthly_aggregates
+        SET {total} = {total} - OLD.{amount}, count = count - 1 {key_old};
+
+        DELETE FROM monthly_aggregates {key_old}
+          AND count <= 0;"""
+    add_new = f"""
+        INSERT INTO monthly_aggregates
+            (year_month, type, category_id, payment_method_id, {total}, count)
+        VALUES (
+            substr(NEW.date, 1, 7), NEW.type,
+            COALESCE(NEW.category_id, 0), COALESCE(NEW.payment_method_id, 0),
+            NEW.{amount}, 1
+        )
+        ON CONFLICT (year_month, type, category_id, payment_method_id)
+        DO UPDATE SET {total} = {total} + excluded.{total}, count = count + 1;"""
+
+    return f"""
+    CREATE TABLE monthly_aggregates (
+        year_month TEXT NOT NULL,
+        type TEXT NOT NULL,
+        category_id INTEGER NOT NULL DEFAULT 0,
+        payment_method_id INTEGER NOT NULL DEFAULT 0,
+        {total} {total_type} NOT NULL DEFAULT 0,
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (year_month, type, category_id, payment_method_id)
+    ) WITHOUT ROWID;
+
+    INSERT INTO monthly_aggregates
+        (year_month, type, category_id, payment_method_id, {total}, count)
+    SELECT substr(date, 1, 7), type,
+           COALESCE(category_id, 0), COALESCE(payment_method_id, 0),
+           SUM({amount}), COUNT(*)
+    FROM transactions
+    GROUP BY 1, 2, 3, 4;
+
+    CREATE TRIGGER trg_transactions_aggregate_insert
+    AFTER INSERT ON transactions
+    BEGIN {add_new}
+    END;
+
+    CREATE TRIGGER trg_transactions_aggregate_delete
+    AFTER DELETE ON transactions
+    BEGIN {remove_old}
+    END;
+
+    CREATE TRIGGER trg_transactions_aggregate_update
+    AFTER UPDATE OF {amount}, date, type, category_id, payment_method_id
+    ON transactions
+    BEGIN {remove_old}
+        {add_new}
+    END;
+    """
+
+
+def run(db, script: str) -> None:
+    """Runs a script, failing the migration if SQLite rejects it"""
+    if not db.execute_script(script):
+        raise RuntimeError(f"Script failed: {script.strip()[:80]}")
+
+
+def columns_of(db, table: str) -> set[str]:
+    """Names of the columns currently in `table`"""
+    return {row["name"] for row in db.select(f"PRAGMA table_info({table});")}
+
+
+def backfill(
+    db, table: str, target: str, expression: str, chunk_size: int
+) -> None:
+    """Fills `target` from `expression` in id ranges of `chunk_size` rows"""
+    bounds = db.select_one(f"SELECT MIN(id) AS low, MAX(id) AS high FROM {table};")
+    if not bounds or bounds["low"] is None:
+        return
+    low = bounds["low"] - 1
+    while low < bounds["high"]:
+        high = low + chunk_size
+        with db.transaction():
+            db.update(
+                f"UPDATE {table} SET {target} = {expression} "
+                "WHERE id > ? AND id <= ?;",
+                (low, high),
+            )
+        low = high
+
+
+def convert(db, to_cents: bool, chunk_size: int = CHUNK_SIZE) -> None:
+    """Swaps every money column between reais and cents"""
+    run(
+        db,
+        "".join(f"DROP TRIGGER IF EXISTS {name};" for name in AGGREGATE_TRIGGERS)
+        + "DROP TABLE IF EXISTS monthly_aggregates;",
+    )
+
+    for table, reais, cents, not_null in MONEY_COLUMNS:
+        source, target = (reais, cents) if to_cents else (cents, reais)
+        expression = (TO_CENTS if to_cents else TO_REAIS).format(column=source)
+        if not_null:
+            expression = f"COALESCE({expression}, 0)"
+        columns = columns_of(db, table)
+        if source not in columns:
+            continue  # Already converted by an interrupted run
+
+        if target not in columns:
+            column_type = "INTEGER" if to_cents else "FLOAT"
+            default = " NOT NULL DEFAULT 0" if not_null else ""
+            run(db, f"ALTER TABLE {table} ADD COLUMN {target} {column_type}{default};")
+        backfill(db, table, target, expression, chunk_size)
+        run(db, f"ALTER TABLE {table} DROP COLUMN {source};")
+
+    if to_cents:
+        run(db, aggregates_schema("total_cents", "INTEGER", "amount_cents"))
+    else:
+        run(db, aggregates_schema("total", "FLOAT", "amount"))
+
+
+def up(db):
+    """Converts the money columns to integer cents"""
+    convert(db, to_cents=True)
+
+
+def down(db):
+    """Converts the money columns back to FLOAT reais"""
+    convert(db, to_cents=False)
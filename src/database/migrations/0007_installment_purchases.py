@@ -0,0 +1,51 @@
+"""
+Installment purchases.
+
+An Expense paid in N installments is stored as one purchases row plus N
+transactions, one per month, linked by transactions.purchase_id. Rows of
+a purchase are found through idx_transactions_purchase. The partial
+idx_transactions_installments_date indexes only installment rows by
+date, so "installments due in month X" reads just those rows.
+
+purchase_id has no REFERENCES clause: SQLite cannot drop a column that
+takes part in a foreign key, and down() must stay a plain DROP COLUMN.
+TransactionRepository.delete_purchase removes the rows of a purchase.
+"""
+
+SCHEMA = """
+    CREATE TABLE purchases (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        total_cents INTEGER NOT NULL,
+        installments INTEGER NOT NULL CHECK (installments >= 1),
+        first_date TIMESTAMP NOT NULL,
+        description TEXT
+    );
+
+    ALTER TABLE transactions ADD COLUMN purchase_id INTEGER;
+
+    CREATE INDEX idx_transactions_purchase
+    ON transactions (purchase_id, current_installment);
+
+    CREATE INDEX idx_transactions_installments_date
+    ON transactions (date, id)
+    WHERE purchase_id IS NOT NULL;
+"""
+
+
+def up(db):
+    """Creates purchases, the purchase_id column and its indexes"""
+    if not db.execute_script(SCHEMA):
+        raise RuntimeError("Could not create the installment purchases schema")
+
+
+def down(db):
+    """Drops the indexes, the purchase_id column and purchases"""
+    if not db.execute_script(
+        """
+        DROP INDEX IF EXISTS idx_transactions_installments_date;
+        DROP INDEX IF EXISTS idx_transactions_purchase;
+        ALTER TABLE transactions DROP COLUMN purchase_id;
+        DROP TABLE IF EXISTS purchases;
+        """
+    ):
+        raise RuntimeError("Could not drop the installment purchases schema")
@@ -0,0 +1,124 @@
+import sqlite3
+from typing import Optional
+
+
+class PragmaProfile:
+    """
+    Set of PRAGMAs applied once to every new pooled connection.
+
+    Presets live in PragmaProfile.DESKTOP, BULK_IMPORT and TEST and can be
+    looked up by name with PragmaProfile.get().
+    """
+
+    JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+    SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
+    TEMP_STORES = ("DEFAULT", "FILE", "MEMORY")
+
+    DESKTOP: "PragmaProfile"
+    BULK_IMPORT: "PragmaProfile"
+    TEST: "PragmaProfile"
+
+    def __init__(
+        self,
+        name: str,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size: int = -20_000,
+        mmap_size: int = 0,
+        temp_store: str = "DEFAULT",
+        busy_timeout: int = 5_000,
+    ):
+        """
+        Args:
+            name: Profile name
+            journal_mode: Journal mode (WAL lets readers run during writes)
+            synchronous: How often commits are fsynced
+            cache_size: Page cache size (negative values are KiB)
+            mmap_size: Bytes of the file mapped in memory (0 disables it)
+            temp_store: Where temporary tables and indexes are kept
+            busy_timeout: Maximum wait for a lock, in milliseconds
+        """
+        journal_mode = journal_mode.upper()
+        synchronous = synchronous.upper()
+        temp_store = temp_store.upper()
+        if journal_mode not in self.JOURNAL_MODES:
+            raise ValueError(f"Invalid journal_mode: {journal_mode}")
+        if synchronous not in self.SYNCHRONOUS:
+            raise ValueError(f"Invalid synchronous: {synchronous}")
+        if temp_store not in self.TEMP_STORES:
+            raise ValueError(f"Invalid temp_store: {temp_store}")
+        if mmap_size < 0 or busy_timeout < 0:
+            raise ValueError("mmap_size and busy_timeout cannot be negative")
+
+        self.name = name
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.cache_size = int(cache_size)
+        self.mmap_size = int(mmap_size)
+        self.temp_store = temp_store
+        self.busy_timeout = int(busy_timeout)
+
+    def statements(self) -> list[str]:
+        """Returns the profile PRAGMAs in the order they are applied"""
+        return [
+            f"PRAGMA busy_timeout = {self.busy_timeout};",
+            f"PRAGMA journal_mode = {self.journal_mode};",
+            f"PRAGMA synchronous = {self.synchronous};",
+            f"PRAGMA cache_size = {self.cache_size};",
+            f"PRAGMA mmap_size = {self.mmap_size};",
+            f"PRAGMA temp_store = {self.temp_store};",
+        ]
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        """Applies the profile to a connection"""
+        for statement in self.statements():
+            conn.execute(statement).fetchall()
+
+    @classmethod
+    def get(cls, profile: Optional["PragmaProfile | str"]) -> "PragmaProfile":
+        """Resolves a profile by name ("desktop", "bulk_import" or "test")"""
+        if isinstance(profile, PragmaProfile):
+            return profile
+        presets = {p.name: p for p in (cls.DESKTOP, cls.BULK_IMPORT, cls.TEST)}
+        name = (profile or "desktop").lower()
+        if name not in presets:
+            raise ValueError(f"Unknown PRAGMA profile: {profile}")
+        return presets[name]
+
+    def __repr__(self) -> str:
+        return f"PragmaProfile({self.name!r})"
+
+
+# Interactive use: readers never block the writer and commits only
+# fsync the WAL at checkpoints
+PragmaProfile.DESKTOP = PragmaProfile(
+    "desktop",
+    journal_mode="WAL",
+    synchronous="NORMAL",
+    cache_size=-20_000,
+    mmap_size=64 * 1024 * 1024,
+    temp_store="MEMORY",
+    busy_timeout=5_000,
+)
+
+# Large imports: trades durability of the last commits for speed
+PragmaProfile.BULK_IMPORT = PragmaProfile(
+    "bulk_import",
+    journal_mode="WAL",
+    synchronous="OFF",
+    cache_size=-200_000,
+    mmap_size=256 * 1024 * 1024,
+    temp_store="MEMORY",
+    busy_timeout=30_000,
+)
+
+# Tests: throwaway databases, no fsync
+PragmaProfile.TEST = PragmaProfile(
+    "test",
+    journal_mode="MEMORY",
+    synchronous="OFF",
+    cache_size=-8_000,
+    mmap_size=0,
+    temp_store="MEMORY",
+    busy_timeout=5_000,
+)
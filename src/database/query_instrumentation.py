@@ -0,0 +1,242 @@
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Callable, Iterator, Optional
+
+
+class QueryEvent:
+    """One statement run through a DatabaseManager"""
+
+    __slots__ = ("label", "sql", "elapsed_ms", "rows", "caller", "action", "error")
+
+    def __init__(
+        self,
+        label: str,
+        sql: str,
+        elapsed_ms: float,
+        rows: int,
+        caller: str,
+        action: Optional[str] = None,
+        error: Optional[str] = None,
+    ):
+        self.label = label
+        self.sql = sql
+        self.elapsed_ms = elapsed_ms
+        self.rows = rows
+        self.caller = caller
+        self.action = action
+        self.error = error
+
+    def __str__(self) -> str:
+        action = f" [{self.action}]" if self.action else ""
+        error = f" ERROR {self.error}" if self.error else ""
+        sql = " ".join(self.sql.split())
+        return (
+            f"{self.elapsed_ms:8.2f} ms {self.rows:7} rows "
+            f"{self.caller}{action}{error}: {sql}"
+        )
+
+
+class ActionStats:
+    """Queries run on behalf of one UI action, e.g. opening a screen"""
+
+    __slots__ = ("name", "queries", "elapsed_ms", "rows", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.queries = 0
+        self.elapsed_ms = 0.0
+        self.rows = 0
+        self.started = datetime.now()
+
+    def __str__(self) -> str:
+        return f"{self.name}: {self.queries} queries, {self.elapsed_ms:.1f} ms"
+
+
+class QueryProbe:
+    """Times one statement; created by QueryInstrumentation.probe()"""
+
+    __slots__ = ("_owner", "_label", "_sql", "_caller", "_start", "rows")
+
+    def __init__(self, owner: "QueryInstrumentation", label: str, sql: str):
+        self._owner = owner
+        self._label = label
+        self._sql = sql
+        # Taken now, while the repository method is still on the stack
+        self._caller = owner.caller()
+        self._start = 0.0
+        self.rows = 0
+
+    def __enter__(self) -> "QueryProbe":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        self._owner.record(
+            QueryEvent(
+                self._label,
+                self._sql,
+                elapsed_ms,
+                self.rows,
+                self._caller,
+                error=str(exc) if exc is not None else None,
+            )
+        )
+        return False
+
+
+class _NullProbe:
+    """Probe used when instrumentation is off: does nothing, allocates nothing"""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullProbe":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    @property
+    def rows(self) -> int:
+        return 0
+
+    @rows.setter
+    def rows(self, value: int) -> None:
+        pass
+
+
+NULL_PROBE = _NullProbe()
+
+
+class QueryInstrumentation:
+    """
+    Pluggable timing of every statement a DatabaseManager runs.
+
+    Each statement becomes a QueryEvent with its duration, row count and
+    caller (the repository method that issued it). Events are passed to
+    the registered hooks, written to the slow-query log when they exceed
+    the threshold, and added to the UI action they ran for.
+
+    Actions are tracked with a ContextVar: queries issued inside
+    `with instrumentation.action("Carteira"):`, including the ones from
+    tasks submitted to a TaskRunner there, are counted for that action.
+
+    A DatabaseManager without instrumentation only checks for None, so
+    leaving it disabled costs nothing measurable.
+    """
+
+    # Modules skipped when looking for the caller of a statement
+    INTERNAL_MODULES = frozenset(
+        {
+            __name__,
+            "src.database.db_manager",
+            "src.repositories.repository_cache",
+            "contextlib",
+        }
+    )
+
+    ENV_LOG = "EXPENSE_TRACKER_QUERY_LOG"
+    ENV_SLOW_MS = "EXPENSE_TRACKER_SLOW_QUERY_MS"
+
+    _current_action: ContextVar[Optional[ActionStats]] = ContextVar(
+        "query_action", default=None
+    )
+
+    def __init__(
+        self,
+        slow_query_ms: float = 50.0,
+        slow_query_log: Optional[str] = None,
+        max_actions: int = 100,
+    ):
+        """
+        Args:
+            slow_query_ms: Statements at least this slow go to the log
+            slow_query_log: File the slow statements are appended to
+                            (None keeps no log)
+            max_actions: How many recent actions report() keeps
+        """
+        if slow_query_ms < 0:
+            raise ValueError("slow_query_ms cannot be negative")
+        self.slow_query_ms = slow_query_ms
+        self.slow_query_log = slow_query_log
+        self._hooks: list[Callable[[QueryEvent], None]] = []
+        self._actions: deque[ActionStats] = deque(maxlen=max_actions)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls) -> Optional["QueryInstrumentation"]:
+        """
+        Instrumentation configured by environment variables, or None.
+
+        EXPENSE_TRACKER_QUERY_LOG names the slow-query log file and
+        EXPENSE_TRACKER_SLOW_QUERY_MS its threshold; either one enables it.
+        """
+        log = os.environ.get(cls.ENV_LOG)
+        slow_ms = os.environ.get(cls.ENV_SLOW_MS)
+        if not log and not slow_ms:
+            return None
+        return cls(slow_query_ms=float(slow_ms or 50.0), slow_query_log=log)
+
+    def add_hook(self, hook: Callable[[QueryEvent], None]) -> None:
+        """Calls `hook` with every QueryEvent, on the thread that ran it"""
+        with self._lock:
+            self._hooks = [*self._hooks, hook]
+
+    def remove_hook(self, hook: Callable[[QueryEvent], None]) -> None:
+        with self._lock:
+            self._hooks = [h for h in self._hooks if h != hook]
+
+    def caller(self) -> str:
+        """Qualified name of the first function outside the database layer"""
+        frame = sys._getframe(1)
+        while frame is not None:
+            if frame.f_globals.get("__name__") not in self.INTERNAL_MODULES:
+                # Lambdas and comprehensions report the method around them
+                return frame.f_code.co_qualname.split(".<locals>")[0]
+            frame = frame.f_back
+        return "?"
+
+    def probe(self, label: str, sql: str) -> QueryProbe:
+        """Context manager that times one statement and records it"""
+        return QueryProbe(self, label, sql)
+
+    @contextmanager
+    def action(self, name: str) -> Iterator[ActionStats]:
+        """Counts the queries issued inside the block for the action `name`"""
+        stats = ActionStats(name)
+        with self._lock:
+            self._actions.append(stats)
+        token = self._current_action.set(stats)
+        try:
+            yield stats
+        finally:
+            self._current_action.reset(token)
+
+    def record(self, event: QueryEvent) -> None:
+        """Adds the event to its action, the slow-query log and the hooks"""
+        stats = self._current_action.get()
+        if stats is not None:
+            event.action = stats.name
+        with self._lock:
+            if stats is not None:
+                stats.queries += 1
+                stats.elapsed_ms += event.elapsed_ms
+                stats.rows += event.rows
+            if self.slow_query_log and event.elapsed_ms >= self.slow_query_ms:
+                with open(self.slow_query_log, "a", encoding="utf-8") as log:
+                    log.write(f"{datetime.now().isoformat(timespec='seconds')} ")
+                    log.write(f"{event}\n")
+            hooks = self._hooks
+        for hook in hooks:
+            hook(event)
+
+    def report(self) -> list[str]:
+        """One line per recent action, oldest first"""
+        with self._lock:
+            return [str(stats) for stats in self._actions]
@@ -0,0 +1,59 @@
+from typing import Iterator
+
+
+class QueryRegistry:
+    """
+    Named SQL statements shared by the repositories.
+
+    sqlite3 keeps compiled statements in a per-connection LRU keyed by the
+    exact SQL text. Registering each query shape once, under a name, gives
+    every call site the same normalized text, so a pooled connection parses
+    and plans it on first use and reuses the compiled statement afterwards.
+    """
+
+    def __init__(self):
+        self._queries: dict[str, str] = {}
+
+    @staticmethod
+    def normalize(sql: str) -> str:
+        """Collapses whitespace so formatting never produces a new shape"""
+        return " ".join(sql.split())
+
+    def register(self, name: str, sql: str) -> str:
+        """
+        Registers `sql` under `name` and returns the name.
+
+        Registering the same text again is a no-op (modules may be reloaded).
+
+        Raises:
+            ValueError: If `name` is already taken by a different statement
+        """
+        sql = self.normalize(sql)
+        current = self._queries.get(name)
+        if current is not None and current != sql:
+            raise ValueError(f"Query {name!r} is already registered")
+        self._queries[name] = sql
+        return name
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self._queries[name]
+        except KeyError:
+            raise KeyError(f"Unknown query: {name}") from None
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._queries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._queries)
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def items(self) -> list[tuple[str, str]]:
+        """(name, sql) pairs in registration order"""
+        return list(self._queries.items())
+
+
+# Registry used by the application's repositories
+QUERIES = QueryRegistry()
@@ -2,6 +2,8 @@ from typing import Optional
 
 
 class Category:
+    __slots__ = ("_id", "_name")
+
     def __init__(self, id: Optional[int] = None, name: str = ""):
         """
         Initialize a Category with optional id and name
@@ -0,0 +1,129 @@
+from datetime import date, timedelta
+from typing import Optional
+from src.models.money import Money
+from utils.period import Period
+
+
+class CategoryTotal:
+    """Despesas de uma categoria dentro do período do painel"""
+
+    __slots__ = ("_name", "_total", "_count")
+
+    def __init__(self, name: str, total: Money, count: int):
+        self._name = name
+        self._total = total
+        self._count = count
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def total(self) -> Money:
+        """Soma das despesas da categoria"""
+        return self._total
+
+    @property
+    def count(self) -> int:
+        """Quantidade de despesas da categoria"""
+        return self._count
+
+    def to_dict(self) -> dict:
+        """Formato usado pelos gráficos: {'name', 'total_expense', 'count'}"""
+        return {"name": self._name, "total_expense": self._total, "count": self._count}
+
+
+class DashboardSnapshot:
+    """
+    Métricas da tela de métricas para um período, lidas em uma única consulta.
+
+    As categorias vêm ordenadas do maior para o menor gasto. Despesas sem
+    categoria entram nos totais, mas não na lista de categorias. Só contam
+    as transações até `as_of`: parcelas agendadas para depois ficam de fora.
+    """
+
+    __slots__ = (
+        "_period",
+        "_total_expense",
+        "_total_income",
+        "_transaction_count",
+        "_categories",
+        "_as_of",
+    )
+
+    def __init__(
+        self,
+        period: Period,
+        total_expense: Money = Money(),
+        total_income: Money = Money(),
+        transaction_count: int = 0,
+        categories: Optional[list[CategoryTotal]] = None,
+        as_of: Optional[date] = None,
+    ):
+        self._period = period
+        self._total_expense = total_expense
+        self._total_income = total_income
+        self._transaction_count = transaction_count
+        self._categories = list(categories or [])
+        self._as_of = as_of or date.today()
+
+    @property
+    def period(self) -> Period:
+        return self._period
+
+    @property
+    def as_of(self) -> date:
+        """Último dia cujas transações foram somadas"""
+        return self._as_of
+
+    @property
+    def total_expense(self) -> Money:
+        return self._total_expense
+
+    @property
+    def total_income(self) -> Money:
+        return self._total_income
+
+    @property
+    def balance(self) -> Money:
+        """Receitas menos despesas no período"""
+        return self._total_income - self._total_expense
+
+    @property
+    def transaction_count(self) -> int:
+        """Quantidade de transações (receitas e despesas) no período"""
+        return self._transaction_count
+
+    @property
+    def categories(self) -> list[CategoryTotal]:
+        return list(self._categories)
+
+    @property
+    def top_category(self) -> str:
+        """Categoria com o maior gasto, ou "" sem despesas categorizadas"""
+        return self._categories[0].name if self._categories else ""
+
+    @property
+    def most_frequent_category(self) -> str:
+        """Categoria com mais despesas; empates ficam com a de maior gasto"""
+        if not self._categories:
+            return ""
+        return max(self._categories, key=lambda category: category.count).name
+
+    def daily_expense_average(self, today: Optional[date] = None) -> Money:
+        """
+        Média de gasto por dia no período, contando apenas até hoje.
+
+        Args:
+            today: Data de referência (padrão: as_of, o dia até onde as
+                   despesas foram somadas)
+
+        Returns:
+            Money: Média diária (zero se o período ainda não começou)
+        """
+        today = today or self._as_of
+        last_day = min(self._period.end, today + timedelta(days=1))
+        days = (last_day - self._period.start).days
+        if days <= 0:
+            return Money()
+        return Money.from_cents(round(self._total_expense.cents / days))
@@ -0,0 +1,97 @@
+import calendar
+from datetime import datetime
+from src.models.money import Money
+from src.models.transaction.expense import Expense
+
+
+class InstallmentPlan:
+    """
+    Divide uma compra parcelada em parcelas mensais.
+
+    O total é repartido em centavos inteiros: os centavos que sobram da
+    divisão vão para as primeiras parcelas, então a soma das parcelas é
+    sempre igual ao total. A parcela k vence k - 1 meses após a compra, no
+    mesmo dia (ou no último dia de meses mais curtos).
+    """
+
+    # Mesmo limite aceito pela tela de nova transação
+    MAX_INSTALLMENTS = 360
+
+    __slots__ = ("_total", "_installments", "_first_date")
+
+    def __init__(self, total: Money | float, installments: int, first_date: datetime):
+        """
+        Args:
+            total: Valor total da compra
+            installments: Quantidade de parcelas (1 a MAX_INSTALLMENTS)
+            first_date: Data da compra, que é a data da primeira parcela
+        """
+        total = Money(total)
+        if not 1 <= installments <= self.MAX_INSTALLMENTS:
+            raise ValueError(
+                f"Número de parcelas deve ser entre 1 e {self.MAX_INSTALLMENTS}"
+            )
+        if total.cents < installments:
+            raise ValueError("Cada parcela precisa valer ao menos um centavo")
+        self._total = total
+        self._installments = installments
+        self._first_date = first_date
+
+    @property
+    def total(self) -> Money:
+        return self._total
+
+    @property
+    def installments(self) -> int:
+        return self._installments
+
+    @property
+    def first_date(self) -> datetime:
+        return self._first_date
+
+    def amounts(self) -> list[Money]:
+        """Valor de cada parcela, da primeira à última"""
+        share, remainder = divmod(self._total.cents, self._installments)
+        return [
+            Money.from_cents(share + (1 if number < remainder else 0))
+            for number in range(self._installments)
+        ]
+
+    def dates(self) -> list[datetime]:
+        """Data de vencimento de cada parcela, da primeira à última"""
+        first = self._first_date
+        dates = []
+        for offset in range(self._installments):
+            index = first.year * 12 + first.month - 1 + offset
+            year, month = divmod(index, 12)
+            month += 1
+            day = min(first.day, calendar.monthrange(year, month)[1])
+            dates.append(first.replace(year=year, month=month, day=day))
+        return dates
+
+    def expand(self, expense: Expense) -> list[Expense]:
+        """
+        Gera uma despesa por parcela a partir da despesa da compra.
+
+        Args:
+            expense: Despesa com o valor total; descrição, categoria, método
+                     de pagamento e purchase_id são copiados para as parcelas
+
+        Returns:
+            Lista de despesas ainda não gravadas, da parcela 1 à última
+        """
+        return [
+            Expense(
+                amount=amount,
+                description=expense.description,
+                date=date,
+                payment_method=expense.payment_method,
+                category=expense.category,
+                current_installment=number,
+                total_installments=self._installments,
+                purchase_id=expense.purchase_id,
+            )
+            for number, (amount, date) in enumerate(
+                zip(self.amounts(), self.dates()), start=1
+            )
+        ]
@@ -0,0 +1,176 @@
+import operator
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Optional
+
+
+class Money:
+    """
+    Valor monetário imutável guardado como número inteiro de centavos.
+
+    Aceita int, float, str, Decimal ou outro Money (sempre em reais) e
+    arredonda para o centavo mais próximo. Somas e subtrações com números
+    comuns convertem o outro lado para Money antes, então não acumulam
+    erros de ponto flutuante. Comparações são exatas: Money só é igual a
+    int, Decimal ou Money de mesmo valor, nunca a um float.
+    """
+
+    __slots__ = ("_cents",)
+
+    _CENT = Decimal("0.01")
+
+    def __init__(self, value: "Money | int | float | str | Decimal" = 0):
+        """
+        Args:
+            value: Valor em reais
+        """
+        if isinstance(value, Money):
+            self._cents = value._cents
+            return
+        if isinstance(value, bool) or not isinstance(value, (int, float, str, Decimal)):
+            raise TypeError(f"Cannot convert {type(value).__name__} to Money")
+        try:
+            amount = Decimal(str(value)) if isinstance(value, float) else Decimal(value)
+            cents = amount.quantize(self._CENT, rounding=ROUND_HALF_UP).scaleb(2)
+        except ArithmeticError as e:
+            raise ValueError(f"Invalid monetary value: {value!r}") from e
+        self._cents = int(cents)
+
+    @classmethod
+    def from_cents(cls, cents: int) -> "Money":
+        """Cria o valor a partir de centavos, como gravado no banco"""
+        money = cls.__new__(cls)
+        money._cents = int(cents)
+        return money
+
+    @classmethod
+    def from_field(
+        cls, data: dict[str, any], name: str, default: Optional["Money"] = None
+    ) -> Optional["Money"]:
+        """
+        Lê um campo monetário de um dicionário.
+
+        Usa "<name>_cents" quando presente (formato do banco) e, senão,
+        "<name>" em reais. Campos ausentes ou nulos retornam `default`.
+        """
+        cents = data.get(f"{name}_cents")
+        if cents is not None:
+            return cls.from_cents(cents)
+        value = data.get(name)
+        return default if value is None else cls(value)
+
+    @property
+    def cents(self) -> int:
+        """Valor em centavos"""
+        return self._cents
+
+    def to_decimal(self) -> Decimal:
+        """Valor exato em reais"""
+        return Decimal(self._cents).scaleb(-2)
+
+    @classmethod
+    def _coerce(cls, other: object) -> Optional["Money"]:
+        """Converte números comuns para Money; None se não for possível"""
+        if isinstance(other, Money):
+            return other
+        if isinstance(other, bool) or not isinstance(other, (int, float, Decimal)):
+            return None
+        return cls(other)
+
+    # --- Aritmética ---
+    def __add__(self, other: object) -> "Money":
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Money.from_cents(self._cents + other._cents)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: object) -> "Money":
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Money.from_cents(self._cents - other._cents)
+
+    def __rsub__(self, other: object) -> "Money":
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return Money.from_cents(other._cents - self._cents)
+
+    def __mul__(self, factor: object) -> "Money":
+        if isinstance(factor, bool) or not isinstance(factor, (int, float, Decimal)):
+            return NotImplemented
+        return Money(self.to_decimal() * Decimal(str(factor)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: object) -> "Money | float":
+        """Divide por um número (Money) ou por outro Money (proporção)"""
+        if isinstance(other, Money):
+            return self._cents / other._cents
+        if isinstance(other, bool) or not isinstance(other, (int, float, Decimal)):
+            return NotImplemented
+        return Money(self.to_decimal() / Decimal(str(other)))
+
+    def __neg__(self) -> "Money":
+        return Money.from_cents(-self._cents)
+
+    def __pos__(self) -> "Money":
+        return self
+
+    def __abs__(self) -> "Money":
+        return Money.from_cents(abs(self._cents))
+
+    # --- Comparações ---
+    def _compare(self, other: object, compare) -> bool:
+        """Compara sem arredondar: centavos com Money, reais com números"""
+        if isinstance(other, Money):
+            return compare(self._cents, other._cents)
+        if isinstance(other, bool) or not isinstance(other, (int, float, Decimal)):
+            return NotImplemented
+        return compare(self.to_decimal(), other)
+
+    def __eq__(self, other: object) -> bool:
+        # Nenhum float é igual a Money: 1.1 não vale exatamente R$ 1,10, e
+        # uma igualdade aproximada não teria o mesmo hash dos dois lados
+        if isinstance(other, float):
+            return NotImplemented
+        return self._compare(other, operator.eq)
+
+    def __lt__(self, other: object) -> bool:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: object) -> bool:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: object) -> bool:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: object) -> bool:
+        return self._compare(other, operator.ge)
+
+    def __hash__(self) -> int:
+        # Igual ao hash dos valores iguais a ele: int e Decimal exatos
+        return hash(self.to_decimal())
+
+    def __bool__(self) -> bool:
+        return self._cents != 0
+
+    # --- Conversões ---
+    def __float__(self) -> float:
+        return self._cents / 100
+
+    def __format__(self, format_spec: str) -> str:
+        """Formata como Decimal, então f"{valor:,.2f}" continua funcionando"""
+        if not format_spec:
+            return str(self)
+        return format(self.to_decimal(), format_spec)
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
+
+    def __repr__(self) -> str:
+        return f"Money('{self}')"
+
+    def __reduce__(self):
+        return Money.from_cents, (self._cents,)
@@ -1,6 +1,7 @@
 from src.models.payment_method.payment_method import PaymentMethod
 from typing import Optional
 from src.models.payment_method.payment_type import PaymentType
+from src.models.money import Money
 
 
 class Credit(PaymentMethod):
@@ -9,12 +10,14 @@ class Credit(PaymentMethod):
     Adiciona funcionalidades específicas como limite de crédito e datas de vencimento.
     """
 
+    __slots__ = ("_credit_limit", "_closing_day", "_due_day")
+
     def __init__(
         self,
         id: Optional[int] = None,
         name: str = "",
-        balance: float = 0.0,
-        credit_limit: float = 0.0,
+        balance: Money | float = 0.0,
+        credit_limit: Money | float = 0.0,
         closing_day: Optional[int] = None,
         due_day: Optional[int] = None,
     ):
@@ -27,20 +30,21 @@ class Credit(PaymentMethod):
             due_day: Dia de vencimento do pagamento
         """
         super().__init__(id, name, balance)
-        self._credit_limit = credit_limit
+        self._credit_limit = Money(credit_limit)
         self._closing_day = closing_day
         self._due_day = due_day
         self._payment_type = PaymentType.CREDIT  # Define o tipo específico
 
     # Propriedades específicas do crédito
     @property
-    def credit_limit(self) -> float:
+    def credit_limit(self) -> Money:
         """Getter para o limite de crédito"""
         return self._credit_limit
 
     @credit_limit.setter
-    def credit_limit(self, value: float) -> None:
+    def credit_limit(self, value: Money | float) -> None:
         """Setter para limite com validação"""
+        value = Money(value)
         if value < 0:
             raise ValueError("Limite não pode ser negativo")
         self._credit_limit = value
@@ -70,11 +74,11 @@ class Credit(PaymentMethod):
         self._due_day = value
 
     @property
-    def available_limit(self) -> float:
+    def available_limit(self) -> Money:
         """Calcula o limite disponível (limite total - saldo utilizado)"""
         return self._credit_limit - self._balance
 
-    def process_payment(self, amount: float, is_expense: bool) -> bool:
+    def process_payment(self, amount: Money | float, is_expense: bool) -> bool:
         """
         Processa um pagamento no crédito.
 
@@ -87,6 +91,7 @@ class Credit(PaymentMethod):
         Raises:
             ValueError: Se valor for inválido
         """
+        amount = Money(amount)
         if amount <= 0:
             raise ValueError("Valor da transação deve ser positivo")
         if is_expense:
@@ -102,9 +107,9 @@ class Credit(PaymentMethod):
         return {
             "id": self._id,
             "name": self._name,
-            "balance": self._balance,
+            "balance_cents": self._balance.cents,
             "type": self._payment_type,
-            "credit_limit": self._credit_limit,
+            "credit_limit_cents": self._credit_limit.cents,
             "closing_day": self._closing_day,
             "due_day": self._due_day,
         }
@@ -115,8 +120,8 @@ class Credit(PaymentMethod):
         return cls(
             id=data.get("id"),
             name=data.get("name", ""),
-            balance=data.get("balance", 0.0),
-            credit_limit=data.get("credit_limit", 0.0),
+            balance=Money.from_field(data, "balance", Money()),
+            credit_limit=Money.from_field(data, "credit_limit", Money()),
             closing_day=data.get("closing_day"),
             due_day=data.get("due_day"),
         )
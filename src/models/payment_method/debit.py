@@ -1,6 +1,7 @@
 from src.models.payment_method.payment_method import PaymentMethod
 from src.models.payment_method.payment_type import PaymentType
 from typing import Optional
+from src.models.money import Money
 
 
 class Debit(PaymentMethod):
@@ -9,17 +10,19 @@ class Debit(PaymentMethod):
     Mais simples que o crédito, apenas verifica saldo disponível.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         id: Optional[int] = None,
         name: str = "",
-        balance: float = 0.0,
+        balance: Money | float = 0.0,
     ):
         """Inicializa cartão de débito com saldo disponível"""
         super().__init__(id, name, balance)
         self._payment_type = PaymentType.DEBIT  # Define tipo específico
 
-    def process_payment(self, amount: float, is_expense: bool) -> bool:
+    def process_payment(self, amount: Money | float, is_expense: bool) -> bool:
         """
         Processa pagamento no débito.
 
@@ -32,6 +35,7 @@ class Debit(PaymentMethod):
         Raises:
             ValueError: Se valor for inválido
         """
+        amount = Money(amount)
         if amount <= 0:
             raise ValueError("Valor da transação deve ser positivo")
         if is_expense:
@@ -48,5 +52,5 @@ class Debit(PaymentMethod):
         return cls(
             id=data.get("id"),
             name=data.get("name", ""),
-            balance=data.get("balance", 0.0),
+            balance=Money.from_field(data, "balance", Money()),
         )
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional
+from src.models.money import Money
 
 
 class PaymentMethod(ABC):
@@ -8,18 +9,22 @@ class PaymentMethod(ABC):
     Serve como base para implementações específicas como crédito e débito.
     """
 
-    def __init__(self, id: Optional[int] = None, name: str = "", balance: float = 0.0):
+    __slots__ = ("_id", "_name", "_balance", "_payment_type")
+
+    def __init__(
+        self, id: Optional[int] = None, name: str = "", balance: Money | float = 0.0
+    ):
         """
         Inicializa o método de pagamento com valores básicos.
 
         Args:
             id: Identificador único (opcional)
             name: Nome do método de pagamento
-            balance: Saldo/valor disponível
+            balance: Saldo/valor disponível, em reais
         """
         self._id = id  # ID interno
         self._name = name  # Nome do método
-        self._balance = balance  # Saldo disponível
+        self._balance = Money(balance)  # Saldo disponível
         self._payment_type: str = ""  # Tipo (será definido nas subclasses)
 
     # Propriedades com validação
@@ -48,13 +53,14 @@ class PaymentMethod(ABC):
         self._name = value
 
     @property
-    def balance(self) -> float:
+    def balance(self) -> Money:
         """Getter para o saldo/disponível"""
         return self._balance
 
     @balance.setter
-    def balance(self, value: float) -> None:
+    def balance(self, value: Money | float) -> None:
         """Setter para saldo com validação"""
+        value = Money(value)
         if value < 0:
             raise ValueError("Saldo não pode ser negativo")
         self._balance = value
@@ -70,12 +76,12 @@ class PaymentMethod(ABC):
         return {
             "id": self._id,
             "name": self._name,
-            "balance": self._balance,
+            "balance_cents": self._balance.cents,
             "type": self._payment_type,
         }
 
     @abstractmethod
-    def process_payment(self, amount: float, is_expense: bool) -> bool:
+    def process_payment(self, amount: Money | float, is_expense: bool) -> bool:
         """Processa um pagamento com o valor especificado"""
         pass
 
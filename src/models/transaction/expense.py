@@ -2,6 +2,7 @@ from src.models.transaction.transaction import Transaction
 from datetime import datetime
 from typing import Optional
 from src.models.category import Category
+from src.models.money import Money
 from src.models.payment_method.payment_method import PaymentMethod
 from src.models.transaction.transaction_type import TransactionType
 
@@ -12,16 +13,24 @@ class Expense(Transaction):
     Pode ser parcelada (com número de parcelas) e associada a categorias.
     """
 
+    __slots__ = (
+        "_category",
+        "_current_installment",
+        "_total_installments",
+        "_purchase_id",
+    )
+
     def __init__(
         self,
         id: Optional[int] = None,
-        amount: float = 0.0,
+        amount: Money | float = 0.0,
         description: str = "",
         date: Optional[datetime] = None,
         payment_method: Optional[PaymentMethod] = None,
         category: Optional[Category] = None,
         current_installment: int = 1,
         total_installments: int = 1,
+        purchase_id: Optional[int] = None,
     ):
         """
         Inicializa uma despesa, que pode ser parcelada.
@@ -30,6 +39,7 @@ class Expense(Transaction):
             category: Categoria da despesa (alimentação, transporte, etc.)
             current_installment: Parcela atual (1 se não parcelado)
             total_installments: Total de parcelas (1 se não parcelado)
+            purchase_id: Compra parcelada à qual esta parcela pertence
         """
         # Validações específicas de despesa
         if (current_installment and current_installment <= 0) or (
@@ -47,6 +57,7 @@ class Expense(Transaction):
         self._category = category
         self._current_installment = current_installment
         self._total_installments = total_installments
+        self._purchase_id = purchase_id
         self._transaction_type = TransactionType.EXPENSE  # Define tipo específico
 
     # Propriedades específicas de despesa
@@ -65,11 +76,21 @@ class Expense(Transaction):
         """Getter para total de parcelas"""
         return self._total_installments
 
+    @property
+    def purchase_id(self) -> Optional[int]:
+        """ID da compra parcelada (None se gravada como uma única linha)"""
+        return self._purchase_id
+
+    @purchase_id.setter
+    def purchase_id(self, value: Optional[int]) -> None:
+        """Setter para purchase_id"""
+        self._purchase_id = value
+
     def to_dict(self) -> dict[str, any]:
         """Converte a despesa para dicionário"""
         return {
             "id": self._id,
-            "amount": self._amount,
+            "amount_cents": self._amount.cents,
             "description": self._description,
             "date": self._date.isoformat(),
             "payment_method_id": (
@@ -79,6 +100,7 @@ class Expense(Transaction):
             "category_id": self._category.id if self._category else None,
             "current_installment": self._current_installment,
             "total_installments": self._total_installments,
+            "purchase_id": self._purchase_id,
         }
 
     @classmethod
@@ -91,11 +113,12 @@ class Expense(Transaction):
 
         return cls(
             id=data.get("id"),
-            amount=data["amount"],
+            amount=Money.from_field(data, "amount"),
             description=data.get("description", ""),
             date=datetime.fromisoformat(data["date"]) if "date" in data else None,
             payment_method=data.get("payment_method"),
             category=data.get("category"),
             current_installment=data.get("current_installment", 1),
             total_installments=data.get("total_installments", 1),
+            purchase_id=data.get("purchase_id"),
         )
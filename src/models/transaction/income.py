@@ -1,6 +1,7 @@
 from src.models.transaction.transaction import Transaction
 from datetime import datetime
 from typing import Optional
+from src.models.money import Money
 from src.models.payment_method.payment_method import PaymentMethod
 from src.models.transaction.transaction_type import TransactionType
 
@@ -11,10 +12,12 @@ class Income(Transaction):
     Exemplos: Salário, reembolsos, transferências recebidas, etc.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         id: Optional[int] = None,
-        amount: float = 0.0,
+        amount: Money | float = 0.0,
         description: str = "",
         date: Optional[datetime] = None,
         payment_method: Optional[PaymentMethod] = None,
@@ -33,7 +36,7 @@ class Income(Transaction):
 
         return cls(
             id=data.get("id"),
-            amount=data["amount"],
+            amount=Money.from_field(data, "amount"),
             description=data.get("description", ""),
             date=datetime.fromisoformat(data["date"]) if "date" in data else None,
             payment_method=payment_method,
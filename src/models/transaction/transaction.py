@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import Optional
+from src.models.money import Money
 from src.models.payment_method.payment_method import PaymentMethod
 
 
@@ -10,10 +11,19 @@ class Transaction(ABC):
     Pode ser uma despesa (Expense) ou receita (Income).
     """
 
+    __slots__ = (
+        "_id",
+        "_amount",
+        "_description",
+        "_date",
+        "_payment_method",
+        "_transaction_type",
+    )
+
     def __init__(
         self,
         id: Optional[int] = None,
-        amount: float = 0.0,
+        amount: Money | float = 0.0,
         description: str = "",
         date: Optional[datetime] = None,
         payment_method: Optional[PaymentMethod] = None,
@@ -22,13 +32,13 @@ class Transaction(ABC):
         Inicializa uma transação com dados básicos.
 
         Args:
-            amount: Valor da transação (deve ser positivo)
+            amount: Valor da transação em reais (deve ser positivo)
             description: Descrição/observação
             date: Data (usa data atual se não informada)
             payment_method: Método de pagamento associado
         """
         self._id = id
-        self._amount = amount
+        self._amount = Money(amount)
         self._description = description
         self._date = date or datetime.now()  # Data atual se não informada
         self._payment_method = payment_method
@@ -46,13 +56,14 @@ class Transaction(ABC):
         self._id = value
 
     @property
-    def amount(self) -> float:
+    def amount(self) -> Money:
         """Getter para valor da transação"""
         return self._amount
 
     @amount.setter
-    def amount(self, value: float) -> None:
+    def amount(self, value: Money | float) -> None:
         """Setter para amount (valida se é positivo)"""
+        value = Money(value)
         if value <= 0:
             raise ValueError("Valor da transação deve ser positivo")
         self._amount = value
@@ -97,7 +108,7 @@ class Transaction(ABC):
         """Converte transação para dicionário (serialização)"""
         return {
             "id": self._id,
-            "amount": self._amount,
+            "amount_cents": self._amount.cents,
             "description": self._description,
             "date": self._date.isoformat(),
             "payment_method_id": (
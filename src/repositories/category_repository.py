@@ -1,6 +1,14 @@
-from typing import Optional
+from typing import Callable, Hashable, Optional
 from src.models.category import Category
 from src.database.db_manager import DatabaseManager
+from src.database.query_registry import QUERIES
+from src.repositories.repository_cache import RepositoryCache
+
+QUERIES.register("categories.all", "SELECT id, name FROM categories ORDER BY name;")
+QUERIES.register("categories.by_id", "SELECT id, name FROM categories WHERE id = ?;")
+QUERIES.register("categories.insert", "INSERT INTO categories (name) VALUES (?);")
+QUERIES.register("categories.update", "UPDATE categories SET name = ? WHERE id = ?;")
+QUERIES.register("categories.delete", "DELETE FROM categories WHERE id = ?;")
 
 
 class CategoryRepository:
@@ -9,14 +17,30 @@ class CategoryRepository:
     Responsável por mediar a comunicação entre os objetos Category e o banco.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        cache: Optional[RepositoryCache] = None,
+    ):
         """
         Inicializa o repositório com uma instância do gerenciador de banco de dados.
 
         Args:
             db: Gerenciador de conexão com o banco de dados
+            cache: Cache de leitura (opcional); é limpo a cada gravação
         """
-        self.db = DatabaseManager()
+        self.db = db or DatabaseManager()
+        self.cache = cache
+
+    def _read(self, key: Hashable, load: Callable):
+        """Executa a leitura pelo cache, exceto dentro de uma unidade de trabalho"""
+        if self.cache is None or self.db.in_transaction:
+            return load()
+        return self.cache.get_or_load(key, load)
+
+    def _invalidate(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate()
 
     def get_all(self) -> list[Category]:
         """
@@ -26,8 +50,8 @@ class CategoryRepository:
             Lista de objetos Category ou lista vazia se nenhuma encontrada
         """
         try:
-            query = "SELECT id, name FROM categories ORDER BY name;"
-            results = self.db.select(query)
+            query = QUERIES["categories.all"]
+            results = self._read(("all",), lambda: self.db.select(query))
             return (
                 [Category(id=row["id"], name=row["name"]) for row in results]
                 if results
@@ -47,8 +71,11 @@ class CategoryRepository:
             Objeto Category se encontrado, None caso contrário
         """
         try:
-            query = "SELECT id, name FROM categories WHERE id = ?;"
-            result = self.db.select_one(query, (category_id,))
+            query = QUERIES["categories.by_id"]
+            result = self._read(
+                ("id", category_id),
+                lambda: self.db.select_one(query, (category_id,)),
+            )
             return Category(**result) if result else None
         except Exception as e:
             Exception(f"Error getting category by ID: {str(e)}")
@@ -74,15 +101,18 @@ class CategoryRepository:
 
             if category.id:
                 # Atualização
-                query = "UPDATE categories SET name = ? WHERE id = ?;"
+                query = QUERIES["categories.update"]
                 params = (data["name"], data["id"])
                 self.db.update(query, params)
+                self._invalidate()
                 return category.id
             else:
                 # Inserção
-                query = "INSERT INTO categories (name) VALUES (?);"
+                query = QUERIES["categories.insert"]
                 params = (data["name"],)
-                return self.db.insert(query, params)
+                category_id = self.db.insert(query, params)
+                self._invalidate()
+                return category_id
         except Exception as e:
             raise Exception(f"Error saving category: {str(e)}")
 
@@ -97,7 +127,9 @@ class CategoryRepository:
             True se a categoria foi removida, False caso contrário
         """
         try:
-            query = "DELETE FROM categories WHERE id = ?;"
-            return self.db.delete(query, (category_id,)) > 0
+            query = QUERIES["categories.delete"]
+            deleted = self.db.delete(query, (category_id,)) > 0
+            self._invalidate()
+            return deleted
         except Exception as e:
             raise Exception(f"Error deleting category {category_id}: {e}")
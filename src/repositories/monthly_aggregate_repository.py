@@ -0,0 +1,79 @@
+from typing import Optional
+from src.database.db_manager import DatabaseManager
+
+
+class MonthlyAggregateRepository:
+    """
+    Repositório de manutenção da tabela monthly_aggregates.
+    A tabela é mantida pelos triggers de transactions; aqui ficam a
+    reconstrução completa e a verificação contra a tabela bruta.
+    """
+
+    # Agregação da tabela bruta, na mesma chave da monthly_aggregates
+    _RAW_AGGREGATES = """
+        SELECT substr(date, 1, 7) AS year_month, type,
+               COALESCE(category_id, 0) AS category_id,
+               COALESCE(payment_method_id, 0) AS payment_method_id,
+               SUM(amount_cents) AS total_cents, COUNT(*) AS count
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+    """
+
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        self.db = db or DatabaseManager()
+
+    def rebuild(self) -> bool:
+        """
+        Recalcula toda a tabela monthly_aggregates a partir das transações.
+
+        Returns:
+            True se a reconstrução foi concluída
+        """
+        return self.db.execute_script(
+            f"""
+            BEGIN IMMEDIATE;
+            DELETE FROM monthly_aggregates;
+            INSERT INTO monthly_aggregates
+                (year_month, type, category_id, payment_method_id, total_cents, count)
+            {self._RAW_AGGREGATES};
+            COMMIT;
+            """
+        )
+
+    def check_consistency(self) -> list[dict]:
+        """
+        Compara os agregados mantidos pelos triggers com a tabela bruta.
+
+        Returns:
+            Lista de divergências com a chave, os valores agregados
+            ("total_cents", "count") e os valores reais ("raw_total_cents",
+            "raw_count"). Os totais são inteiros, então a comparação é exata.
+            Lista vazia quando tudo confere.
+        """
+        try:
+            query = f"""
+                WITH raw AS ({self._RAW_AGGREGATES})
+                SELECT a.year_month, a.type, a.category_id, a.payment_method_id,
+                       a.total_cents, a.count, raw.total_cents AS raw_total_cents,
+                       raw.count AS raw_count
+                FROM monthly_aggregates a
+                LEFT JOIN raw
+                  ON raw.year_month = a.year_month AND raw.type = a.type
+                 AND raw.category_id = a.category_id
+                 AND raw.payment_method_id = a.payment_method_id
+                WHERE raw.count IS NULL OR raw.count <> a.count
+                   OR raw.total_cents <> a.total_cents
+                UNION ALL
+                SELECT raw.year_month, raw.type, raw.category_id,
+                       raw.payment_method_id, NULL, NULL, raw.total_cents,
+                       raw.count
+                FROM raw
+                LEFT JOIN monthly_aggregates a
+                  ON raw.year_month = a.year_month AND raw.type = a.type
+                 AND raw.category_id = a.category_id
+                 AND raw.payment_method_id = a.payment_method_id
+                WHERE a.count IS NULL;
+            """
+            return self.db.select(query)
+        except Exception as e:
+            raise Exception(f"Error checking monthly aggregates: {e}")
@@ -1,9 +1,62 @@
-from typing import Optional
+from typing import Callable, Hashable, Optional
 from src.database.db_manager import DatabaseManager
+from src.database.query_registry import QUERIES
+from src.models.money import Money
 from src.models.payment_method.payment_method import PaymentMethod
 from src.models.payment_method.credit import Credit
 from src.models.payment_method.debit import Debit
 from src.models.payment_method.payment_type import PaymentType
+from src.repositories.repository_cache import RepositoryCache
+
+_COLUMNS = "id, name, balance_cents, type, credit_limit_cents, closing_day, due_day"
+
+QUERIES.register("payment_methods.all", f"SELECT {_COLUMNS} FROM payment_methods;")
+QUERIES.register(
+    "payment_methods.by_id", f"SELECT {_COLUMNS} FROM payment_methods WHERE id = ?;"
+)
+QUERIES.register(
+    "payment_methods.insert",
+    """
+    INSERT INTO payment_methods
+    (name, balance_cents, type, credit_limit_cents, closing_day, due_day)
+    VALUES (?, ?, ?, ?, ?, ?);
+    """,
+)
+QUERIES.register(
+    "payment_methods.update",
+    """
+    UPDATE payment_methods SET
+    name = ?, balance_cents = ?, type = ?,
+    credit_limit_cents = ?, closing_day = ?, due_day = ?
+    WHERE id = ?;
+    """,
+)
+QUERIES.register(
+    "payment_methods.apply_payment",
+    """
+    UPDATE payment_methods
+    SET balance_cents = balance_cents
+        + CASE WHEN type = ? THEN ? ELSE -? END
+    WHERE id = ?
+    AND (
+        ? = 0
+        OR CASE WHEN type = ?
+                THEN COALESCE(credit_limit_cents, 0) - balance_cents
+                ELSE balance_cents
+           END >= ?
+    );
+    """,
+)
+QUERIES.register(
+    "payment_methods.adjust_balance",
+    """
+    UPDATE payment_methods
+    SET balance_cents = balance_cents
+        + CASE WHEN type = ? THEN ? ELSE -? END
+    WHERE id = ?;
+    """,
+)
+QUERIES.register("payment_methods.delete", "DELETE FROM payment_methods WHERE id = ?;")
 
 
 class PaymentMethodRepository:
@@ -12,12 +65,34 @@ class PaymentMethodRepository:
     Lida com os tipos específicos (Credit e Debit) de forma transparente.
     """
 
-    def __init__(self):
-        self.db = DatabaseManager()
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        cache: Optional[RepositoryCache] = None,
+    ):
+        """
+        Args:
+            db: Gerenciador de conexão com o banco de dados
+            cache: Cache de leitura (opcional); é limpo a cada gravação
+        """
+        self.db = db or DatabaseManager()
+        self.cache = cache
+
+    def _read(self, key: Hashable, load: Callable):
+        """Executa a leitura pelo cache, exceto dentro de uma unidade de trabalho"""
+        if self.cache is None or self.db.in_transaction:
+            return load()
+        return self.cache.get_or_load(key, load)
+
+    def _invalidate(self) -> None:
+        if self.cache is not None:
+            self.cache.invalidate()
 
-    def __create_payment_from_dict(self, data: dict) -> Optional[PaymentMethod]:
+    @staticmethod
+    def create_payment_from_dict(data: dict) -> Optional[PaymentMethod]:
         """
-        Factory method interno para criar instâncias específicas de PaymentMethod.
+        Factory method para criar instâncias específicas de PaymentMethod.
+        Também usado pelo TransactionRepository ao hidratar transações.
 
         Args:
             data: Dicionário com os dados do banco
@@ -45,14 +120,10 @@ class PaymentMethodRepository:
             Lista de PaymentMethod (Credit ou Debit) ou lista vazia
         """
         try:
-            query = """
-                SELECT id, name, balance, type, 
-                       credit_limit, closing_day, due_day 
-                FROM payment_methods;
-            """
-            results = self.db.select(query)
+            query = QUERIES["payment_methods.all"]
+            results = self._read(("all",), lambda: self.db.select(query))
             return (
-                [self.__create_payment_from_dict(row) for row in results]
+                [self.create_payment_from_dict(row) for row in results]
                 if results
                 else []
             )
@@ -70,14 +141,12 @@ class PaymentMethodRepository:
             Instância de PaymentMethod ou None se não encontrado
         """
         try:
-            query = """
-                SELECT id, name, balance, type, 
-                       credit_limit, closing_day, due_day 
-                FROM payment_methods 
-                WHERE id = ?;
-            """
-            result = self.db.select_one(query, (payment_id,))
-            return self.__create_payment_from_dict(result) if result else None
+            query = QUERIES["payment_methods.by_id"]
+            result = self._read(
+                ("id", payment_id),
+                lambda: self.db.select_one(query, (payment_id,)),
+            )
+            return self.create_payment_from_dict(result) if result else None
         except Exception as e:
             raise Exception(f"Error getting payment method by ID {payment_id}: {e}")
 
@@ -102,42 +171,104 @@ class PaymentMethodRepository:
 
             if payment.id:
                 # Atualização
-                query = """
-                    UPDATE payment_methods SET
-                    name = ?, balance = ?, type = ?,
-                    credit_limit = ?, closing_day = ?, due_day = ?
-                    WHERE id = ?;
-                """
+                query = QUERIES["payment_methods.update"]
                 params = (
                     data["name"],
-                    data["balance"],
+                    data["balance_cents"],
                     data["type"],
-                    data.get("credit_limit"),
+                    data.get("credit_limit_cents"),
                     data.get("closing_day"),
                     data.get("due_day"),
                     data["id"],
                 )
                 self.db.update(query, params)
+                self._invalidate()
                 return payment.id
             else:
                 # Inserção
-                query = """
-                    INSERT INTO payment_methods 
-                    (name, balance, type, credit_limit, closing_day, due_day)
-                    VALUES (?, ?, ?, ?, ?, ?);
-                """
+                query = QUERIES["payment_methods.insert"]
                 params = (
                     data["name"],
-                    data["balance"],
+                    data["balance_cents"],
                     data["type"],
-                    data.get("credit_limit"),
+                    data.get("credit_limit_cents"),
                     data.get("closing_day"),
                     data.get("due_day"),
                 )
-                return self.db.insert(query, params)
+                payment_id = self.db.insert(query, params)
+                self._invalidate()
+                return payment_id
         except Exception as e:
             raise Exception(f"Error saving payment method: {e}")
 
+    def apply_payment(
+        self, payment_id: int, amount: Money | float, is_expense: bool
+    ) -> bool:
+        """
+        Aplica um pagamento direto no saldo, sem ler o método antes.
+
+        Segue as regras de Credit.process_payment e Debit.process_payment:
+        despesas no crédito somam ao saldo utilizado e exigem limite
+        disponível; no débito, subtraem do saldo e exigem saldo suficiente.
+        Receitas fazem o movimento inverso e são sempre aceitas.
+
+        Args:
+            payment_id: ID do método de pagamento
+            amount: Valor positivo do pagamento, em reais
+            is_expense: True para despesa, False para receita
+
+        Returns:
+            True se o saldo foi atualizado, False se recusado ou não encontrado
+        """
+        try:
+            query = QUERIES["payment_methods.apply_payment"]
+            cents = Money(amount).cents
+            signed_amount = cents if is_expense else -cents
+            params = (
+                PaymentType.CREDIT,
+                signed_amount,
+                signed_amount,
+                payment_id,
+                int(is_expense),
+                PaymentType.CREDIT,
+                cents,
+            )
+            applied = self.db.update(query, params) > 0
+            if applied:
+                self._invalidate()
+            return applied
+        except Exception as e:
+            raise Exception(f"Error applying payment to method {payment_id}: {e}")
+
+    def adjust_balances(self, deltas: dict[int, int]) -> int:
+        """
+        Aplica variações líquidas de saldo em vários métodos de uma vez.
+
+        Cada variação usa o sinal de despesa: positiva aumenta o saldo
+        utilizado no crédito e reduz o saldo no débito. Limites e saldos
+        não são verificados, pois o uso é a importação de histórico.
+
+        Args:
+            deltas: Variação líquida em centavos por ID de método de pagamento
+
+        Returns:
+            Número de métodos atualizados
+        """
+        try:
+            query = QUERIES["payment_methods.adjust_balance"]
+            updated = self.db.execute_many(
+                query,
+                [
+                    (PaymentType.CREDIT, delta, delta, payment_id)
+                    for payment_id, delta in deltas.items()
+                    if delta
+                ],
+            )
+            self._invalidate()
+            return updated
+        except Exception as e:
+            raise Exception(f"Error adjusting payment method balances: {e}")
+
     def delete(self, payment_id: int) -> bool:
         """
         Remove um método de pagamento do banco.
@@ -149,7 +280,9 @@ class PaymentMethodRepository:
             True se removido com sucesso, False caso contrário
         """
         try:
-            query = "DELETE FROM payment_methods WHERE id = ?;"
-            return self.db.delete(query, (payment_id,)) > 0
+            query = QUERIES["payment_methods.delete"]
+            deleted = self.db.delete(query, (payment_id,)) > 0
+            self._invalidate()
+            return deleted
         except Exception as e:
             raise Exception(f"Error deleting payment method {payment_id}: {e}")
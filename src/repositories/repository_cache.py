@@ -0,0 +1,105 @@
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, TypeVar
+from src.database.data_version_watcher import DataVersionWatcher
+
+T = TypeVar("T")
+
+
+class RepositoryCache:
+    """
+    Cache LRU de leitura para repositórios de tabelas pequenas.
+
+    Guarda as linhas lidas do banco (não os objetos de modelo, que são
+    mutáveis) e descarta tudo quando o repositório grava ou quando o
+    DataVersionWatcher indica que outra conexão gravou no banco.
+    """
+
+    def __init__(
+        self, max_size: int = 256, watcher: Optional[DataVersionWatcher] = None
+    ):
+        """
+        Args:
+            max_size: Quantidade máxima de entradas antes de descartar
+                      as usadas há mais tempo
+            watcher: Detector de gravações externas (opcional)
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self._max_size = max_size
+        self._watcher = watcher
+        self._entries: OrderedDict[Hashable, object] = OrderedDict()
+        self._lock = threading.Lock()
+        # Muda a cada invalidação; leituras iniciadas antes não são guardadas
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._external_invalidations = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        """Contadores de uso do cache"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "external_invalidations": self._external_invalidations,
+                "size": len(self._entries),
+            }
+
+    def __sync(self) -> None:
+        """Descarta tudo se outra conexão gravou no banco (com o lock obtido)"""
+        if self._watcher is not None and self._watcher.changed():
+            self._entries.clear()
+            self._generation += 1
+            self._external_invalidations += 1
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], T]) -> T:
+        """
+        Retorna o valor em cache ou o carrega com `loader`.
+
+        Resultados None não são guardados, assim como os carregados
+        enquanto alguma invalidação acontecia.
+        """
+        with self._lock:
+            self.__sync()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if value is not None and generation == self._generation:
+                self._entries[key] = value
+                if len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return value
+
+    def invalidate(self) -> None:
+        """Descarta todas as entradas"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def close(self) -> None:
+        """Descarta as entradas e fecha o watcher"""
+        self.invalidate()
+        if self._watcher is not None:
+            self._watcher.close()
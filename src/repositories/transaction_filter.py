@@ -0,0 +1,241 @@
+from datetime import date, datetime, timedelta
+from typing import Iterable, Optional
+from src.models.money import Money
+from src.models.transaction.transaction_type import TransactionType
+from utils.period import Period
+
+
+class TransactionFilter:
+    """
+    Filtro combinável de transações, compilado para SQL parametrizado.
+
+    Cada método devolve um novo filtro, então um filtro base pode ser
+    reaproveitado e especializado sem ser alterado:
+
+        despesas = TransactionFilter().of_types(TransactionType.EXPENSE)
+        maio = despesas.within(Period.month(2024, 5)).sorted_by("amount")
+
+    As condições são comparações diretas com as colunas (igualdade, IN e
+    intervalos), na forma que os índices de transactions atendem. O mesmo
+    filtro serve às listagens (find, get_page, search) e às agregações.
+    """
+
+    # Ordenações aceitas, mapeadas para a coluna; o ID desempata
+    SORTS = {"date": "date", "amount": "amount_cents"}
+
+    __slots__ = (
+        "_period",
+        "_until",
+        "_types",
+        "_category_ids",
+        "_payment_method_ids",
+        "_min_cents",
+        "_max_cents",
+        "_installments",
+        "_sort",
+        "_descending",
+        "_limit",
+    )
+
+    def __init__(self):
+        """Cria um filtro vazio: todas as transações, mais recentes primeiro"""
+        self._period: Optional[Period] = None
+        self._until: Optional[date] = None
+        self._types: Optional[tuple[str, ...]] = None
+        self._category_ids: Optional[tuple[int, ...]] = None
+        self._payment_method_ids: Optional[tuple[int, ...]] = None
+        self._min_cents: Optional[int] = None
+        self._max_cents: Optional[int] = None
+        self._installments: Optional[bool] = None
+        self._sort = "date"
+        self._descending = True
+        self._limit: Optional[int] = None
+
+    @classmethod
+    def coerce(
+        cls, filters: "TransactionFilter | dict[str, any] | None"
+    ) -> "TransactionFilter":
+        """
+        Aceita um TransactionFilter ou o dict de igualdades usado antes dele.
+
+        Raises:
+            ValueError: Se o dict tiver uma chave desconhecida
+        """
+        if isinstance(filters, TransactionFilter):
+            return filters
+        result = cls()
+        for key, value in (filters or {}).items():
+            if key == "type":
+                result = result.of_types(value)
+            elif key == "category_id":
+                result = result.in_categories([value])
+            elif key == "payment_method_id":
+                result = result.with_payment_methods([value])
+            else:
+                raise ValueError(f"Unknown transaction filter: {key}")
+        return result
+
+    def _copy(self, **changes) -> "TransactionFilter":
+        """Cópia do filtro com os atributos informados substituídos"""
+        copy = TransactionFilter.__new__(TransactionFilter)
+        for name in self.__slots__:
+            setattr(copy, name, changes.get(name[1:], getattr(self, name)))
+        return copy
+
+    def within(self, period: Optional[Period]) -> "TransactionFilter":
+        """Só transações dentro do período (None remove o filtro)"""
+        return self._copy(period=period)
+
+    def until(self, day: Optional[date]) -> "TransactionFilter":
+        """
+        Só transações até o dia informado, inclusive (None remove o limite).
+
+        Deixa de fora as parcelas agendadas para depois desse dia.
+        """
+        if isinstance(day, datetime):
+            day = day.date()
+        return self._copy(until=day)
+
+    def of_types(self, *types: str) -> "TransactionFilter":
+        """Só transações dos tipos informados (TransactionType)"""
+        for transaction_type in types:
+            if not TransactionType.validate(transaction_type):
+                raise ValueError(f"Invalid transaction type: {transaction_type}")
+        return self._copy(types=tuple(dict.fromkeys(types)) or None)
+
+    def in_categories(self, category_ids: Iterable[int]) -> "TransactionFilter":
+        """Só transações de uma das categorias (conjunto vazio não casa nada)"""
+        return self._copy(category_ids=tuple(dict.fromkeys(category_ids)))
+
+    def with_payment_methods(
+        self, payment_method_ids: Iterable[int]
+    ) -> "TransactionFilter":
+        """Só transações de um dos métodos de pagamento"""
+        return self._copy(payment_method_ids=tuple(dict.fromkeys(payment_method_ids)))
+
+    def amount_between(
+        self,
+        minimum: "Money | int | float | str | None" = None,
+        maximum: "Money | int | float | str | None" = None,
+    ) -> "TransactionFilter":
+        """Só transações com valor entre os limites, ambos inclusivos"""
+        min_cents = Money(minimum).cents if minimum is not None else None
+        max_cents = Money(maximum).cents if maximum is not None else None
+        if min_cents is not None and max_cents is not None and min_cents > max_cents:
+            raise ValueError("Minimum amount must not exceed the maximum")
+        return self._copy(min_cents=min_cents, max_cents=max_cents)
+
+    def installments(self, installments: Optional[bool]) -> "TransactionFilter":
+        """
+        Filtra pelo parcelamento.
+
+        Args:
+            installments: True para compras parceladas, False para à vista
+                          e None para ambas
+        """
+        return self._copy(installments=installments)
+
+    def sorted_by(self, field: str, descending: bool = True) -> "TransactionFilter":
+        """Ordena por "date" ou "amount" (o ID desempata no mesmo sentido)"""
+        if field not in self.SORTS:
+            raise ValueError(f"Unknown transaction sort: {field}")
+        return self._copy(sort=field, descending=descending)
+
+    def limited(self, limit: Optional[int]) -> "TransactionFilter":
+        """Quantidade máxima de transações nas listagens (None: sem limite)"""
+        if limit is not None and limit <= 0:
+            raise ValueError("Limit must be positive")
+        return self._copy(limit=limit)
+
+    @property
+    def period(self) -> Optional[Period]:
+        return self._period
+
+    @property
+    def sort(self) -> tuple[str, bool]:
+        """Campo de ordenação e se é decrescente"""
+        return self._sort, self._descending
+
+    @property
+    def limit(self) -> Optional[int]:
+        return self._limit
+
+    @staticmethod
+    def _member(column: str, values: tuple) -> tuple[str, list]:
+        """
+        Igualdade para um valor, IN para vários; vazio nunca é verdadeiro.
+
+        A lista do IN é completada até a próxima potência de dois repetindo
+        o último valor, então 3 e 4 categorias geram o mesmo SQL e poucas
+        variações ocupam o cache de instruções compiladas das conexões.
+        """
+        if not values:
+            return "0", []
+        if len(values) == 1:
+            return f"{column} = ?", list(values)
+        size = 1 << (len(values) - 1).bit_length()
+        padded = list(values) + [values[-1]] * (size - len(values))
+        return f"{column} IN ({', '.join('?' * size)})", padded
+
+    def conditions(self, alias: str = "t") -> tuple[list[str], list[any]]:
+        """
+        Compila as condições do filtro.
+
+        Args:
+            alias: Apelido da tabela transactions na consulta
+
+        Returns:
+            Tupla com a lista de condições (para juntar com AND) e os
+            parâmetros na mesma ordem
+        """
+        prefix = f"{alias}." if alias else ""
+        clauses: list[str] = []
+        params: list[any] = []
+
+        for column, values in (
+            ("type", self._types),
+            ("category_id", self._category_ids),
+            ("payment_method_id", self._payment_method_ids),
+        ):
+            if values is not None:
+                clause, values_params = self._member(prefix + column, values)
+                clauses.append(clause)
+                params.extend(values_params)
+
+        if self._period is not None:
+            clause, period_params = self._period.sql(f"{prefix}date")
+            clauses.append(clause)
+            params.extend(period_params)
+
+        if self._until is not None:
+            clauses.append(f"{prefix}date < ?")
+            params.append((self._until + timedelta(days=1)).isoformat())
+
+        if self._min_cents is not None:
+            clauses.append(f"{prefix}amount_cents >= ?")
+            params.append(self._min_cents)
+        if self._max_cents is not None:
+            clauses.append(f"{prefix}amount_cents <= ?")
+            params.append(self._max_cents)
+
+        if self._installments is not None:
+            operator = ">" if self._installments else "<="
+            clauses.append(f"{prefix}total_installments {operator} 1")
+
+        return clauses, params
+
+    def where(self, alias: str = "t") -> tuple[str, list[any]]:
+        """Cláusula WHERE completa (ou vazia) e seus parâmetros"""
+        clauses, params = self.conditions(alias)
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def order_by(self, alias: str = "t") -> str:
+        """Cláusula ORDER BY da ordenação escolhida"""
+        prefix = f"{alias}." if alias else ""
+        direction = "DESC" if self._descending else "ASC"
+        column = self.SORTS[self._sort]
+        return f"ORDER BY {prefix}{column} {direction}, {prefix}id {direction}"
+
+    def __repr__(self) -> str:
+        clauses, params = self.conditions()
+        return f"TransactionFilter({' AND '.join(clauses) or 'all'}; {params})"
@@ -1,12 +1,20 @@
-from typing import Optional
-from datetime import datetime
+import re
+from typing import Iterable, Mapping, Optional
+from datetime import date, datetime, timedelta
 from src.database.db_manager import DatabaseManager
+from src.database.query_registry import QUERIES
+from src.models.category import Category
+from src.models.dashboard_snapshot import CategoryTotal, DashboardSnapshot
+from src.models.installment_plan import InstallmentPlan
+from src.models.money import Money
+from src.models.payment_method.payment_method import PaymentMethod
 from src.models.transaction.transaction import Transaction
 from src.models.transaction.income import Income
 from src.models.transaction.expense import Expense
 from src.models.transaction.transaction_type import TransactionType
-from src.services.payment_method_service import PaymentMethodService
-from src.services.category_service import CategoryService
+from src.repositories.payment_method_repository import PaymentMethodRepository
+from src.repositories.transaction_filter import TransactionFilter
+from utils.period import Period
 
 
 class TransactionRepository:
@@ -15,48 +23,161 @@ class TransactionRepository:
     Lida com os tipos Income e Expense de forma transparente.
     """
 
-    def __init__(self):
-        self.db = DatabaseManager()
-        self.payment_method_service = PaymentMethodService()
-        self.category_service = CategoryService()
+    # Transações já unidas ao método de pagamento e à categoria,
+    # para hidratar tudo com uma única consulta
+    _SELECT_WITH_RELATIONS = """
+        SELECT t.id, t.amount_cents, t.description, t.date,
+               t.payment_method_id, t.category_id,
+               t.current_installment, t.total_installments, t.type,
+               t.purchase_id,
+               pm.name AS pm_name, pm.balance_cents AS pm_balance_cents,
+               pm.type AS pm_type, pm.credit_limit_cents AS pm_credit_limit_cents,
+               pm.closing_day AS pm_closing_day, pm.due_day AS pm_due_day,
+               c.name AS category_name
+        FROM transactions t
+        LEFT JOIN payment_methods pm ON pm.id = t.payment_method_id
+        LEFT JOIN categories c ON c.id = t.category_id
+    """
 
-    def __create_transaction_from_dict(self, data: dict) -> Optional[Transaction]:
-        if not data or "type" not in data:
+    QUERIES.register(
+        "transactions.all", f"{_SELECT_WITH_RELATIONS} ORDER BY t.date DESC;"
+    )
+    QUERIES.register("transactions.by_id", f"{_SELECT_WITH_RELATIONS} WHERE t.id = ?;")
+    QUERIES.register(
+        "transactions.insert",
+        """
+        INSERT INTO transactions (
+            amount_cents, description, date, payment_method_id,
+            category_id, current_installment, total_installments, type,
+            purchase_id
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """,
+    )
+    QUERIES.register(
+        "transactions.update",
+        """
+        UPDATE transactions SET
+        amount_cents = ?, description = ?, date = ?,
+        payment_method_id = ?, category_id = ?,
+        current_installment = ?, total_installments = ?
+        WHERE id = ?;
+        """,
+    )
+    QUERIES.register("transactions.delete", "DELETE FROM transactions WHERE id = ?;")
+    QUERIES.register(
+        "purchases.insert",
+        """
+        INSERT INTO purchases (total_cents, installments, first_date, description)
+        VALUES (?, ?, ?, ?);
+        """,
+    )
+    QUERIES.register(
+        "transactions.purchase_ids",
+        """
+        SELECT id FROM transactions
+        WHERE purchase_id = ?
+        ORDER BY current_installment;
+        """,
+    )
+    QUERIES.register(
+        "transactions.purchase",
+        f"""
+        {_SELECT_WITH_RELATIONS}
+        WHERE t.purchase_id = ?
+        ORDER BY t.current_installment;
+        """,
+    )
+    QUERIES.register(
+        "transactions.installments_due",
+        f"""
+        {_SELECT_WITH_RELATIONS}
+        WHERE t.purchase_id IS NOT NULL
+        AND t.date >= ? AND t.date < ?
+        ORDER BY t.date, t.id;
+        """,
+    )
+    QUERIES.register(
+        "transactions.delete_purchase",
+        "DELETE FROM transactions WHERE purchase_id = ?;",
+    )
+    QUERIES.register("purchases.delete", "DELETE FROM purchases WHERE id = ?;")
+
+    def __init__(self, db: Optional[DatabaseManager] = None):
+        self.db = db or DatabaseManager()
+
+    def __get_payment_method(
+        self, data: Mapping, cache: dict[int, PaymentMethod]
+    ) -> Optional[PaymentMethod]:
+        """Monta o método de pagamento da linha, reaproveitando os já criados"""
+        payment_id = data["payment_method_id"]
+        if not payment_id or data["pm_type"] is None:
+            return None
+        if payment_id not in cache:
+            cache[payment_id] = PaymentMethodRepository.create_payment_from_dict(
+                {
+                    "id": payment_id,
+                    "name": data["pm_name"],
+                    "balance_cents": data["pm_balance_cents"],
+                    "type": data["pm_type"],
+                    "credit_limit_cents": data["pm_credit_limit_cents"],
+                    "closing_day": data["pm_closing_day"],
+                    "due_day": data["pm_due_day"],
+                }
+            )
+        return cache[payment_id]
+
+    def __get_category(
+        self, data: Mapping, cache: dict[int, Category]
+    ) -> Optional[Category]:
+        """Monta a categoria da linha, reaproveitando as já criadas"""
+        category_id = data["category_id"]
+        if not category_id or data["category_name"] is None:
+            return None
+        if category_id not in cache:
+            cache[category_id] = Category(id=category_id, name=data["category_name"])
+        return cache[category_id]
+
+    def __create_transaction_from_dict(
+        self,
+        data: Mapping,
+        payment_methods: Optional[dict[int, PaymentMethod]] = None,
+        categories: Optional[dict[int, Category]] = None,
+    ) -> Optional[Transaction]:
+        """
+        Monta a transação a partir de uma linha de _SELECT_WITH_RELATIONS.
+
+        Aceita tanto dicts quanto sqlite3.Row, por isso lê as colunas só por
+        índice (sqlite3.Row não tem get() e seu "in" compara valores).
+        """
+        if not data:
             return None
 
         try:
-            payment_method = None
-            if data.get("payment_method_id"):
-                payment_method = self.payment_method_service.get_payment_method_by_id(
-                    data["payment_method_id"]
-                )
-
-            category = None
-            if data.get("category_id"):
-                category = self.category_service.get_category_by_id(data["category_id"])
+            payment_method = self.__get_payment_method(
+                data, payment_methods if payment_methods is not None else {}
+            )
 
             if data["type"] == TransactionType.INCOME:
                 return Income(
-                    id=data.get("id"),
-                    amount=data["amount"],
-                    description=data.get("description", ""),
-                    date=(
-                        datetime.fromisoformat(data["date"]) if "date" in data else None
-                    ),
+                    id=data["id"],
+                    amount=Money.from_cents(data["amount_cents"]),
+                    description=data["description"] or "",
+                    date=datetime.fromisoformat(data["date"]) if data["date"] else None,
                     payment_method=payment_method,
                 )
             elif data["type"] == TransactionType.EXPENSE:
                 return Expense(
-                    id=data.get("id"),
-                    amount=data["amount"],
-                    description=data.get("description", ""),
-                    date=(
-                        datetime.fromisoformat(data["date"]) if "date" in data else None
-                    ),
+                    id=data["id"],
+                    amount=Money.from_cents(data["amount_cents"]),
+                    description=data["description"] or "",
+                    date=datetime.fromisoformat(data["date"]) if data["date"] else None,
                     payment_method=payment_method,
-                    category=category,
-                    current_installment=data.get("current_installment", 1),
-                    total_installments=data.get("total_installments", 1),
+                    category=self.__get_category(
+                        data, categories if categories is not None else {}
+                    ),
+                    current_installment=data["current_installment"] or 1,
+                    total_installments=data["total_installments"] or 1,
+                    purchase_id=data["purchase_id"],
                 )
             return None
         except Exception as e:
@@ -64,36 +185,251 @@ class TransactionRepository:
 
     def get_all(self) -> list[Transaction]:
         try:
-            query = """
-                SELECT id, amount, description, date,
-                       payment_method_id, category_id,
-                       current_installment, total_installments, type
-                FROM transactions
-                ORDER BY date DESC;
-            """
-            results = self.db.select(query)
-            return (
-                [self.__create_transaction_from_dict(row) for row in results]
-                if results
-                else []
-            )
+            query = QUERIES["transactions.all"]
+            return self._hydrate(self.db.select_iter(query))
         except Exception as e:
             raise Exception(f"Error getting all transactions: {e}")
 
     def get_by_id(self, transaction_id: int) -> Optional[Transaction]:
         try:
-            query = """
-                SELECT id, amount, description, date,
-                       payment_method_id, category_id,
-                       current_installment, total_installments, type
-                FROM transactions
-                WHERE id = ?;
-            """
+            query = QUERIES["transactions.by_id"]
             result = self.db.select_one(query, (transaction_id,))
             return self.__create_transaction_from_dict(result) if result else None
         except Exception as e:
             raise Exception(f"Error getting transaction by ID {transaction_id}: {e}")
 
+    def _hydrate(self, results: Iterable[Mapping]) -> list[Transaction]:
+        """Monta as transações de um resultado de _SELECT_WITH_RELATIONS"""
+        payment_methods: dict[int, PaymentMethod] = {}
+        categories: dict[int, Category] = {}
+        return [
+            self.__create_transaction_from_dict(row, payment_methods, categories)
+            for row in results
+        ]
+
+    def find(self, filters: Optional[TransactionFilter] = None) -> list[Transaction]:
+        """
+        Lista as transações que atendem ao filtro, na ordem e no limite dele.
+
+        Args:
+            filters: Filtro compilado para uma única consulta (padrão: todas)
+
+        Returns:
+            Lista de transações
+        """
+        filters = filters or TransactionFilter()
+        where, params = filters.where("t")
+        limit = "LIMIT ?" if filters.limit is not None else ""
+        if filters.limit is not None:
+            params.append(filters.limit)
+
+        try:
+            query = f"""
+                {self._SELECT_WITH_RELATIONS}
+                {where}
+                {filters.order_by("t")}
+                {limit};
+            """
+            return self._hydrate(
+                self.db.select_iter(query, params, batch_size=filters.limit or 500)
+            )
+        except Exception as e:
+            raise Exception(f"Error finding transactions: {e}")
+
+    # Agrupamentos aceitos por aggregate, mapeados para a expressão SQL
+    _AGGREGATE_GROUPS = {
+        "type": "t.type",
+        "category": "t.category_id",
+        "payment_method": "t.payment_method_id",
+        "month": "substr(t.date, 1, 7)",
+    }
+
+    def aggregate(
+        self,
+        filters: Optional[TransactionFilter] = None,
+        group_by: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Soma e conta as transações que atendem ao filtro.
+
+        Usa só as condições do filtro; ordenação e limite valem apenas para
+        as listagens.
+
+        Args:
+            filters: O mesmo filtro aceito por find (padrão: todas)
+            group_by: "type", "category", "payment_method", "month" ou None
+
+        Returns:
+            Um dict {"group", "total", "count"} por grupo, em ordem de grupo.
+            Sem group_by, uma única linha com "group" None.
+        """
+        if group_by is not None and group_by not in self._AGGREGATE_GROUPS:
+            raise ValueError(f"Unknown transaction grouping: {group_by}")
+        where, params = (filters or TransactionFilter()).where("t")
+        group = self._AGGREGATE_GROUPS.get(group_by, "NULL")
+        grouping = f"GROUP BY {group} ORDER BY {group}" if group_by else ""
+
+        try:
+            query = f"""
+                SELECT
+                    {group} AS grp,
+                    SUM(t.amount_cents) AS total_cents,
+                    COUNT(*) AS count
+                FROM transactions t
+                {where}
+                {grouping};
+            """
+            return [
+                {
+                    "group": row["grp"],
+                    "total": Money.from_cents(row["total_cents"] or 0),
+                    "count": row["count"],
+                }
+                for row in self.db.select(query, params)
+            ]
+        except Exception as e:
+            raise Exception(f"Error aggregating transactions: {e}")
+
+    def get_page(
+        self,
+        after_date: Optional[datetime | str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        filters: Optional[TransactionFilter | dict[str, any]] = None,
+    ) -> list[Transaction]:
+        """
+        Recupera uma página de transações, da mais recente para a mais antiga.
+
+        Usa paginação por chave (date, id): a próxima página começa logo após
+        a última transação recebida, então o custo por página é constante e
+        inserções feitas entre as chamadas não duplicam nem pulam linhas.
+
+        Args:
+            after_date: Data da última transação da página anterior
+            after_id: ID da última transação da página anterior
+            limit: Quantidade máxima de transações na página
+            filters: TransactionFilter (só as condições são usadas) ou dict
+                     de igualdades por "type", "category_id" ou
+                     "payment_method_id"
+
+        Returns:
+            Lista de transações da página (vazia ao fim do histórico)
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+        if (after_date is None) != (after_id is None):
+            raise ValueError("after_date and after_id must be given together")
+
+        clauses, params = TransactionFilter.coerce(filters).conditions("t")
+
+        if after_date is not None:
+            if isinstance(after_date, datetime):
+                after_date = after_date.isoformat()
+            clauses.append("(t.date, t.id) < (?, ?)")
+            params.extend((after_date, after_id))
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        try:
+            query = f"""
+                {self._SELECT_WITH_RELATIONS}
+                {where}
+                ORDER BY t.date DESC, t.id DESC
+                LIMIT ?;
+            """
+            results = self.db.select_iter(query, (*params, limit), batch_size=limit)
+            return self._hydrate(results)
+        except Exception as e:
+            raise Exception(f"Error getting transactions page: {e}")
+
+    @staticmethod
+    def _match_expression(text: str) -> Optional[str]:
+        """
+        Converte o texto digitado em uma consulta FTS5 segura.
+
+        Cada palavra vira um prefixo entre aspas ("merc"*), então operadores
+        e aspas digitados pelo usuário não são interpretados pelo FTS5.
+        Todas as palavras precisam aparecer na descrição.
+        """
+        words = re.findall(r"\w+", text or "")
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    # Correspondências mais recentes ordenadas por relevância em cada busca
+    SEARCH_WINDOW = 500
+
+    def search(
+        self,
+        text: str,
+        filters: Optional[TransactionFilter | dict[str, any]] = None,
+        limit: int = 20,
+    ) -> list[Transaction]:
+        """
+        Busca transações pela descrição, das mais relevantes para as menos.
+
+        O índice FTS5 é percorrido do ID mais novo para o mais antigo e só
+        as SEARCH_WINDOW primeiras correspondências (já filtradas) são
+        ordenadas pelo bm25. Assim o custo não cresce com o histórico,
+        mesmo para prefixos curtos que aparecem em quase toda transação.
+
+        Args:
+            text: Palavras (ou começos de palavras) procuradas
+            filters: TransactionFilter (só as condições são usadas) ou dict
+                     de igualdades por "type", "category_id" ou
+                     "payment_method_id"
+            limit: Quantidade máxima de resultados
+
+        Returns:
+            Transações ordenadas por relevância (bm25) e, no empate, pela data
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+        match = self._match_expression(text)
+        if match is None:
+            return []
+
+        clauses, params = TransactionFilter.coerce(filters).conditions("t")
+        clauses.insert(0, "transactions_fts MATCH ?")
+        params.insert(0, match)
+
+        try:
+            query = f"""
+                WITH hits AS MATERIALIZED (
+                    SELECT transactions_fts.rowid AS id, transactions_fts.rank
+                    FROM transactions_fts
+                    JOIN transactions t ON t.id = transactions_fts.rowid
+                    WHERE {' AND '.join(clauses)}
+                    ORDER BY transactions_fts.rowid DESC
+                    LIMIT ?
+                )
+                {self._SELECT_WITH_RELATIONS}
+                JOIN hits ON hits.id = t.id
+                ORDER BY hits.rank, t.date DESC
+                LIMIT ?;
+            """
+            window = max(self.SEARCH_WINDOW, limit)
+            results = self.db.select_iter(
+                query, (*params, window, limit), batch_size=limit
+            )
+            return self._hydrate(results)
+        except Exception as e:
+            raise Exception(f"Error searching transactions: {e}")
+
+    def __insert_params(self, data: dict) -> tuple:
+        """Parâmetros do INSERT a partir de Transaction.to_dict()"""
+        return (
+            data["amount_cents"],
+            data["description"],
+            data["date"],
+            data["payment_method_id"],
+            data.get("category_id"),
+            data.get("current_installment", 1),
+            data.get("total_installments", 1),
+            data["type"],
+            data.get("purchase_id"),
+        )
+
     def save(self, transaction: Transaction) -> int:
         if not isinstance(transaction, Transaction):
             raise ValueError("Invalid transaction object")
@@ -109,15 +445,9 @@ class TransactionRepository:
 
             if transaction.id:
                 # Atualização
-                query = """
-                    UPDATE transactions SET
-                    amount = ?, description = ?, date = ?,
-                    payment_method_id = ?, category_id = ?,
-                    current_installment = ?, total_installments = ?
-                    WHERE id = ?;
-                """
+                query = QUERIES["transactions.update"]
                 params = (
-                    data["amount"],
+                    data["amount_cents"],
                     data["description"],
                     data["date"],
                     data.get("payment_method_id", None),
@@ -130,62 +460,161 @@ class TransactionRepository:
                 return transaction.id
             else:
                 # Inserção
-                query = """
-                    INSERT INTO transactions (
-                        amount, description, date, payment_method_id,
-                        category_id, current_installment, total_installments, type
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?);
-                """
-                params = (
-                    data["amount"],
-                    data["description"],
-                    data["date"],
-                    data["payment_method_id"],
-                    data.get("category_id"),
-                    data.get("current_installment", 1),
-                    data.get("total_installments", 1),
-                    data["type"],
-                )
-                return self.db.insert(query, params)
+                query = QUERIES["transactions.insert"]
+                return self.db.insert(query, self.__insert_params(data))
         except Exception as e:
             raise Exception(f"Error saving transaction: {e}")
 
+    def save_many(self, transactions: Iterable[Transaction]) -> int:
+        """
+        Insere várias transações novas com um único executemany.
+
+        Args:
+            transactions: Transações ainda sem ID
+
+        Returns:
+            Número de transações inseridas
+        """
+        try:
+            return self.db.insert_many(
+                QUERIES["transactions.insert"],
+                (self.__insert_params(t.to_dict()) for t in transactions),
+            )
+        except Exception as e:
+            raise Exception(f"Error saving transactions: {e}")
+
+    def save_purchase(
+        self, expense: Expense, plan: InstallmentPlan
+    ) -> tuple[int, list[int]]:
+        """
+        Grava uma compra parcelada: a linha de purchases e uma transação
+        por parcela, inseridas com um único executemany.
+
+        Tudo acontece em uma única transação do banco, então uma compra em
+        360 parcelas custa três chamadas ao banco e não 360.
+
+        Args:
+            expense: Despesa com o valor total; recebe o purchase_id gerado
+            plan: Divisão do total em parcelas
+
+        Returns:
+            Tupla com o ID da compra e os IDs das parcelas, em ordem
+        """
+        try:
+            with self.db.transaction():
+                purchase_id = self.db.insert(
+                    QUERIES["purchases.insert"],
+                    (
+                        plan.total.cents,
+                        plan.installments,
+                        plan.first_date.isoformat(),
+                        expense.description,
+                    ),
+                )
+                expense.purchase_id = purchase_id
+                self.db.insert_many(
+                    QUERIES["transactions.insert"],
+                    (self.__insert_params(e.to_dict()) for e in plan.expand(expense)),
+                )
+                ids = [
+                    row["id"]
+                    for row in self.db.select(
+                        QUERIES["transactions.purchase_ids"], (purchase_id,)
+                    )
+                ]
+            return purchase_id, ids
+        except Exception as e:
+            raise Exception(f"Error saving installment purchase: {e}")
+
+    def get_purchase(self, purchase_id: int) -> list[Transaction]:
+        """Parcelas de uma compra, da primeira à última"""
+        try:
+            return self._hydrate(
+                self.db.select_iter(QUERIES["transactions.purchase"], (purchase_id,))
+            )
+        except Exception as e:
+            raise Exception(f"Error getting purchase {purchase_id}: {e}")
+
+    def get_installments_due(
+        self, period: Optional[Period] = None
+    ) -> list[Transaction]:
+        """
+        Parcelas de compras parceladas que vencem no período.
+
+        Lê só as linhas de idx_transactions_installments_date, o índice
+        parcial que contém apenas parcelas.
+
+        Args:
+            period: Período de vencimento (padrão: mês atual)
+
+        Returns:
+            Parcelas ordenadas por data
+        """
+        try:
+            return self._hydrate(
+                self.db.select_iter(
+                    QUERIES["transactions.installments_due"],
+                    (period or Period.current_month()).bounds(),
+                )
+            )
+        except Exception as e:
+            raise Exception(f"Error getting installments due: {e}")
+
+    def delete_purchase(self, purchase_id: int) -> int:
+        """
+        Remove a compra e todas as suas parcelas.
+
+        Returns:
+            Número de parcelas removidas
+        """
+        try:
+            with self.db.transaction():
+                deleted = self.db.delete(
+                    QUERIES["transactions.delete_purchase"], (purchase_id,)
+                )
+                self.db.delete(QUERIES["purchases.delete"], (purchase_id,))
+            return deleted
+        except Exception as e:
+            raise Exception(f"Error deleting purchase {purchase_id}: {e}")
+
     def delete(self, transaction_id: int) -> bool:
         try:
-            query = "DELETE FROM transactions WHERE id = ?;"
+            query = QUERIES["transactions.delete"]
             return self.db.delete(query, (transaction_id,)) > 0
         except Exception as e:
             raise Exception(f"Error deleting transaction {transaction_id}: {e}")
 
-    def get_current_month_totals_by_payment_method(self) -> dict[int, dict[str, float]]:
+    def get_current_month_totals_by_payment_method(
+        self, period: Optional[Period] = None
+    ) -> dict[int, dict[str, Money]]:
         try:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
+            start, end = (period or Period.current_month()).month_keys()
 
             query = """
                 SELECT
                     payment_method_id,
-                    SUM(CASE WHEN type = ? THEN amount ELSE 0 END) as income_total,
-                    SUM(CASE WHEN type = ? THEN amount ELSE 0 END) as expense_total
-                FROM transactions
-                WHERE payment_method_id IS NOT NULL
-                AND strftime('%m', date) = ?
-                AND strftime('%Y', date) = ?
+                    SUM(CASE WHEN type = ? THEN total_cents ELSE 0 END)
+                        as income_total,
+                    SUM(CASE WHEN type = ? THEN total_cents ELSE 0 END)
+                        as expense_total
+                FROM monthly_aggregates
+                WHERE year_month >= ? AND year_month < ?
+                AND payment_method_id <> 0
                 GROUP BY payment_method_id;
             """
             params = (
                 TransactionType.INCOME,
                 TransactionType.EXPENSE,
-                f"{current_month:02d}",
-                str(current_year),
+                start,
+                end,
             )
 
             results = self.db.select(query, params)
 
             return {
                 row["payment_method_id"]: {
-                    "income": row["income_total"] or 0.0,
-                    "expense": row["expense_total"] or 0.0,
+                    "income": Money.from_cents(row["income_total"] or 0),
+                    "expense": Money.from_cents(row["expense_total"] or 0),
                 }
                 for row in results
             }
@@ -193,55 +622,37 @@ class TransactionRepository:
         except Exception as e:
             raise Exception(f"Error getting current month transaction totals: {e}")
 
-    def get_total_expenses_for_current_month(self) -> float:
+    def get_total_expenses_for_current_month(
+        self, period: Optional[Period] = None
+    ) -> Money:
+        expenses = (
+            TransactionFilter()
+            .of_types(TransactionType.EXPENSE)
+            .within(period or Period.current_month())
+        )
+        return self.aggregate(expenses)[0]["total"]
+
+    def get_most_added_category_for_current_month(
+        self, period: Optional[Period] = None
+    ) -> str:
         try:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-
-            query = """
-                SELECT
-                    SUM(amount) as total
-                FROM transactions
-                WHERE type = ?
-                AND strftime('%m', date) = ?
-                AND strftime('%Y', date) = ?;
-            """
-            params = (
-                TransactionType.EXPENSE,
-                f"{current_month:02d}",
-                str(current_year),
+            date_filter, date_params = (period or Period.current_month()).sql(
+                "t.date"
             )
 
-            results = self.db.select_one(query, params)
-
-            return results["total"] if results and results.get("total") else 0.0
-
-        except Exception as e:
-            raise Exception(f"Error getting current month transaction totals: {e}")
-
-    def get_most_added_category_for_current_month(self) -> str:
-        try:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-
-            query = """
+            query = f"""
                 SELECT
                     c.name,
-                    SUM(t.amount) as total_spent
+                    SUM(t.amount_cents) as total_spent
                 FROM transactions t
                 JOIN categories c ON c.id = t.category_id
-                WHERE type = ?
-                AND strftime('%m', date) = ?
-                AND strftime('%Y', date) = ?
+                WHERE t.type = ?
+                AND {date_filter}
                 GROUP BY t.category_id
                 ORDER BY total_spent DESC
                 LIMIT 1;
             """
-            params = (
-                TransactionType.EXPENSE,
-                f"{current_month:02d}",
-                str(current_year),
-            )
+            params = (TransactionType.EXPENSE, *date_params)
 
             results = self.db.select_one(query, params)
 
@@ -250,106 +661,142 @@ class TransactionRepository:
         except Exception as e:
             raise Exception(f"Error getting current month transaction totals: {e}")
 
-    def count_month_transactions(self) -> int:
-        try:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
+    def count_month_transactions(self, period: Optional[Period] = None) -> int:
+        month = TransactionFilter().within(period or Period.current_month())
+        return self.aggregate(month)[0]["count"]
 
-            query = """
-                SELECT COUNT(id) as total_transactions
-                FROM transactions
-                WHERE strftime('%m', date) = ?
-                AND strftime('%Y', date) = ?;
-            """
-            params = (
-                f"{current_month:02d}",
-                str(current_year),
-            )
-
-            result = self.db.select_one(query, params)
-            return result["total_transactions"] if result else 0
-
-        except Exception as e:
-            raise Exception(f"Error getting current month transaction totals: {e}")
-
-    def get_expenses_per_category_for_current_month(self) -> list[dict]:
+    def get_expenses_per_category_for_current_month(
+        self, period: Optional[Period] = None
+    ) -> list[dict]:
         try:
-            current_month = datetime.now().month
-            current_year = datetime.now().year
+            start, end = (period or Period.current_month()).month_keys()
 
             query = """
                 SELECT
-                    SUM(t.amount) as total_expense,
+                    SUM(a.total_cents) as total_expense,
                     c.name
-                FROM transactions t
-                JOIN categories c ON c.id = t.category_id
-                WHERE t.type = ?
-                AND strftime('%m', t.date) = ?
-                AND strftime('%Y', t.date) = ?
-                GROUP BY t.category_id;
+                FROM monthly_aggregates a
+                JOIN categories c ON c.id = a.category_id
+                WHERE a.year_month >= ? AND a.year_month < ?
+                AND a.type = ?
+                GROUP BY a.category_id;
             """
-            params = (
-                TransactionType.EXPENSE,
-                f"{current_month:02d}",
-                str(current_year),
-            )
+            params = (start, end, TransactionType.EXPENSE)
 
             results = self.db.select(query, params)
             return [
-                {"name": row["name"], "total_expense": row["total_expense"]}
+                {
+                    "name": row["name"],
+                    "total_expense": Money.from_cents(row["total_expense"]),
+                }
                 for row in results
             ]
 
         except Exception as e:
             raise Exception(f"Error getting expenses per category: {e}")
 
-    def get_monthly_expenses(self) -> list[dict]:
+    def get_monthly_expenses(self, period: Optional[Period] = None) -> list[dict]:
         try:
+            start, end = (period or Period.last_months(12)).month_keys()
+
             query = """
-                SELECT 
-                    strftime('%m/%Y', date) as month,
-                    SUM(amount) as total
-                FROM transactions
-                WHERE type = ?
-                    AND date >= date('now', '-12 months')
-                GROUP BY strftime('%Y-%m', date)
-                ORDER BY date ASC;
+                SELECT
+                    substr(year_month, 6, 2) || '/' || substr(year_month, 1, 4)
+                        as month,
+                    SUM(total_cents) as total
+                FROM monthly_aggregates
+                WHERE year_month >= ? AND year_month < ?
+                AND type = ?
+                GROUP BY year_month
+                ORDER BY year_month ASC;
             """
-            results = self.db.select(query, (TransactionType.EXPENSE,))
-            return [{"month": row["month"], "total": row["total"]} for row in results]
+            results = self.db.select(query, (start, end, TransactionType.EXPENSE))
+            return [
+                {"month": row["month"], "total": Money.from_cents(row["total"])}
+                for row in results
+            ]
         except Exception as e:
             raise Exception(f"Error getting monthly expenses: {e}")
 
-    def get_category_stats(self) -> dict:
+    def get_category_stats(self, period: Optional[Period] = None) -> dict:
         try:
-            # Categoria mais usada
-            query_most_used = """
-                SELECT c.name, COUNT(t.id) as count
-                FROM transactions t
-                JOIN categories c ON t.category_id = c.id
-                WHERE t.type = ?
-                GROUP BY t.category_id
-                ORDER BY count DESC
-                LIMIT 1;
-            """
-            most_used = self.db.select_one(query_most_used, (TransactionType.EXPENSE,))
+            # Sem período, considera todo o histórico
+            date_filter, date_params = (
+                period.sql("t.date") if period else ("1 = 1", ())
+            )
 
-            # Todas as categorias com contagem
-            query_all = """
+            # Mais usada primeiro: uma única leitura serve aos dois resultados
+            query = f"""
                 SELECT c.name, COUNT(t.id) as count
                 FROM transactions t
                 JOIN categories c ON t.category_id = c.id
                 WHERE t.type = ?
-                GROUP BY t.category_id;
+                AND {date_filter}
+                GROUP BY t.category_id
+                ORDER BY count DESC;
             """
-            all_categories = self.db.select(query_all, (TransactionType.EXPENSE,))
+            params = (TransactionType.EXPENSE, *date_params)
+            categories = [
+                {"name": row["name"], "count": row["count"]}
+                for row in self.db.select(query, params)
+            ]
 
             return {
-                "most_used": most_used["name"] if most_used else "",
-                "categories": [
-                    {"name": row["name"], "count": row["count"]}
-                    for row in all_categories
-                ],
+                "most_used": categories[0]["name"] if categories else "",
+                "categories": categories,
             }
         except Exception as e:
             raise Exception(f"Error getting category stats: {e}")
+
+    def get_dashboard_snapshot(
+        self, period: Optional[Period] = None, today: Optional[date] = None
+    ) -> DashboardSnapshot:
+        period = period or Period.current_month()
+        today = today or date.today()
+        # Parcelas agendadas para depois de hoje ainda não foram gastas
+        end = min(period.end, today + timedelta(days=1))
+        if end <= period.start:
+            return DashboardSnapshot(period, as_of=today)
+        try:
+            date_filter, date_params = Period(period.start, end).sql("t.date")
+
+            # Um grupo por (tipo, categoria); as funções de janela somam os
+            # grupos, então os totais saem da mesma leitura das transações
+            query = f"""
+                SELECT
+                    t.type,
+                    t.category_id,
+                    c.name,
+                    SUM(t.amount_cents) AS total_cents,
+                    COUNT(*) AS count,
+                    SUM(SUM(t.amount_cents)) OVER (PARTITION BY t.type)
+                        AS type_total_cents,
+                    SUM(COUNT(*)) OVER () AS transaction_count
+                FROM transactions t
+                LEFT JOIN categories c ON c.id = t.category_id
+                WHERE {date_filter}
+                GROUP BY t.type, t.category_id
+                ORDER BY total_cents DESC, c.name;
+            """
+            rows = self.db.select(query, date_params)
+
+            totals = {row["type"]: row["type_total_cents"] for row in rows}
+            categories = [
+                CategoryTotal(
+                    row["name"], Money.from_cents(row["total_cents"]), row["count"]
+                )
+                for row in rows
+                if row["type"] == TransactionType.EXPENSE and row["name"] is not None
+            ]
+            return DashboardSnapshot(
+                period,
+                total_expense=Money.from_cents(
+                    totals.get(TransactionType.EXPENSE, 0)
+                ),
+                total_income=Money.from_cents(totals.get(TransactionType.INCOME, 0)),
+                transaction_count=rows[0]["transaction_count"] if rows else 0,
+                categories=categories,
+                as_of=today,
+            )
+        except Exception as e:
+            raise Exception(f"Error getting dashboard snapshot: {e}")
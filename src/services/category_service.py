@@ -1,6 +1,7 @@
 from src.repositories.category_repository import CategoryRepository
 from src.models.category import Category
 from typing import Optional
+from src.database.db_manager import DatabaseManager
 
 
 class CategoryService:
@@ -10,14 +11,19 @@ class CategoryService:
     podendo incluir lógica de negócio adicional.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        repo: Optional[CategoryRepository] = None,
+    ):
         """
         Inicializa o serviço com o repositório de categorias.
 
         Args:
-            repository: Instância do CategoryRepository para operações de persistência
+            db: Gerenciador de banco de dados compartilhado pelo repositório
+            repo: Repositório já construído (tem precedência sobre db)
         """
-        self.repo = CategoryRepository()
+        self.repo = repo or CategoryRepository(db=db)
 
     def add_category(self, category: Category) -> Optional[Category]:
         """
@@ -1,6 +1,8 @@
 from src.repositories.payment_method_repository import PaymentMethodRepository
+from src.models.money import Money
 from src.models.payment_method.payment_method import PaymentMethod
 from typing import Optional
+from src.database.db_manager import DatabaseManager
 
 
 class PaymentMethodService:
@@ -9,14 +11,19 @@ class PaymentMethodService:
     Gerencia operações como adição, atualização e processamento de pagamentos.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        repo: Optional[PaymentMethodRepository] = None,
+    ):
         """
         Inicializa o serviço com o repositório de métodos de pagamento.
 
         Args:
-            repository: Instância do PaymentMethodRepository
+            db: Gerenciador de banco de dados compartilhado pelo repositório
+            repo: Repositório já construído (tem precedência sobre db)
         """
-        self.repo = PaymentMethodRepository()
+        self.repo = repo or PaymentMethodRepository(db=db)
 
     def add_payment_method(self, payment: PaymentMethod) -> Optional[PaymentMethod]:
         """
@@ -113,35 +120,31 @@ class PaymentMethodService:
             print(f"Error deleting payment method {payment_id}: {e}")
             return False
 
-    def process_payment(self, payment_id: int, amount: float, is_expense: bool) -> bool:
+    def process_payment(
+        self, payment_id: int, amount: Money | float, is_expense: bool
+    ) -> bool:
         """
         Processa um pagamento usando um método específico.
 
         Args:
             payment_id: ID do método de pagamento a ser usado
-            amount: Valor do pagamento
+            amount: Valor do pagamento, em reais
+            is_expense: True para despesa, False para receita
 
         Returns:
             bool: True se o pagamento foi processado com sucesso
         """
         if not isinstance(payment_id, int) or payment_id <= 0:
             return False
-        if not isinstance(amount, (int, float)) or amount <= 0:
+        try:
+            amount = Money(amount)
+        except (TypeError, ValueError):
+            return False
+        if amount <= 0:
             return False
 
         try:
-            payment = self.get_payment_method_by_id(payment_id)
-            if not payment:
-                return False
-
-            try:
-                success = payment.process_payment(amount, is_expense)
-                if success:
-                    self.update_payment_method(payment)
-                return success
-            except Exception as e:
-                print(f"Error processing payment: {e}")
-                return False
+            return self.repo.apply_payment(payment_id, amount, is_expense)
         except Exception as e:
             print(f"Error in payment processing workflow: {e}")
             return False
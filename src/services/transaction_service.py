@@ -1,10 +1,24 @@
+from src.repositories.transaction_filter import TransactionFilter
 from src.repositories.transaction_repository import TransactionRepository
+from src.models.dashboard_snapshot import DashboardSnapshot
+from src.models.installment_plan import InstallmentPlan
+from src.models.money import Money
 from src.models.transaction.transaction import Transaction
 from src.models.transaction.expense import Expense
+from src.models.transaction.income import Income
 from src.services.payment_method_service import PaymentMethodService
 from src.services.category_service import CategoryService
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Optional
+from collections import defaultdict
+from itertools import islice
+from datetime import date, datetime
+from src.database.db_manager import DatabaseManager
 from src.models.transaction.transaction_type import TransactionType
+from src.models.payment_method.payment_type import PaymentType
+from utils.period import Period
+
+if TYPE_CHECKING:
+    from src.analytics.transaction_frame import TransactionFrame
 
 
 class TransactionService:
@@ -13,56 +27,197 @@ class TransactionService:
     Gerencia operações como registro, atualização e exclusão de transações.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        repo: Optional[TransactionRepository] = None,
+        payment_service: Optional[PaymentMethodService] = None,
+        category_service: Optional[CategoryService] = None,
+    ):
         """
         Inicializa o serviço com o repositório de transações.
 
+        Colaboradores informados são reaproveitados; os que faltarem são
+        criados sobre o mesmo db.
+
         Args:
-            repository: Instância do TransactionRepository
+            db: Gerenciador de banco de dados compartilhado pelos repositórios
+            repo: Repositório de transações já construído
+            payment_service: Serviço de métodos de pagamento compartilhado
+            category_service: Serviço de categorias compartilhado
         """
-        self.repo = TransactionRepository()
-        self.payment_service = PaymentMethodService()
-        self.category_service = CategoryService()
+        self.repo = repo or TransactionRepository(db=db)
+        self.payment_service = payment_service or PaymentMethodService(db=db)
+        self.category_service = category_service or CategoryService(db=db)
 
     def add_transaction(self, transaction: Transaction) -> Optional[Transaction]:
         """
         Adiciona uma nova transação ao sistema.
 
+        A gravação da transação e a atualização do saldo do método de
+        pagamento acontecem em uma única transação do banco: se o pagamento
+        for recusado ou algo falhar, nada é gravado.
+
+        Uma despesa parcelada no crédito (total_installments > 1, a partir
+        da parcela 1) tem o valor total como valor da compra: ela consome o
+        limite do cartão de uma vez e é gravada como uma parcela por mês,
+        ligadas pelo purchase_id.
+
         Args:
             transaction: Objeto Transaction a ser adicionado
 
         Returns:
-            Transaction: A transação com ID atualizado em caso de sucesso
-            None: Em caso de falha ou dados inválidos
+            Transaction: A transação com ID atualizado em caso de sucesso; se
+                         parcelada, a primeira parcela como foi gravada
+            None: Em caso de falha, pagamento recusado ou dados inválidos
         """
         if not isinstance(transaction, Transaction):
             return None
-        if isinstance(transaction, Expense):
-            if transaction.category and not transaction.category.id:
-                saved_category = self.category_service.add_category(
-                    transaction.category
-                )
-                transaction.category = saved_category
-
-            if transaction.payment_method and not transaction.payment_method.id:
-                saved_payment = self.payment_service.add_payment_method(
-                    transaction.payment_method
-                )
-                transaction.payment_method = saved_payment
-        try:
-            self.payment_service.process_payment(
-                transaction.payment_method.id, transaction.amount,
-                transaction.transaction_type == TransactionType.EXPENSE
-            )
-            transaction_id = self.repo.save(transaction)
-            if transaction_id:
-                transaction._id = transaction_id
-                return transaction
-            return None
+        try:
+            with self.repo.db.transaction():
+                if isinstance(transaction, Expense):
+                    if transaction.category and not transaction.category.id:
+                        saved_category = self.category_service.add_category(
+                            transaction.category
+                        )
+                        transaction.category = saved_category
+
+                    if transaction.payment_method and not transaction.payment_method.id:
+                        saved_payment = self.payment_service.add_payment_method(
+                            transaction.payment_method
+                        )
+                        transaction.payment_method = saved_payment
+
+                if not self.payment_service.process_payment(
+                    transaction.payment_method.id,
+                    transaction.amount,
+                    transaction.transaction_type == TransactionType.EXPENSE,
+                ):
+                    raise ValueError("Pagamento recusado pelo método de pagamento")
+
+                installment_purchase = self.__is_installment_purchase(transaction)
+                if installment_purchase:
+                    plan = InstallmentPlan(
+                        transaction.amount,
+                        transaction.total_installments,
+                        transaction.date,
+                    )
+                    _, installment_ids = self.repo.save_purchase(transaction, plan)
+                    transaction_id = installment_ids[0] if installment_ids else None
+                else:
+                    transaction_id = self.repo.save(transaction)
+                if not transaction_id:
+                    raise ValueError("Transação não foi gravada")
+            if installment_purchase:
+                # A compra passa a ser a parcela 1, com o valor da parcela
+                return self.repo.get_by_id(transaction_id)
+            transaction._id = transaction_id
+            return transaction
         except Exception as e:
             print(f"Error adding transaction: {e}")
             return None
 
+    @staticmethod
+    def __is_installment_purchase(transaction: Transaction) -> bool:
+        """Despesa no crédito que deve ser expandida em parcelas"""
+        return (
+            isinstance(transaction, Expense)
+            and transaction.total_installments > 1
+            and transaction.current_installment == 1
+            and transaction.payment_method.payment_type == PaymentType.CREDIT
+        )
+
+    def add_transactions(
+        self, transactions: Iterable[Transaction | dict], chunk_size: int = 5000
+    ) -> int:
+        """
+        Importa muitas transações de uma vez.
+
+        As transações são lidas em blocos de `chunk_size`. Cada bloco é
+        validado, gravado com um único executemany e tem a variação líquida
+        de saldo de cada método de pagamento aplicada uma vez, tudo na mesma
+        transação do banco. Blocos já gravados permanecem se um bloco
+        seguinte falhar. Limites e saldos não são verificados, pois o uso é
+        a importação de histórico.
+
+        Args:
+            transactions: Objetos Income/Expense, ou dicionários no formato
+                          de to_dict() com a chave "type"
+            chunk_size: Quantidade de transações por transação do banco
+
+        Returns:
+            int: Número de transações gravadas
+
+        Raises:
+            ValueError: Se alguma transação for inválida
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        saved = 0
+        related: dict[tuple[str, int], any] = {}
+        iterator = iter(transactions)
+        while True:
+            chunk = [
+                self.__validate_for_import(item, saved + position, related)
+                for position, item in enumerate(islice(iterator, chunk_size))
+            ]
+            if not chunk:
+                return saved
+
+            deltas: dict[int, int] = defaultdict(int)
+            for transaction in chunk:
+                is_expense = transaction.transaction_type == TransactionType.EXPENSE
+                cents = transaction.amount.cents
+                deltas[transaction.payment_method.id] += (
+                    cents if is_expense else -cents
+                )
+
+            with self.repo.db.transaction():
+                inserted = self.repo.save_many(chunk)
+                self.payment_service.repo.adjust_balances(deltas)
+            saved += inserted
+
+    def __validate_for_import(
+        self, item: Transaction | dict, position: int, related: dict
+    ) -> Transaction:
+        """
+        Converte e valida um item de add_transactions usando os modelos.
+        Métodos de pagamento e categorias informados por ID são buscados
+        uma única vez por importação, através de `related`.
+        """
+        if isinstance(item, dict):
+            data = dict(item)
+            if isinstance(data.get("date"), datetime):
+                data["date"] = data["date"].isoformat()
+            for key, loader in (
+                ("payment_method", self.payment_service.get_payment_method_by_id),
+                ("category", self.category_service.get_category_by_id),
+            ):
+                related_id = data.pop(f"{key}_id", None)
+                if related_id and not data.get(key):
+                    if (key, related_id) not in related:
+                        related[(key, related_id)] = loader(related_id)
+                    data[key] = related[(key, related_id)]
+            if data.get("type") == TransactionType.INCOME:
+                item = Income.from_dict(data)
+            elif data.get("type") == TransactionType.EXPENSE:
+                item = Expense.from_dict(data)
+            else:
+                raise ValueError(f"Transaction {position}: invalid type")
+
+        if not isinstance(item, (Income, Expense)):
+            raise ValueError(f"Transaction {position}: not an Income or Expense")
+        if item.id:
+            raise ValueError(f"Transaction {position}: already saved")
+        if item.amount <= 0:
+            raise ValueError(f"Transaction {position}: amount must be positive")
+        if not item.payment_method or not item.payment_method.id:
+            raise ValueError(f"Transaction {position}: saved payment method required")
+        if isinstance(item, Expense) and item.category and not item.category.id:
+            raise ValueError(f"Transaction {position}: category must be saved")
+        return item
+
     def get_all_transactions(self) -> list[Transaction]:
         """
         Recupera todas as transações cadastradas.
@@ -76,6 +231,102 @@ class TransactionService:
             print(f"Error getting all transactions: {e}")
             return []
 
+    def get_page(
+        self,
+        after_date: Optional[datetime | str] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        filters: Optional[TransactionFilter | dict[str, any]] = None,
+    ) -> list[Transaction]:
+        """
+        Recupera uma página de transações, da mais recente para a mais antiga.
+
+        Para obter a página seguinte, passe a data e o ID da última
+        transação recebida.
+
+        Args:
+            after_date: Data da última transação da página anterior
+            after_id: ID da última transação da página anterior
+            limit: Quantidade máxima de transações na página
+            filters: TransactionFilter ou dict ("type", "category_id",
+                     "payment_method_id")
+
+        Returns:
+            List[Transaction]: Transações da página ou lista vazia
+        """
+        try:
+            return self.repo.get_page(after_date, after_id, limit, filters)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"Error getting transactions page: {e}")
+            return []
+
+    def search(
+        self,
+        text: str,
+        filters: Optional[TransactionFilter | dict[str, any]] = None,
+        limit: int = 20,
+    ) -> list[Transaction]:
+        """
+        Busca transações pela descrição, com correspondência por prefixo.
+
+        Args:
+            text: Texto digitado; cada palavra pode estar incompleta
+            filters: TransactionFilter ou dict ("type", "category_id",
+                     "payment_method_id")
+            limit: Quantidade máxima de resultados
+
+        Returns:
+            List[Transaction]: Transações mais relevantes primeiro, ou lista vazia
+        """
+        try:
+            return self.repo.search(text, filters, limit)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"Error searching transactions: {e}")
+            return []
+
+    def find(self, filters: Optional[TransactionFilter] = None) -> list[Transaction]:
+        """
+        Lista as transações que atendem ao filtro.
+
+        Args:
+            filters: Filtro com condições, ordenação e limite (padrão: todas)
+
+        Returns:
+            List[Transaction]: Transações encontradas ou lista vazia
+        """
+        try:
+            return self.repo.find(filters)
+        except Exception as e:
+            print(f"Error finding transactions: {e}")
+            return []
+
+    def aggregate(
+        self,
+        filters: Optional[TransactionFilter] = None,
+        group_by: Optional[str] = None,
+    ) -> list[dict]:
+        """
+        Soma e conta as transações que atendem ao filtro.
+
+        Args:
+            filters: O mesmo filtro aceito por find
+            group_by: "type", "category", "payment_method", "month" ou None
+
+        Returns:
+            Lista de {"group", "total", "count"} ou lista vazia em caso de erro
+        """
+        try:
+            return self.repo.aggregate(filters, group_by)
+        except ValueError:
+            raise
+        except Exception as e:
+            print(f"Error aggregating transactions: {e}")
+            return []
+
     def get_transaction_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """
         Busca uma transação pelo seu ID.
@@ -134,14 +385,62 @@ class TransactionService:
             print(f"Error deleting transaction {transaction_id}: {e}")
             return False
 
+    def get_installments_due(self, period: Optional[Period] = None) -> list[Expense]:
+        """
+        Retorna as parcelas de compras parceladas que vencem no período.
+
+        Args:
+            period: Período de vencimento (padrão: mês atual)
+
+        Returns:
+            List[Expense]: Parcelas ordenadas por data, ou lista vazia
+        """
+        try:
+            return self.repo.get_installments_due(period)
+        except Exception as e:
+            print(f"Error getting installments due: {e}")
+            return []
+
+    def get_purchase(self, purchase_id: int) -> list[Expense]:
+        """
+        Retorna todas as parcelas de uma compra parcelada.
+
+        Args:
+            purchase_id: ID da compra
+
+        Returns:
+            List[Expense]: Parcelas da primeira à última, ou lista vazia
+        """
+        try:
+            return self.repo.get_purchase(purchase_id)
+        except Exception as e:
+            print(f"Error getting purchase {purchase_id}: {e}")
+            return []
+
+    def delete_purchase(self, purchase_id: int) -> bool:
+        """
+        Remove uma compra parcelada com todas as suas parcelas.
+
+        Args:
+            purchase_id: ID da compra
+
+        Returns:
+            bool: True se alguma parcela foi removida, False caso contrário
+        """
+        try:
+            return self.repo.delete_purchase(purchase_id) > 0
+        except Exception as e:
+            print(f"Error deleting purchase {purchase_id}: {e}")
+            return False
+
     def find_current_month_totals_by_payment_method(
         self,
-    ) -> dict[int, dict[str, float]]:
+    ) -> dict[int, dict[str, Money]]:
         """
         Retorna os totais de receitas e despesas do mês atual agrupados por método de pagamento.
 
         Returns:
-            dict[int, dict[str, float]]:
+            dict[int, dict[str, Money]]:
             - Chave: ID do método de pagamento
             - Valor: Dicionário com:
                 - 'income': total de receitas no mês
@@ -159,12 +458,12 @@ class TransactionService:
 
     def find_total_expense_for_current_month(
         self,
-    ) -> float:
+    ) -> Money:
         """
         Retorna o total gasto no mês.
 
         Returns:
-            float
+            Money
         Raises:
             Exception: Se ocorrer um erro ao acessar o repositório
         """
@@ -212,7 +511,7 @@ class TransactionService:
         Retorna as despesas agrupadas por categoria no mês atual
 
         Returns:
-            List[dict]: Lista com {'name': str, 'total_expense': float}
+            List[dict]: Lista com {'name': str, 'total_expense': Money}
         """
         try:
             return self.repo.get_expenses_per_category_for_current_month()
@@ -225,7 +524,7 @@ class TransactionService:
         """
         Retorna os gastos mensais para os últimos 12 meses
         Returns:
-            List[dict]: Lista com {'month': 'MM/YYYY', 'total': float}
+            List[dict]: Lista com {'month': 'MM/YYYY', 'total': Money}
         """
         try:
             return self.repo.get_monthly_expenses()
@@ -244,3 +543,45 @@ class TransactionService:
         except Exception as e:
             print(f"Error getting category stats: {e}")
             return {"most_used": "", "categories": []}
+
+    def get_dashboard_snapshot(
+        self, period: Optional[Period] = None, today: Optional[date] = None
+    ) -> DashboardSnapshot:
+        """
+        Retorna todas as métricas do painel com uma única consulta.
+
+        Args:
+            period: Período analisado (padrão: mês atual)
+            today: Último dia somado (padrão: hoje); parcelas agendadas
+                   para depois dele ficam de fora
+
+        Returns:
+            DashboardSnapshot (vazio em caso de erro)
+        """
+        period = period or Period.current_month()
+        try:
+            return self.repo.get_dashboard_snapshot(period, today)
+        except Exception as e:
+            print(f"Error getting dashboard snapshot: {e}")
+            return DashboardSnapshot(period)
+
+    def get_transaction_frame(
+        self, period: Optional[Period] = None
+    ) -> Optional["TransactionFrame"]:
+        """
+        Carrega as transações em formato colunar para métricas vetorizadas.
+
+        Args:
+            period: Período opcional; sem ele todo o histórico é carregado
+
+        Returns:
+            TransactionFrame ou None em caso de erro
+        """
+        try:
+            # Importado sob demanda: só as métricas precisam do NumPy
+            from src.analytics.transaction_frame import TransactionFrame
+
+            return TransactionFrame.load(self.repo.db, period)
+        except Exception as e:
+            print(f"Error loading transaction frame: {e}")
+            return None
@@ -1,6 +1,7 @@
 import pytest
 import sqlite3
 from src.database.db_manager import DatabaseManager
+from src.database.migration_manager import MigrationManager
 from src.repositories.payment_method_repository import PaymentMethodRepository
 from src.services.payment_method_service import PaymentMethodService
 from src.repositories.category_repository import CategoryRepository
@@ -25,8 +26,8 @@ def payment_test_db():
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             name TEXT NOT NULL,
             type TEXT CHECK(type IN ('CREDIT', 'DEBIT')) NOT NULL,
-            balance FLOAT DEFAULT 0.0,
-            credit_limit FLOAT,
+            balance_cents INTEGER NOT NULL DEFAULT 0,
+            credit_limit_cents INTEGER,
             closing_day INTEGER,
             due_day INTEGER
         )
@@ -88,7 +89,7 @@ def transaction_test_db():
         """
         CREATE TABLE IF NOT EXISTS transactions (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
-            amount FLOAT NOT NULL,
+            amount_cents INTEGER NOT NULL DEFAULT 0,
             description TEXT,
             date TIMESTAMP NOT NULL,
             type TEXT CHECK(type IN ('INCOME', 'EXPENSE')) NOT NULL,
@@ -115,37 +116,48 @@ def transaction_test_db():
     conn.close()
 
 
+@pytest.fixture
+def test_db(tmp_path):
+    # Banco isolado por teste, com todas as migrations aplicadas
+    db = DatabaseManager(str(tmp_path / "expense-tracker-test.db"), profile="test")
+    MigrationManager(db).apply_all_pending()
+
+    yield db
+
+    db.close()
+
+
 # fixtures for payment_method
 @pytest.fixture
-def payment_repo():
-    return PaymentMethodRepository()
+def payment_repo(test_db):
+    return PaymentMethodRepository(db=test_db)
 
 
 @pytest.fixture
-def payment_service():
-    return PaymentMethodService()
+def payment_service(test_db):
+    return PaymentMethodService(db=test_db)
 
 
 # fixtures for category
 @pytest.fixture
-def category_repo():
-    return CategoryRepository()
+def category_repo(test_db):
+    return CategoryRepository(db=test_db)
 
 
 @pytest.fixture
-def category_service():
-    return CategoryService()
+def category_service(test_db):
+    return CategoryService(db=test_db)
 
 
 # fixtures for transaction
 @pytest.fixture
-def transaction_repo():
-    return TransactionRepository()
+def transaction_repo(test_db):
+    return TransactionRepository(db=test_db)
 
 
 @pytest.fixture
-def transaction_service():
-    return TransactionService()
+def transaction_service(test_db):
+    return TransactionService(db=test_db)
 
 
 @pytest.fixture
@@ -158,3 +170,30 @@ def sample_payment_method(payment_service):
 def sample_category(category_service):
     category = Category(id=None, name="Alimentação")
     return category_service.add_category(category)
+
+
+# fixtures for the task runner
+class FakeMaster:
+    """Substitui o widget do Tk: guarda os callbacks de after() para rodar depois"""
+
+    def __init__(self):
+        self.scheduled = {}
+        self.next_id = 0
+
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.scheduled[self.next_id] = callback
+        return self.next_id
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+    def pump(self):
+        while self.scheduled:
+            after_id = min(self.scheduled)
+            self.scheduled.pop(after_id)()
+
+
+@pytest.fixture
+def fake_master():
+    return FakeMaster()
@@ -0,0 +1,53 @@
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from views.chart_manager import LineChart, PieChart
+
+
+def test_charts_update_artists_in_place():
+    """Os gráficos reaproveitam fatias e linha, com o mesmo resultado do ax.pie"""
+    figure = Figure()
+    FigureCanvasAgg(figure)
+    pie = PieChart(figure.add_subplot(1, 2, 1))
+
+    pie.update(["Mercado", "Moradia"], [1.0, 3.0])
+    patches = list(pie.patches)
+    pie.update(["Lazer", "Moradia"], [3.0, 1.0])
+    assert pie.patches == patches
+
+    reference = Figure().add_subplot().pie(
+        [3.0, 1.0],
+        labels=["Lazer", "Moradia"],
+        autopct="%1.1f%%",
+        startangle=PieChart.START_ANGLE,
+    )
+    for ours, theirs in zip(pie.patches, reference[0]):
+        assert ours.theta1 == pytest.approx(theirs.theta1)
+        assert ours.theta2 == pytest.approx(theirs.theta2)
+    for ours, theirs in zip(pie.texts + pie.autotexts, reference[1] + reference[2]):
+        assert ours.get_text() == theirs.get_text()
+        assert ours.get_position() == pytest.approx(theirs.get_position(), abs=1e-6)
+        assert ours.get_horizontalalignment() == theirs.get_horizontalalignment()
+
+    # Outra quantidade de fatias refaz a pizza; sem dados, mostra o aviso
+    pie.update(["A", "B", "C"], [1.0, 1.0, 1.0])
+    assert len(pie.patches) == 3 and not pie.notice.get_visible()
+    pie.update([], [])
+    assert pie.patches == [] and pie.notice.get_visible()
+
+    line = LineChart(figure.add_subplot(1, 2, 2))
+    artist = line.line
+    line.update(["01/2024", "02/2024"], [10.0, 20.0])
+    line.update(["01/2024", "02/2024", "03/2024"], [5.0, 15.0, 25.0])
+    assert line.line is artist
+    assert list(artist.get_ydata()) == [5.0, 15.0, 25.0]
+    assert [t.get_text() for t in line.ax.get_xticklabels()][-1] == "03/2024"
+    assert line.ax.get_ylim()[1] >= 25.0
+    line.update([], [])
+    assert not artist.get_visible() and line.notice.get_visible()
+
+    figure.canvas.draw()
+    assert len(figure.axes) == 2
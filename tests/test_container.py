@@ -0,0 +1,49 @@
+import threading
+from src.container import ServiceContainer
+from src.database.migration_manager import MigrationManager
+from src.models.category import Category
+
+
+def test_container_builds_one_shared_graph(tmp_path):
+    """O container cria cada serviço uma única vez, mesmo entre threads"""
+    container = ServiceContainer(str(tmp_path / "container.db"), profile="test")
+    MigrationManager(container.db).apply_all_pending()
+
+    seen = []
+    barrier = threading.Barrier(8)
+
+    def worker():
+        barrier.wait()
+        seen.append(container.transaction_service)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    service = container.transaction_service
+    assert all(s is service for s in seen)
+    # O serviço de transações reaproveita os demais serviços e repositórios
+    assert service.payment_service is container.payment_method_service
+    assert service.category_service is container.category_service
+    assert service.repo is container.transaction_repository
+    assert container.category_service.repo is container.category_repository
+    assert container.transaction_repository.db is container.db
+    assert container.monthly_aggregate_repository.db is container.db
+
+    saved = container.category_service.add_category(Category(name="Mercado"))
+    assert container.category_repository.get_by_id(saved.id).name == "Mercado"
+
+    # Depois de fechado, o grafo é recriado sob demanda
+    old_service = container.category_service
+    container.close()
+    assert container.category_service is not old_service
+    assert container.category_repository.get_by_id(saved.id).name == "Mercado"
+    container.close()
+
+    default = ServiceContainer.default()
+    assert ServiceContainer.default() is default
+    ServiceContainer.set_default(container)
+    assert ServiceContainer.default() is container
+    ServiceContainer.set_default(None)
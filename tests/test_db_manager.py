@@ -0,0 +1,234 @@
+import sqlite3
+import threading
+import pytest
+from src.database.connection_pool import (
+    ConnectionPool,
+    PoolClosedError,
+    PoolTimeoutError,
+)
+from src.database.db_manager import DatabaseManager
+from src.database.pragma_profile import PragmaProfile
+from src.database.query_instrumentation import QueryInstrumentation
+from src.database.query_registry import QUERIES, QueryRegistry
+from src.models.category import Category
+
+
+def test_pooled_manager_reuses_connections(test_db):
+    """Repeated calls on one thread share a single pooled connection"""
+    for i in range(20):
+        test_db.insert("INSERT INTO categories (name) VALUES (?);", (f"Cat {i}",))
+        test_db.select("SELECT id, name FROM categories;")
+
+    assert test_db.pool.size == 1
+    assert len(test_db.select("SELECT id FROM categories;")) == 20
+
+    # Managers pointing at the same file share the same pool
+    other = DatabaseManager(test_db._db_file)
+    assert other.pool is test_db.pool
+
+
+def test_pool_connections_per_thread(tmp_path):
+    """Each thread gets its own connection, bounded by pool_size"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), pool_size=2, timeout=0.2)
+    seen = []
+    barrier = threading.Barrier(2)
+
+    def worker():
+        with pool.connection() as conn:
+            with pool.connection() as nested:
+                assert nested is conn
+            seen.append(id(conn))
+            barrier.wait()
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(seen)) == 2
+    assert pool.size == 2
+
+    pool.close()
+
+
+def test_pool_size_bounds_checkouts(tmp_path):
+    """A thread waits for a free slot and times out when none is released"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), pool_size=1, timeout=0.1)
+    errors = []
+
+    def blocked():
+        try:
+            with pool.connection():
+                pass
+        except PoolTimeoutError as err:
+            errors.append(err)
+
+    with pool.connection():
+        t = threading.Thread(target=blocked)
+        t.start()
+        t.join()
+
+    assert len(errors) == 1
+    pool.close()
+
+
+def test_pool_health_check_and_close(tmp_path):
+    """Broken idle connections are replaced and closing refuses checkouts"""
+    pool = ConnectionPool(str(tmp_path / "pool.db"), health_check_interval=0)
+
+    with pool.connection() as conn:
+        first = conn
+    first.close()
+
+    with pool.connection() as conn:
+        assert conn is not first
+        assert conn.execute("SELECT 1;").fetchone()[0] == 1
+
+    pool.close()
+    assert pool.size == 0
+    with pytest.raises(PoolClosedError):
+        with pool.connection():
+            pass
+
+
+def test_connect_per_call_mode_still_works(tmp_path):
+    """pooled=False keeps the original one-connection-per-call behavior"""
+    db = DatabaseManager(str(tmp_path / "plain.db"), pooled=False)
+    assert db.execute_script("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT);")
+    assert db.insert("INSERT INTO t (v) VALUES (?);", ("a",)) == 1
+    assert db.select_one("SELECT v FROM t WHERE id = ?;", (1,)) == {"v": "a"}
+    assert db.pool is None
+
+
+def test_unit_of_work_commits_once_or_rolls_back(test_db, category_repo):
+    """Calls inside transaction() share one connection and one commit"""
+    with test_db.transaction() as conn:
+        assert test_db.in_transaction
+        category_repo.save(Category(name="Lazer"))
+        # Another manager of the same file joins the same unit
+        other = DatabaseManager(test_db._db_file)
+        other.insert("INSERT INTO categories (name) VALUES (?);", ("Casa",))
+        with test_db.transaction() as nested:
+            assert nested is conn
+        assert conn.in_transaction
+    assert not test_db.in_transaction
+    assert len(category_repo.get_all()) == 2
+
+    with pytest.raises(RuntimeError):
+        with test_db.transaction():
+            category_repo.save(Category(name="Viagem"))
+            raise RuntimeError("abort")
+    assert len(category_repo.get_all()) == 2
+
+    # Database errors abort the unit instead of being printed
+    with pytest.raises(sqlite3.IntegrityError):
+        with test_db.transaction():
+            category_repo.save(Category(name="Saúde"))
+            test_db.insert("INSERT INTO categories (name) VALUES (NULL);", ())
+    assert {c.name for c in category_repo.get_all()} == {"Lazer", "Casa"}
+
+
+def test_pragma_profiles_are_applied_to_pooled_connections(tmp_path):
+    """Each new pooled connection gets the PRAGMAs of its manager profile"""
+    desktop = DatabaseManager(str(tmp_path / "desktop.db"))
+    bulk = DatabaseManager(str(tmp_path / "bulk.db"), profile="bulk_import")
+    custom = DatabaseManager(
+        str(tmp_path / "custom.db"),
+        profile=PragmaProfile("custom", journal_mode="TRUNCATE", cache_size=-1234),
+    )
+
+    assert desktop.select_one("PRAGMA journal_mode;") == {"journal_mode": "wal"}
+    assert desktop.select_one("PRAGMA synchronous;") == {"synchronous": 1}
+    assert desktop.select_one("PRAGMA temp_store;") == {"temp_store": 2}
+    assert desktop.select_one("PRAGMA busy_timeout;") == {"timeout": 5000}
+    assert desktop.select_one("PRAGMA foreign_keys;") == {"foreign_keys": 1}
+    assert bulk.select_one("PRAGMA synchronous;") == {"synchronous": 0}
+    assert custom.select_one("PRAGMA journal_mode;") == {"journal_mode": "truncate"}
+    assert custom.select_one("PRAGMA cache_size;") == {"cache_size": -1234}
+
+    with pytest.raises(ValueError):
+        PragmaProfile.get("turbo")
+    with pytest.raises(ValueError):
+        PragmaProfile("bad", synchronous="SOMETIMES")
+
+    for db in (desktop, bulk, custom):
+        db.close()
+
+
+def test_select_iter_streams_rows_in_batches(test_db):
+    """select_iter yields sqlite3.Row or tuples lazily and frees the connection"""
+    test_db.insert_many(
+        "INSERT INTO categories (name) VALUES (?);",
+        [(f"Cat {i:03d}",) for i in range(250)],
+    )
+    query = "SELECT id, name FROM categories ORDER BY id;"
+
+    rows = test_db.select_iter(query, batch_size=100)
+    first = next(rows)
+    assert isinstance(first, sqlite3.Row)
+    assert first["name"] == "Cat 000"
+    assert len(list(rows)) == 249
+
+    names = [
+        name for _, name in test_db.select_iter(query, row_format="tuple", batch_size=7)
+    ]
+    assert names == [f"Cat {i:03d}" for i in range(250)]
+    assert isinstance(next(test_db.select_iter(query, row_format="tuple")), tuple)
+
+    # Closing a partially consumed iterator returns its connection
+    partial = test_db.select_iter(query, batch_size=10)
+    next(partial)
+    partial.close()
+    assert test_db.pool.size == 1
+    assert len(test_db.select(query)) == 250
+
+    with pytest.raises(ValueError):
+        next(test_db.select_iter(query, row_format="dict"))
+
+
+def test_execute_many_runs_updates_under_their_own_label(test_db):
+    """Batched UPDATEs are timed and reported as UPDATE, not INSERT"""
+    instrumentation = QueryInstrumentation()
+    events = []
+    instrumentation.add_hook(events.append)
+    db = DatabaseManager(test_db.db_file, instrumentation=instrumentation)
+    db.insert_many(
+        "INSERT INTO categories (name) VALUES (?);", [("Mercado",), ("Lazer",)]
+    )
+    updated = db.execute_many(
+        "UPDATE categories SET name = ? WHERE id = ?;", [("Feira", 1), ("Cinema", 2)]
+    )
+    assert updated == 2
+    assert [c["name"] for c in db.select("SELECT name FROM categories;")] == [
+        "Feira",
+        "Cinema",
+    ]
+    assert [(e.label, e.rows) for e in events[:2]] == [("INSERT", 2), ("UPDATE", 2)]
+
+
+def test_named_queries_share_one_text_and_a_tunable_statement_cache(tmp_path):
+    """Registered shapes are normalized, unique by name and sized per pool"""
+    registry = QueryRegistry()
+    name = registry.register("cats.by_id", "SELECT id\n  FROM categories WHERE id = ?;")
+    assert registry[name] == "SELECT id FROM categories WHERE id = ?;"
+    registry.register("cats.by_id", "SELECT id FROM categories   WHERE id = ?;")
+    with pytest.raises(ValueError):
+        registry.register("cats.by_id", "SELECT name FROM categories WHERE id = ?;")
+    with pytest.raises(KeyError):
+        registry["cats.all"]
+
+    # Repositories register their statements when imported
+    assert "categories.by_id" in QUERIES and "transactions.insert" in QUERIES
+
+    tuned = DatabaseManager(str(tmp_path / "tuned.db"), cached_statements=16)
+    default = DatabaseManager(str(tmp_path / "default.db"))
+    assert tuned.pool.cached_statements == 16
+    assert default.pool.cached_statements == ConnectionPool.DEFAULT_CACHED_STATEMENTS
+    tuned.execute_script("CREATE TABLE categories (id INTEGER PRIMARY KEY);")
+    assert tuned.select_one("SELECT COUNT(*) AS n FROM categories;") == {"n": 0}
+    with pytest.raises(ValueError):
+        ConnectionPool(str(tmp_path / "bad.db"), cached_statements=-1)
+
+    for db in (tuned, default):
+        db.close()
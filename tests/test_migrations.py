@@ -0,0 +1,73 @@
+import importlib
+from src.database.db_manager import DatabaseManager
+from src.repositories.monthly_aggregate_repository import MonthlyAggregateRepository
+
+MIGRATIONS = "src.database.migrations."
+
+
+def _columns(db, table):
+    return {row["name"] for row in db.select(f"PRAGMA table_info({table});")}
+
+
+def test_integer_cents_migration_backfills_in_chunks(tmp_path):
+    """0005 converte valores FLOAT em centavos, em lotes, e pode ser revertida"""
+    db = DatabaseManager(str(tmp_path / "legacy.db"), profile="test")
+    for name in (
+        "0001_initial_schema",
+        "0002_transactions_date_id_index",
+        "0003_transactions_access_path_indexes",
+        "0004_monthly_aggregates",
+    ):
+        db.execute_script(importlib.import_module(MIGRATIONS + name).up())
+
+    db.insert(
+        "INSERT INTO payment_methods (name, type, balance, credit_limit) "
+        "VALUES ('Cartão', 'CREDIT', 10.1, 5000);",
+        (),
+    )
+    db.insert(
+        "INSERT INTO payment_methods (name, type, balance) "
+        "VALUES ('Conta', 'DEBIT', NULL);",
+        (),
+    )
+    amounts = [0.1, 0.2, 0.285, 19.99, 1234.5]
+    db.insert_many(
+        "INSERT INTO transactions (amount, date, type, payment_method_id) "
+        "VALUES (?, '2024-05-10', 'EXPENSE', 1);",
+        [(amount,) for amount in amounts],
+    )
+
+    migration = importlib.import_module(MIGRATIONS + "0005_integer_cents")
+    migration.convert(db, to_cents=True, chunk_size=2)
+
+    assert "amount" not in _columns(db, "transactions")
+    rows = db.select("SELECT amount_cents FROM transactions ORDER BY id;")
+    assert [row["amount_cents"] for row in rows] == [10, 20, 29, 1999, 123450]
+    assert db.select(
+        "SELECT balance_cents, credit_limit_cents FROM payment_methods ORDER BY id;"
+    ) == [
+        {"balance_cents": 1010, "credit_limit_cents": 500000},
+        {"balance_cents": 0, "credit_limit_cents": None},
+    ]
+    aggregate = db.select_one("SELECT total_cents, count FROM monthly_aggregates;")
+    assert aggregate == {"total_cents": 125508, "count": 5}
+
+    # Triggers passam a somar centavos
+    db.insert(
+        "INSERT INTO transactions (amount_cents, date, type, payment_method_id) "
+        "VALUES (92, '2024-05-11', 'EXPENSE', 1);",
+        (),
+    )
+    assert MonthlyAggregateRepository(db).check_consistency() == []
+
+    # Reaplicar sobre um banco já convertido não altera nada
+    migration.convert(db, to_cents=True, chunk_size=2)
+    assert db.select_one("SELECT SUM(amount_cents) AS s FROM transactions;") == {
+        "s": 125600
+    }
+
+    migration.down(db)
+    assert "amount_cents" not in _columns(db, "transactions")
+    assert db.select_one("SELECT total FROM monthly_aggregates;") == {"total": 1256.0}
+
+    db.close()
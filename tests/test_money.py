@@ -0,0 +1,51 @@
+import pickle
+from decimal import Decimal
+import pytest
+from src.models.money import Money
+
+
+def test_money_is_exact_and_compares_with_numbers():
+    """Money guarda centavos inteiros e compara exatamente com números"""
+    assert Money(10.5).cents == 1050
+    assert Money("0.285").cents == 29
+    assert Money(0.285).cents == 29
+    assert Money(Decimal("-1.005")).cents == -101
+    assert Money.from_cents(199) == Money("1.99")
+
+    # Dez somas de 0,10 dão exatamente 1,00
+    total = sum(Money(0.1) for _ in range(10))
+    assert total == 1 and total.cents == 100
+    assert Money(0.1) + 0.2 == Money("0.30")
+    assert 5 - Money(1.25) == Money(3.75)
+    assert Money(10) / 4 == Money("2.50")
+    assert Money(10) / Money(4) == 2.5
+    assert 3 * Money(1.1) == Money("3.30")
+
+    assert Money(10) > 9.99 and Money(10) >= 10 and Money(1) < 2
+    # The float 1.1 is slightly above 1.10
+    assert Money(10) < 10.004 and Money("1.10") < 1.1
+
+    # Equal values hash alike; floats are never equal to Money
+    assert Money(10) == 10 and hash(Money(10)) == hash(10)
+    assert Money("1.10") == Decimal("1.1")
+    assert hash(Money("1.10")) == hash(Decimal("1.1"))
+    assert Money(1.1) != 1.1 and Money(10) != 10.0 and Money(10) != 10.004
+    assert len({Money(1.1), 1.1}) == 2 and {1.1: "x"}.get(Money(1.1)) is None
+    assert len({Money(10), 10, Decimal("10.00")}) == 1
+    assert not Money() and -Money(2) == -2 and abs(Money(-2)) == 2
+
+    assert f"{Money(1234567.891):,.2f}" == "1,234,567.89"
+    assert str(Money(5)) == "5.00" and repr(Money(5)) == "Money('5.00')"
+    assert float(Money(2.5)) == 2.5
+    assert pickle.loads(pickle.dumps(Money(7.77))) == Money(7.77)
+
+    assert Money.from_field({"amount_cents": 250}, "amount") == Money("2.50")
+    assert Money.from_field({"amount": 2.5}, "amount") == Money("2.50")
+    assert Money.from_field({"amount": None}, "amount", Money()) == 0
+
+    with pytest.raises(TypeError):
+        Money(True)
+    with pytest.raises(ValueError):
+        Money("dez")
+    with pytest.raises(TypeError):
+        Money(1) + "1"
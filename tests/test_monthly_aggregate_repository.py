@@ -0,0 +1,87 @@
+from datetime import datetime
+from src.models.transaction.expense import Expense
+from src.models.transaction.income import Income
+from src.repositories.monthly_aggregate_repository import MonthlyAggregateRepository
+from utils.period import Period
+
+
+def test_triggers_keep_monthly_aggregates_consistent(
+    test_db,
+    transaction_service,
+    transaction_repo,
+    category_service,
+    sample_payment_method,
+    sample_category,
+):
+    """Inserts, updates and deletes keep the aggregates equal to the raw table"""
+    aggregates = MonthlyAggregateRepository(db=test_db)
+    may = Period.month(2024, 5)
+
+    lunch = transaction_service.add_transaction(
+        Expense(
+            amount=30,
+            date=datetime(2024, 5, 10),
+            category=sample_category,
+            payment_method=sample_payment_method,
+        )
+    )
+    transaction_service.add_transaction(
+        Expense(
+            amount=20,
+            date=datetime(2024, 5, 11),
+            category=sample_category,
+            payment_method=sample_payment_method,
+        )
+    )
+    salary = transaction_service.add_transaction(
+        Income(
+            amount=1000,
+            date=datetime(2024, 5, 5),
+            payment_method=sample_payment_method,
+        )
+    )
+    assert aggregates.check_consistency() == []
+    assert transaction_repo.get_expenses_per_category_for_current_month(may) == [
+        {"name": "Alimentação", "total_expense": 50}
+    ]
+    assert transaction_repo.get_current_month_totals_by_payment_method(may) == {
+        sample_payment_method.id: {"income": 1000, "expense": 50}
+    }
+
+    # Moving a transaction to another month updates both months
+    lunch.date = datetime(2024, 6, 1)
+    lunch.amount = 35
+    assert transaction_service.update_transaction(lunch)
+    assert transaction_repo.get_monthly_expenses(Period.last_months(2, may.end)) == [
+        {"month": "05/2024", "total": 20},
+        {"month": "06/2024", "total": 35},
+    ]
+
+    assert transaction_service.delete_transaction(salary.id)
+    # ON DELETE SET NULL on categories also goes through the update trigger
+    assert category_service.delete_category(sample_category.id)
+    assert aggregates.check_consistency() == []
+    assert transaction_repo.get_expenses_per_category_for_current_month(may) == []
+
+
+def test_rebuild_repairs_drifted_aggregates(
+    test_db, transaction_service, sample_payment_method
+):
+    """The checker reports drift and rebuild recomputes from transactions"""
+    aggregates = MonthlyAggregateRepository(db=test_db)
+    transaction_service.add_transaction(
+        Income(
+            amount=10, date=datetime(2024, 1, 2), payment_method=sample_payment_method
+        )
+    )
+
+    test_db.update("UPDATE monthly_aggregates SET total_cents = total_cents + 1;", ())
+    test_db.insert(
+        "INSERT INTO monthly_aggregates (year_month, type, total_cents, count) "
+        "VALUES ('1999-01', 'EXPENSE', 500, 1);",
+        (),
+    )
+    assert len(aggregates.check_consistency()) == 2
+
+    assert aggregates.rebuild()
+    assert aggregates.check_consistency() == []
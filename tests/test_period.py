@@ -0,0 +1,26 @@
+import pytest
+from datetime import date, datetime
+from utils.period import Period
+
+
+def test_period_bounds_and_month_arithmetic():
+    """Períodos viram limites ISO semiabertos, atravessando anos corretamente"""
+    assert Period.month(2024, 12).bounds() == ("2024-12-01", "2025-01-01")
+    assert Period.current_month(date(2024, 2, 29)) == Period.month(2024, 2)
+
+    last_three = Period.last_months(3, today=date(2025, 1, 15))
+    assert last_three.bounds() == ("2024-11-01", "2025-02-01")
+    assert datetime(2024, 11, 1, 0, 0) in last_three
+    assert date(2025, 2, 1) not in last_three
+
+    clause, params = Period.month(2024, 5).sql("t.date")
+    assert clause == "t.date >= ? AND t.date < ?"
+    assert params == ("2024-05-01", "2024-06-01")
+
+    upcoming = Period.upcoming(1, today=date(2024, 12, 31))
+    assert upcoming.bounds() == ("2025-01-01", "2025-02-01")
+
+    with pytest.raises(ValueError):
+        Period(date(2024, 5, 1), date(2024, 5, 1))
+    with pytest.raises(ValueError):
+        Period.last_months(0)
@@ -0,0 +1,53 @@
+from src.database.db_manager import DatabaseManager
+from src.database.query_instrumentation import QueryInstrumentation
+from src.models.category import Category
+from src.repositories.category_repository import CategoryRepository
+from utils.task_runner import TaskRunner
+
+
+def test_instrumentation_times_tags_and_groups_queries(test_db, tmp_path, fake_master):
+    """Events carry timing, rows and caller; actions follow worker tasks"""
+    log = tmp_path / "slow.log"
+    instrumentation = QueryInstrumentation(slow_query_ms=0, slow_query_log=str(log))
+    events = []
+    instrumentation.add_hook(events.append)
+    db = DatabaseManager(test_db.db_file, instrumentation=instrumentation)
+    repo = CategoryRepository(db=db)
+
+    repo.save(Category(name="Mercado"))
+    repo.save(Category(name="Lazer"))
+    assert [c.name for c in repo.get_all()] == ["Lazer", "Mercado"]
+    assert [(e.label, e.rows, e.caller) for e in events] == [
+        ("INSERT", 1, "CategoryRepository.save"),
+        ("INSERT", 1, "CategoryRepository.save"),
+        ("SELECT", 2, "CategoryRepository.get_all"),
+    ]
+    assert all(e.elapsed_ms >= 0 and e.action is None for e in events)
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 3
+
+    # Queries of an action count for it, including those run on the pool
+    runner = TaskRunner(fake_master)
+    with instrumentation.action("Carteira") as wallet:
+        repo.get_by_id(1)
+        task = runner.submit(repo.get_all)
+    task.future.result()
+    fake_master.pump()
+    runner.shutdown()
+    repo.get_by_id(2)
+
+    assert wallet.queries == 2 and wallet.rows == 3
+    assert [e.action for e in events[3:]] == ["Carteira", "Carteira", None]
+    assert events[4].caller == "CategoryRepository.get_all"
+    (line,) = instrumentation.report()
+    assert line.startswith("Carteira: 2 queries, ")
+
+    # Errors are recorded before the manager reports them
+    db.select("SELECT * FROM missing_table;")
+    assert "missing_table" in events[-1].error
+
+    # Without instrumentation nothing is recorded
+    instrumentation.remove_hook(events.append)
+    repo.get_all()
+    CategoryRepository(db=test_db).get_all()
+    assert len(events) == 7
+    assert test_db.instrumentation is None
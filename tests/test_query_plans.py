@@ -0,0 +1,81 @@
+import re
+import sqlite3
+from datetime import date
+import pytest
+from src.repositories.transaction_filter import TransactionFilter
+from utils.period import Period
+
+# Filters combining every condition that has an index behind it
+FILTERED = (
+    TransactionFilter()
+    .of_types("EXPENSE")
+    .within(Period.current_month())
+    .in_categories([1, 2])
+    .amount_between(10, 500)
+    .installments(False)
+)
+
+# Every repository query that reads the transactions table
+TRANSACTION_QUERIES = [
+    ("get_all", ()),
+    ("get_by_id", (1,)),
+    ("get_page", ()),
+    ("get_current_month_totals_by_payment_method", ()),
+    ("get_total_expenses_for_current_month", ()),
+    ("get_most_added_category_for_current_month", ()),
+    ("count_month_transactions", ()),
+    ("get_expenses_per_category_for_current_month", ()),
+    ("get_monthly_expenses", ()),
+    ("get_category_stats", ()),
+    ("get_dashboard_snapshot", ()),
+    ("search", ("mercado",)),
+    ("find", (FILTERED,)),
+    ("find", (TransactionFilter().with_payment_methods([1, 2]).limited(50),)),
+    ("find", (TransactionFilter().within(Period.last_months(3)).sorted_by("amount"),)),
+    ("aggregate", (FILTERED, "category")),
+    ("aggregate", (TransactionFilter().of_types("INCOME"), "month")),
+    ("get_page", (None, None, 50, FILTERED)),
+    ("search", ("mercado", FILTERED)),
+    ("get_page", (None, None, 100, TransactionFilter().until(date.today()))),
+    ("search", ("mercado", TransactionFilter().until(date.today()))),
+    ("get_installments_due", ()),
+    ("get_purchase", (1,)),
+]
+
+# A plan step reading the transactions table without any index
+FULL_SCAN = re.compile(r"^SCAN (t|transactions)$")
+
+
+def record_queries(monkeypatch, db) -> list[tuple[str, tuple]]:
+    """Captures the SQL and parameters sent through the db manager"""
+    recorded = []
+    for name in ("select", "select_one", "select_iter"):
+        original = getattr(db, name)
+
+        def recorder(query, params=(), *args, _original=original, **kwargs):
+            recorded.append((query, params))
+            return _original(query, params, *args, **kwargs)
+
+        monkeypatch.setattr(db, name, recorder)
+    return recorded
+
+
+@pytest.mark.parametrize("method, args", TRANSACTION_QUERIES)
+def test_transaction_queries_use_indexes(
+    monkeypatch, test_db, transaction_repo, method, args
+):
+    """EXPLAIN QUERY PLAN of each repository query never shows a table scan"""
+    recorded = record_queries(monkeypatch, test_db)
+    getattr(transaction_repo, method)(*args)
+    assert recorded
+
+    conn = sqlite3.connect(test_db._db_file)
+    try:
+        for query, params in recorded:
+            plan = [
+                row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params)
+            ]
+            assert plan
+            assert not any(FULL_SCAN.match(step) for step in plan), plan
+    finally:
+        conn.close()
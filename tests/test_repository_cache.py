@@ -0,0 +1,114 @@
+import sqlite3
+from datetime import datetime
+from src.container import ServiceContainer
+from src.database.migration_manager import MigrationManager
+from src.database.data_version_watcher import DataVersionWatcher
+from src.models.category import Category
+from src.models.payment_method.debit import Debit
+from src.models.transaction.expense import Expense
+from src.repositories.category_repository import CategoryRepository
+from src.repositories.payment_method_repository import PaymentMethodRepository
+from src.repositories.repository_cache import RepositoryCache
+
+
+def test_repository_cache_reads_through_and_invalidates(test_db):
+    """Leituras repetidas vêm do cache; gravações e outros processos o limpam"""
+    cache = RepositoryCache(max_size=2, watcher=DataVersionWatcher(test_db.db_file))
+    repo = CategoryRepository(test_db, cache=cache)
+    food = repo.save(Category(name="Alimentação"))
+    rent = repo.save(Category(name="Moradia"))
+
+    assert repo.get_by_id(food).name == "Alimentação"
+    assert repo.get_by_id(food).name == "Alimentação"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Cada leitura devolve um objeto novo, sem alterar o que está em cache
+    repo.get_by_id(food).name = "Alterada"
+    assert repo.get_by_id(food).name == "Alimentação"
+
+    # LRU: a terceira chave descarta a usada há mais tempo
+    repo.get_by_id(rent)
+    repo.get_all()
+    assert cache.stats()["evictions"] == 1
+    assert len(cache) == 2
+
+    # Gravações pelo repositório limpam o cache
+    repo.save(Category(id=rent, name="Aluguel"))
+    assert len(cache) == 0
+    assert [c.name for c in repo.get_all()] == ["Alimentação", "Aluguel"]
+
+    # Gravação por outra conexão é detectada pelo PRAGMA data_version
+    detected = cache.stats()["external_invalidations"]
+    external = sqlite3.connect(test_db.db_file)
+    external.execute("UPDATE categories SET name = 'Mercado' WHERE id = ?;", (food,))
+    external.commit()
+    external.close()
+    assert repo.get_by_id(food).name == "Mercado"
+    assert cache.stats()["external_invalidations"] == detected + 1
+
+    # Dentro de uma unidade de trabalho o cache é ignorado
+    misses = cache.misses
+    with test_db.transaction():
+        repo.get_by_id(food)
+    assert cache.misses == misses
+    cache.close()
+
+
+def test_payment_method_cache_tracks_balance_updates(test_db):
+    """Pagamentos aplicados direto no banco também invalidam o cache"""
+    cache = RepositoryCache()
+    repo = PaymentMethodRepository(test_db, cache=cache)
+    debit_id = repo.save(Debit(balance=100, name="Conta"))
+
+    assert repo.get_by_id(debit_id).balance == 100
+    assert repo.apply_payment(debit_id, 30, is_expense=True)
+    assert repo.get_by_id(debit_id).balance == 70
+
+    repo.adjust_balances({debit_id: 1000})
+    assert repo.get_by_id(debit_id).balance == 60
+    assert repo.get_by_id(debit_id).balance == 60
+    assert cache.stats() == {
+        "hits": 1,
+        "misses": 3,
+        "evictions": 0,
+        "external_invalidations": 0,
+        "size": 1,
+    }
+
+
+def test_own_writes_keep_the_cache_warm_and_external_ones_clear_it(tmp_path):
+    """Só gravações de outros processos limpam os caches do container"""
+    container = ServiceContainer(str(tmp_path / "cache.db"), profile="test")
+    MigrationManager(container.db).apply_all_pending()
+    categories = container.category_service
+    cache = container.category_cache
+    food = categories.add_category(Category(name="Alimentação"))
+    debit = container.payment_method_service.add_payment_method(
+        Debit(name="Conta", balance=100)
+    )
+
+    categories.get_category_by_id(food.id)
+    categories.get_category_by_id(food.id)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Transação e saldo gravados pelo mesmo processo não afetam categorias
+    container.transaction_service.add_transaction(
+        Expense(
+            amount=10,
+            date=datetime(2024, 5, 1),
+            category=food,
+            payment_method=debit,
+        )
+    )
+    assert categories.get_category_by_id(food.id).name == "Alimentação"
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.stats()["external_invalidations"] == 0
+
+    external = sqlite3.connect(container.db.db_file)
+    external.execute("UPDATE categories SET name = 'Mercado' WHERE id = ?;", (food.id,))
+    external.commit()
+    external.close()
+    assert categories.get_category_by_id(food.id).name == "Mercado"
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.stats()["external_invalidations"] == 1
+    container.close()
@@ -0,0 +1,50 @@
+import threading
+from utils.task_runner import TaskRunner
+
+
+def test_task_runner_delivers_results_on_main_thread_and_cancels(fake_master):
+    """Resultados chegam pelo after(); tarefas canceladas não chamam callbacks"""
+    runner = TaskRunner(fake_master, max_workers=2)
+    main_thread = threading.get_ident()
+    delivered = []
+
+    def work(value):
+        return value * 2, threading.get_ident()
+
+    task = runner.submit(work, 21, on_done=delivered.append, group="home")
+    task.future.result()
+    fake_master.pump()
+    (result, worker_thread), = delivered
+    assert result == 42
+    assert worker_thread != main_thread
+    assert runner.pending == 0
+
+    # Erros vão para on_error
+    errors = []
+    task = runner.submit(lambda: 1 / 0, on_error=errors.append)
+    task.future.result()
+    fake_master.pump()
+    assert isinstance(errors[0], ZeroDivisionError)
+
+    # Cancelamento por grupo descarta só as tarefas daquele grupo
+    started, release = threading.Event(), threading.Event()
+
+    def blocked():
+        started.set()
+        release.wait()
+        return "late"
+
+    slow = runner.submit(blocked, on_done=delivered.append, group="metrics")
+    fast = runner.submit(lambda: "ok", on_done=delivered.append, group="wallet")
+    started.wait()
+    runner.cancel("metrics")
+    release.set()
+    fast.future.result()
+    slow.future.result()
+    fake_master.pump()
+    assert slow.cancelled
+    assert delivered[1:] == ["ok"]
+    assert runner.pending == 0
+
+    runner.shutdown()
+    assert not fake_master.scheduled
@@ -0,0 +1,79 @@
+from datetime import date, datetime
+import pytest
+from src.models.transaction.expense import Expense
+from src.models.transaction.income import Income
+from utils.period import Period
+
+np = pytest.importorskip("numpy")
+
+from src.analytics.transaction_frame import TransactionFrame  # noqa: E402
+
+
+def test_transaction_frame_groups_and_buckets(
+    test_db,
+    transaction_service,
+    sample_payment_method,
+    sample_category,
+):
+    """Frame carregado do SQLite agrupa e separa períodos de forma vetorizada"""
+    rows = [
+        (datetime(2024, 1, 31, 23, 59), 10.10),
+        (datetime(2024, 2, 1, 8, 0), 20.20),
+        (datetime(2024, 2, 5, 12, 0), 0.30),
+        (datetime(2024, 3, 4, 9, 30), 5.00),
+    ]
+    for moment, amount in rows:
+        transaction_service.add_transaction(
+            Expense(
+                amount=amount,
+                description="Compra",
+                date=moment,
+                category=sample_category,
+                payment_method=sample_payment_method,
+            )
+        )
+    transaction_service.add_transaction(
+        Income(
+            amount=1000,
+            description="Salário",
+            date=datetime(2024, 2, 10),
+            payment_method=sample_payment_method,
+        )
+    )
+
+    frame = TransactionFrame.load(test_db)
+    assert len(frame) == 5
+    assert frame.dates.tolist() == sorted(frame.dates.tolist())
+    assert frame.dates[0] == date(2024, 1, 31).toordinal()
+
+    expenses = frame.expenses()
+    assert expenses.amounts.tolist() == [1010, 2020, 30, 500]
+    assert expenses.group_sum("category_ids") == {sample_category.id: 3560}
+    assert frame.group_count("types") == {0: 1, 1: 4}
+    assert frame.incomes().group_sum("payment_method_ids") == {
+        sample_payment_method.id: 100_000
+    }
+
+    assert expenses.group_sum(expenses.bucket("month")) == {
+        date(2024, 1, 1): 1010,
+        date(2024, 2, 1): 2050,
+        date(2024, 3, 1): 500,
+    }
+    # Semanas começam na segunda-feira (2024-01-29 e 2024-02-05 são segundas)
+    assert expenses.group_count(expenses.bucket("week")) == {
+        date(2024, 1, 29): 2,
+        date(2024, 2, 5): 1,
+        date(2024, 3, 4): 1,
+    }
+    assert expenses.group_sum(expenses.bucket("year")) == {date(2024, 1, 1): 3560}
+
+    february = Period.month(2024, 2)
+    assert len(frame.within(february)) == 3
+    loaded = TransactionFrame.load(test_db, february)
+    assert loaded.ids.tolist() == frame.within(february).ids.tolist()
+    assert len(TransactionFrame.load(test_db, Period.month(2023, 1))) == 0
+
+    with pytest.raises(ValueError):
+        frame.group_sum("amounts")
+    with pytest.raises(ValueError):
+        frame.bucket("quarter")
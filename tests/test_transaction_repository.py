@@ -0,0 +1,438 @@
+import threading
+import pytest
+from datetime import date, datetime, timedelta
+from src.models.category import Category
+from src.models.money import Money
+from src.models.payment_method.debit import Debit
+from src.models.transaction.income import Income
+from src.models.transaction.expense import Expense
+from src.models.transaction.transaction_type import TransactionType
+from src.repositories.transaction_filter import TransactionFilter
+from src.services.transaction_service import TransactionService
+from utils.period import Period
+
+
+def test_get_all_hydrates_relations_in_one_query(
+    monkeypatch,
+    transaction_service,
+    transaction_repo,
+    sample_payment_method,
+    sample_category,
+):
+    """get_all loads transactions, payment methods and categories together"""
+    for i in range(5):
+        transaction_service.add_transaction(
+            Expense(
+                amount=10 + i,
+                description=f"Compra {i}",
+                category=sample_category,
+                payment_method=sample_payment_method,
+            )
+        )
+    transaction_service.add_transaction(
+        Income(amount=100, description="Salário", payment_method=sample_payment_method)
+    )
+
+    calls = []
+    db = transaction_repo.db
+    for name in ("select", "select_one", "select_iter"):
+        original = getattr(db, name)
+
+        def counted(*args, _original=original, **kwargs):
+            calls.append(args)
+            return _original(*args, **kwargs)
+
+        monkeypatch.setattr(db, name, counted)
+
+    transactions = transaction_repo.get_all()
+
+    assert len(calls) == 1
+    assert len(transactions) == 6
+    expenses = [t for t in transactions if isinstance(t, Expense)]
+    assert all(e.category.name == "Alimentação" for e in expenses)
+    assert all(t.payment_method.name == "Cartão Teste" for t in transactions)
+    # Rows pointing at the same method share one hydrated instance
+    assert len({id(t.payment_method) for t in transactions}) == 1
+    # Models use __slots__, no per-instance dict
+    assert not any(hasattr(t, "__dict__") for t in transactions)
+
+    fetched = transaction_repo.get_by_id(expenses[0].id)
+    assert fetched.category.id == sample_category.id
+    assert fetched.payment_method.credit_limit == 5000
+
+
+def _add_expenses(service, payment_method, category, dates):
+    return [
+        service.add_transaction(
+            Expense(
+                amount=1,
+                description=f"Compra {d.isoformat()}",
+                date=d,
+                category=category,
+                payment_method=payment_method,
+            )
+        )
+        for d in dates
+    ]
+
+
+def test_get_page_walks_ledger_by_keyset(
+    transaction_service, sample_payment_method, sample_category
+):
+    """Pages follow (date DESC, id DESC) and share dates without overlapping"""
+    base = datetime(2024, 1, 1)
+    # Two transactions per day to exercise the id tie-breaker
+    dates = [base + timedelta(days=i // 2) for i in range(25)]
+    saved = _add_expenses(
+        transaction_service, sample_payment_method, sample_category, dates
+    )
+    transaction_service.add_transaction(
+        Income(amount=5, date=base, payment_method=sample_payment_method)
+    )
+
+    walked = []
+    page = transaction_service.get_page(limit=10, filters={"type": "EXPENSE"})
+    while page:
+        walked.extend(page)
+        last = page[-1]
+        page = transaction_service.get_page(
+            last.date, last.id, limit=10, filters={"type": "EXPENSE"}
+        )
+
+    expected = sorted(saved, key=lambda t: (t.date, t.id), reverse=True)
+    assert [t.id for t in walked] == [t.id for t in expected]
+
+    with pytest.raises(ValueError):
+        transaction_service.get_page(filters={"amount": 1})
+
+
+def test_get_page_is_stable_under_concurrent_inserts(
+    test_db, transaction_service, sample_payment_method, sample_category
+):
+    """Rows inserted while paging never cause duplicates or skipped rows"""
+    base = datetime(2024, 1, 1)
+    original = _add_expenses(
+        transaction_service,
+        sample_payment_method,
+        sample_category,
+        [base + timedelta(hours=i) for i in range(40)],
+    )
+
+    stop = threading.Event()
+
+    def writer():
+        # Separate service on another thread: its own pooled connection
+        service = TransactionService(db=test_db)
+        i = 0
+        while not stop.is_set():
+            i += 1
+            _add_expenses(
+                service,
+                sample_payment_method,
+                sample_category,
+                [base + timedelta(hours=i % 40, minutes=30), datetime(2030, 1, 1)],
+            )
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        walked = []
+        page = transaction_service.get_page(limit=7)
+        while page:
+            walked.extend(page)
+            # Inserts landing before, inside and after the current position
+            _add_expenses(
+                transaction_service,
+                sample_payment_method,
+                sample_category,
+                [page[-1].date, datetime(2031, 1, 1), base - timedelta(days=1)],
+            )
+            page = transaction_service.get_page(page[-1].date, page[-1].id, limit=7)
+    finally:
+        stop.set()
+        thread.join()
+
+    ids = [t.id for t in walked]
+    assert len(ids) == len(set(ids))
+    assert {t.id for t in original} <= set(ids)
+    keys = [(t.date, t.id) for t in walked]
+    assert keys == sorted(keys, reverse=True)
+
+
+def test_aggregates_use_half_open_period_bounds(
+    transaction_service, transaction_repo, sample_payment_method, sample_category
+):
+    """Transactions on the period edges land in exactly one month"""
+    _add_expenses(
+        transaction_service,
+        sample_payment_method,
+        sample_category,
+        [
+            datetime(2024, 4, 30, 23, 59, 59),
+            datetime(2024, 5, 1),
+            datetime(2024, 5, 31, 23, 59, 59),
+            datetime(2024, 6, 1),
+        ],
+    )
+    may = Period.month(2024, 5)
+
+    assert transaction_repo.count_month_transactions(may) == 2
+    assert transaction_repo.get_total_expenses_for_current_month(may) == 2
+    assert transaction_repo.get_expenses_per_category_for_current_month(may) == [
+        {"name": "Alimentação", "total_expense": 2}
+    ]
+    totals = transaction_repo.get_current_month_totals_by_payment_method(may)
+    assert totals[sample_payment_method.id]["expense"] == 2
+
+    monthly = transaction_repo.get_monthly_expenses(
+        Period(date(2024, 4, 1), date(2024, 7, 1))
+    )
+    assert monthly == [
+        {"month": "04/2024", "total": 1},
+        {"month": "05/2024", "total": 2},
+        {"month": "06/2024", "total": 1},
+    ]
+
+
+def test_dashboard_snapshot_matches_individual_queries(
+    transaction_service,
+    transaction_repo,
+    category_service,
+    sample_payment_method,
+    sample_category,
+):
+    """The snapshot gives the same numbers as the per-metric queries, in one read"""
+    rent = category_service.add_category(Category(name="Moradia"))
+    may = Period.month(2024, 5)
+    day = datetime(2024, 5, 10)
+    for amount, category in [(30, sample_category), (5, sample_category), (900, rent)]:
+        transaction_service.add_transaction(
+            Expense(
+                amount=amount,
+                description="Compra",
+                date=day,
+                category=category,
+                payment_method=sample_payment_method,
+            )
+        )
+    transaction_service.add_transaction(
+        Expense(
+            amount=7,
+            description="Avulsa",
+            date=day,
+            payment_method=sample_payment_method,
+        )
+    )
+    transaction_service.add_transaction(
+        Income(
+            amount=2000,
+            description="Salário",
+            date=day,
+            payment_method=sample_payment_method,
+        )
+    )
+
+    calls = []
+    original = transaction_repo.db.select
+    transaction_repo.db.select = lambda *args: calls.append(args) or original(*args)
+    try:
+        snapshot = transaction_service.get_dashboard_snapshot(may)
+    finally:
+        del transaction_repo.db.select
+    assert len(calls) == 1
+
+    assert snapshot.total_expense == (
+        transaction_repo.get_total_expenses_for_current_month(may)
+    )
+    assert snapshot.total_expense == 942
+    assert snapshot.total_income == 2000
+    assert snapshot.balance == 1058
+    assert snapshot.transaction_count == transaction_repo.count_month_transactions(may)
+    assert snapshot.top_category == "Moradia"
+    assert snapshot.top_category == (
+        transaction_repo.get_most_added_category_for_current_month(may)
+    )
+    assert snapshot.most_frequent_category == "Alimentação"
+    assert snapshot.most_frequent_category == (
+        transaction_repo.get_category_stats(may)["most_used"]
+    )
+    assert [c.to_dict() for c in snapshot.categories] == [
+        {"name": "Moradia", "total_expense": 900, "count": 1},
+        {"name": "Alimentação", "total_expense": 35, "count": 2},
+    ]
+    assert snapshot.daily_expense_average(date(2024, 6, 20)) == Money("30.39")
+    assert snapshot.daily_expense_average(date(2024, 4, 1)) == 0
+
+    empty = transaction_service.get_dashboard_snapshot(Period.month(2020, 1))
+    assert (empty.total_expense, empty.transaction_count, empty.top_category) == (
+        0,
+        0,
+        "",
+    )
+
+
+def test_search_uses_fts_index_kept_in_sync_by_triggers(
+    transaction_service, transaction_repo, sample_payment_method, sample_category
+):
+    """Full-text search matches prefixes without accents and follows every write"""
+    descriptions = [
+        "Café da manhã na padaria",
+        "Mercado Central",
+        "Mercado do bairro",
+        "Farmácia São João",
+    ]
+    saved = [
+        transaction_service.add_transaction(
+            Expense(
+                amount=10,
+                description=text,
+                date=datetime(2024, 5, day),
+                category=sample_category,
+                payment_method=sample_payment_method,
+            )
+        )
+        for day, text in enumerate(descriptions, start=1)
+    ]
+    transaction_service.add_transaction(
+        Income(
+            amount=50,
+            description="Mercado livre reembolso",
+            payment_method=sample_payment_method,
+        )
+    )
+
+    def found(text, **kwargs):
+        return [t.description for t in transaction_service.search(text, **kwargs)]
+
+    assert found("cafe") == ["Café da manhã na padaria"]
+    assert found("sao jo") == ["Farmácia São João"]
+    assert set(found("merc")) == {
+        "Mercado Central",
+        "Mercado do bairro",
+        "Mercado livre reembolso",
+    }
+    assert found("merc", filters={"type": "EXPENSE"}, limit=1) in (
+        ["Mercado Central"],
+        ["Mercado do bairro"],
+    )
+    # FTS5 syntax typed by the user is treated as plain words
+    assert found('merc" OR "*') == []
+    assert found("  ") == []
+
+    saved[1].description = "Hortifruti Central"
+    transaction_service.update_transaction(saved[1])
+    transaction_service.delete_transaction(saved[2].id)
+    assert found("mercado", filters={"type": "EXPENSE"}) == []
+    assert found("hortifruti central") == ["Hortifruti Central"]
+
+    with pytest.raises(ValueError):
+        transaction_repo.search("cafe", filters={"description": "x"})
+
+
+def test_transaction_filter_drives_lists_pages_and_aggregates(
+    transaction_service,
+    transaction_repo,
+    category_service,
+    payment_service,
+    sample_payment_method,
+    sample_category,
+):
+    """One filter object compiles to the same conditions for every query"""
+    transport = category_service.add_category(Category(name="Transporte"))
+    # Installments on debit stay a single row (only credit purchases expand)
+    debit = payment_service.add_payment_method(
+        Debit(id=None, name="Conta Corrente", balance=1000)
+    )
+    rows = [
+        (10, sample_category, datetime(2024, 5, 2), 1, "Padaria", None),
+        (80, sample_category, datetime(2024, 5, 10), 3, "Mercado parcelado", debit),
+        (25, transport, datetime(2024, 5, 15), 1, "Ônibus", None),
+        (300, transport, datetime(2024, 6, 1), 1, "Passagem", None),
+    ]
+    saved = [
+        transaction_service.add_transaction(
+            Expense(
+                amount=amount,
+                description=description,
+                date=when,
+                category=category,
+                payment_method=method or sample_payment_method,
+                total_installments=installments,
+            )
+        )
+        for amount, category, when, installments, description, method in rows
+    ]
+    transaction_service.add_transaction(
+        Income(
+            amount=1000, date=datetime(2024, 5, 5), payment_method=sample_payment_method
+        )
+    )
+
+    may_expenses = (
+        TransactionFilter()
+        .of_types(TransactionType.EXPENSE)
+        .within(Period.month(2024, 5))
+    )
+    clauses, params = may_expenses.in_categories([1, 2]).conditions("t")
+    assert clauses == [
+        "t.type = ?",
+        "t.category_id IN (?, ?)",
+        "t.date >= ? AND t.date < ?",
+    ]
+    assert params == ["EXPENSE", 1, 2, "2024-05-01", "2024-06-01"]
+    # IN lists grow in powers of two, so 3 and 4 ids share one statement
+    clauses, params = TransactionFilter().in_categories([1, 2, 3]).conditions("")
+    assert clauses == ["category_id IN (?, ?, ?, ?)"]
+    assert params == [1, 2, 3, 3]
+
+    def descriptions(filters):
+        return [t.description for t in transaction_service.find(filters)]
+
+    assert descriptions(may_expenses) == ["Ônibus", "Mercado parcelado", "Padaria"]
+    assert descriptions(may_expenses.sorted_by("amount").limited(2)) == [
+        "Mercado parcelado",
+        "Ônibus",
+    ]
+    assert descriptions(may_expenses.amount_between(20, 80)) == [
+        "Ônibus",
+        "Mercado parcelado",
+    ]
+    assert descriptions(may_expenses.installments(True)) == ["Mercado parcelado"]
+    assert descriptions(may_expenses.in_categories([transport.id])) == ["Ônibus"]
+    assert descriptions(may_expenses.in_categories([])) == []
+    # Filters are immutable: specializing one never changes the base
+    assert len(transaction_service.find(may_expenses)) == 3
+
+    assert transaction_service.aggregate(may_expenses) == [
+        {"group": None, "total": 115, "count": 3}
+    ]
+    by_category = transaction_service.aggregate(
+        TransactionFilter().of_types(TransactionType.EXPENSE), group_by="category"
+    )
+    assert by_category == [
+        {"group": sample_category.id, "total": 90, "count": 2},
+        {"group": transport.id, "total": 325, "count": 2},
+    ]
+    by_month = transaction_service.aggregate(
+        TransactionFilter().with_payment_methods([sample_payment_method.id, debit.id]),
+        group_by="month",
+    )
+    assert [(row["group"], row["count"]) for row in by_month] == [
+        ("2024-05", 4),
+        ("2024-06", 1),
+    ]
+
+    # Pages and search take the same filter, on top of their own ordering
+    page = transaction_service.get_page(limit=2, filters=may_expenses)
+    assert [t.id for t in page] == [saved[2].id, saved[1].id]
+    assert [
+        t.description
+        for t in transaction_service.search("mercado", filters=may_expenses)
+    ] == ["Mercado parcelado"]
+
+    with pytest.raises(ValueError):
+        TransactionFilter().sorted_by("description")
+    with pytest.raises(ValueError):
+        TransactionFilter().of_types("TRANSFER")
+    with pytest.raises(ValueError):
+        transaction_service.aggregate(group_by="description")
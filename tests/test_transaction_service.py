@@ -1,7 +1,16 @@
 import pytest
+from datetime import date, datetime, timedelta
+from src.database.db_manager import DatabaseManager
+from src.database.query_instrumentation import QueryInstrumentation
+from src.models.installment_plan import InstallmentPlan
+from src.models.money import Money
 from src.models.transaction.income import Income
 from src.models.transaction.expense import Expense
 from src.models.payment_method.credit import Credit
+from src.models.payment_method.debit import Debit
+from src.repositories.transaction_filter import TransactionFilter
+from src.repositories.transaction_repository import TransactionRepository
+from utils.period import Period
 
 
 def test_full_transaction_workflow(
@@ -18,7 +27,7 @@ def test_full_transaction_workflow(
     assert saved_income.amount == 3000
     assert saved_income.payment_method.id == sample_payment_method.id
 
-    # 2. Test creating a new expense
+    # 2. Test creating a new expense (3 installments on credit: 3 rows)
     expense = Expense(
         amount=150,
         description="Superercado",
@@ -29,10 +38,11 @@ def test_full_transaction_workflow(
     saved_expense = transaction_service.add_transaction(expense)
     assert saved_expense.id is not None
     assert saved_expense.category.id == sample_category.id
+    assert saved_expense.amount == 50
 
     # 3. Test get_all_transactions
     transactions = transaction_service.get_all_transactions()
-    assert len(transactions) == 2
+    assert len(transactions) == 4
     assert isinstance(transactions[0], (Income, Expense))
 
     # 4. Test get_transaction_by_id
@@ -40,11 +50,229 @@ def test_full_transaction_workflow(
     assert fetched_income.description == "Salário"
 
     # 5. Test update_transaction
-    expense.description = "Mercado Municipal"
-    assert transaction_service.update_transaction(expense) is True
-    updated = transaction_service.get_transaction_by_id(expense.id)
+    saved_expense.description = "Mercado Municipal"
+    assert transaction_service.update_transaction(saved_expense) is True
+    updated = transaction_service.get_transaction_by_id(saved_expense.id)
     assert updated.description == "Mercado Municipal"
+    assert updated.amount == 50
 
     # 6. Test delete_transaction
     assert transaction_service.delete_transaction(saved_income.id) is True
+    assert len(transaction_service.get_all_transactions()) == 3
+
+
+def test_add_transaction_is_atomic(transaction_service, payment_service):
+    """Ledger row and balance change are written together or not at all"""
+    debit = payment_service.add_payment_method(
+        Debit(id=None, name="Conta Corrente", balance=100)
+    )
+
+    saved = transaction_service.add_transaction(
+        Expense(amount=60, description="Farmácia", payment_method=debit)
+    )
+    assert saved.id is not None
+    assert payment_service.get_payment_method_by_id(debit.id).balance == 40
+
+    # Insufficient balance: nothing is recorded
+    declined = transaction_service.add_transaction(
+        Expense(amount=50, description="Mercado", payment_method=debit)
+    )
+    assert declined is None
+    assert payment_service.get_payment_method_by_id(debit.id).balance == 40
+    assert len(transaction_service.get_all_transactions()) == 1
+
+    # A failure after the balance update rolls the balance back too
+    broken = Income(amount=10, description="Reembolso", payment_method=debit)
+    broken._transaction_type = "INVALID"
+    assert transaction_service.add_transaction(broken) is None
+    assert payment_service.get_payment_method_by_id(debit.id).balance == 40
     assert len(transaction_service.get_all_transactions()) == 1
+
+
+def test_add_transactions_bulk_import(
+    transaction_service, payment_service, sample_payment_method, sample_category
+):
+    """Bulk import writes every row and applies net balance deltas"""
+    debit = payment_service.add_payment_method(
+        Debit(id=None, name="Conta Corrente", balance=0)
+    )
+
+    def generate():
+        for i in range(25):
+            yield Expense(
+                amount=2,
+                date=datetime(2024, 3, 1),
+                category=sample_category,
+                payment_method=sample_payment_method,
+            )
+            yield {
+                "type": "INCOME",
+                "amount": 10,
+                "date": "2024-03-02T00:00:00",
+                "payment_method_id": debit.id,
+            }
+
+    assert transaction_service.add_transactions(generate(), chunk_size=7) == 50
+    assert len(transaction_service.get_all_transactions()) == 50
+    # Credit: 1000 used + 25 * 2 in expenses; debit: 25 * 10 in incomes
+    credit = payment_service.get_payment_method_by_id(sample_payment_method.id)
+    assert credit.balance == 1050
+    assert payment_service.get_payment_method_by_id(debit.id).balance == 250
+
+    with pytest.raises(ValueError):
+        transaction_service.add_transactions(
+            [{"type": "EXPENSE", "amount": 5, "date": "2024-03-03"}]
+        )
+    assert len(transaction_service.get_all_transactions()) == 50
+
+
+def test_installment_purchase_expands_into_monthly_rows(
+    test_db, transaction_service, payment_service, sample_payment_method
+):
+    """A credit purchase in N installments becomes N rows of one purchase"""
+    purchase = Expense(
+        amount=Money("3600.01"),
+        description="Apartamento",
+        date=datetime(2024, 1, 31),
+        payment_method=sample_payment_method,
+        total_installments=360,
+    )
+    saved = transaction_service.add_transaction(purchase)
+    assert saved.id is not None and saved.purchase_id is not None
+    # The purchase comes back as installment 1, as stored
+    assert (saved.current_installment, saved.amount) == (1, Money("10.01"))
+    saved.description = "Apartamento (entrada)"
+    assert transaction_service.update_transaction(saved) is True
+
+    rows = transaction_service.get_purchase(saved.purchase_id)
+    assert [r.current_installment for r in rows] == list(range(1, 361))
+    assert rows[0].id == saved.id
+    assert rows[0].description == "Apartamento (entrada)"
+    assert sum(r.amount.cents for r in rows) == 360001
+    assert (rows[0].amount, rows[1].amount) == (Money("10.01"), Money("10.00"))
+    # Same day every month, or the last day of shorter months
+    assert [r.date.date().isoformat() for r in rows[:4]] == [
+        "2024-01-31",
+        "2024-02-29",
+        "2024-03-31",
+        "2024-04-30",
+    ]
+    assert rows[-1].date == datetime(2053, 12, 31)
+    # The card limit is taken once, for the whole purchase
+    credit = payment_service.get_payment_method_by_id(sample_payment_method.id)
+    assert credit.balance == Money("4600.01")
+
+    transaction_service.add_transaction(
+        Expense(
+            amount=5, date=datetime(2024, 2, 10), payment_method=sample_payment_method
+        )
+    )
+    due = transaction_service.get_installments_due(Period.month(2024, 2))
+    assert [(r.current_installment, r.purchase_id) for r in due] == [
+        (2, saved.purchase_id)
+    ]
+
+    # Expansion costs the same few round trips for 2 or 360 installments
+    instrumentation = QueryInstrumentation()
+    events = []
+    instrumentation.add_hook(events.append)
+    repo = TransactionRepository(
+        DatabaseManager(test_db.db_file, instrumentation=instrumentation)
+    )
+    for installments in (2, 360):
+        expense = Expense(
+            amount=720, date=datetime(2024, 3, 1), total_installments=installments
+        )
+        purchase_id, ids = repo.save_purchase(
+            expense, InstallmentPlan(expense.amount, installments, expense.date)
+        )
+        assert len(ids) == installments
+    assert len(events) == 6 and len(events[:3]) == len(events[3:])
+
+    assert transaction_service.delete_purchase(purchase_id) is True
+    assert transaction_service.get_purchase(purchase_id) == []
+    assert transaction_service.delete_purchase(purchase_id) is False
+    assert len(transaction_service.get_all_transactions()) == 363
+
+    with pytest.raises(ValueError):
+        InstallmentPlan(100, 361, datetime(2024, 1, 1))
+    with pytest.raises(ValueError):
+        InstallmentPlan(Money.from_cents(2), 3, datetime(2024, 1, 1))
+
+
+def test_history_stops_at_today_and_upcoming_installments_list_apart(
+    transaction_service, sample_payment_method
+):
+    """Scheduled installments never push recent transactions off the feed"""
+    today = date.today()
+    earlier = transaction_service.add_transaction(
+        Expense(
+            amount=20,
+            date=datetime.combine(today - timedelta(days=3), datetime.min.time()),
+            payment_method=sample_payment_method,
+        )
+    )
+    purchase = transaction_service.add_transaction(
+        Expense(
+            amount=120,
+            description="Compra parcelada",
+            date=datetime.combine(today, datetime.min.time()),
+            payment_method=sample_payment_method,
+            total_installments=12,
+        )
+    )
+
+    # Without the bound, the 11 future installments come first
+    newest = transaction_service.get_page(limit=2)
+    assert [t.current_installment for t in newest] == [12, 11]
+
+    history = transaction_service.get_page(
+        limit=2, filters=TransactionFilter().until(today)
+    )
+    assert [t.id for t in history] == [purchase.id, earlier.id]
+
+    # Search over the history stops at today too
+    assert len(transaction_service.search("parcelada")) == 12
+    found = transaction_service.search(
+        "parcelada", filters=TransactionFilter().until(today)
+    )
+    assert [t.id for t in found] == [purchase.id]
+
+    upcoming = transaction_service.get_installments_due(Period.upcoming(1, today))
+    assert [(t.purchase_id, t.current_installment) for t in upcoming] == [
+        (purchase.purchase_id, 2)
+    ]
+
+
+def test_dashboard_counts_installments_only_once_they_are_due(
+    transaction_service, sample_payment_method
+):
+    """An installment dated later this month is not spent yet"""
+    transaction_service.add_transaction(
+        Expense(
+            amount=300,
+            date=datetime(2024, 6, 25),
+            payment_method=sample_payment_method,
+            total_installments=3,
+        )
+    )
+    transaction_service.add_transaction(
+        Expense(
+            amount=36, date=datetime(2024, 7, 5), payment_method=sample_payment_method
+        )
+    )
+    july = Period.month(2024, 7)
+
+    # On July 18 the installment of July 25 is still ahead
+    snapshot = transaction_service.get_dashboard_snapshot(july, date(2024, 7, 18))
+    assert snapshot.as_of == date(2024, 7, 18)
+    assert (snapshot.total_expense, snapshot.transaction_count) == (36, 1)
+    assert snapshot.daily_expense_average() == 2
+
+    month_end = transaction_service.get_dashboard_snapshot(july, date(2024, 7, 31))
+    assert (month_end.total_expense, month_end.transaction_count) == (136, 2)
+
+    upcoming = transaction_service.get_dashboard_snapshot(
+        Period.month(2024, 8), date(2024, 7, 18)
+    )
+    assert (upcoming.total_expense, upcoming.transaction_count) == (0, 0)
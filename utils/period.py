@@ -0,0 +1,107 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+
+class Period:
+    """
+    Intervalo de datas semiaberto [start, end).
+
+    Converte períodos como "mês atual" ou "últimos N meses" em limites
+    comparáveis diretamente com a coluna de data, permitindo que o SQLite
+    use os índices em vez de avaliar strftime() em cada linha.
+    """
+
+    def __init__(self, start: date, end: date):
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        if start >= end:
+            raise ValueError("Period start must be before its end")
+        self._start = start
+        self._end = end
+
+    @property
+    def start(self) -> date:
+        """Primeiro dia incluído no período"""
+        return self._start
+
+    @property
+    def end(self) -> date:
+        """Primeiro dia após o período"""
+        return self._end
+
+    @staticmethod
+    def _add_months(day: date, months: int) -> date:
+        """Retorna o primeiro dia do mês deslocado em `months` meses"""
+        index = day.year * 12 + day.month - 1 + months
+        return date(index // 12, index % 12 + 1, 1)
+
+    @classmethod
+    def month(cls, year: int, month: int) -> "Period":
+        """Período de um mês específico"""
+        start = date(year, month, 1)
+        return cls(start, cls._add_months(start, 1))
+
+    @classmethod
+    def current_month(cls, today: Optional[date] = None) -> "Period":
+        """Período do mês atual"""
+        today = today or date.today()
+        return cls.month(today.year, today.month)
+
+    @classmethod
+    def last_months(cls, months: int, today: Optional[date] = None) -> "Period":
+        """Período dos últimos `months` meses, incluindo o atual"""
+        if months <= 0:
+            raise ValueError("Number of months must be positive")
+        current = cls.current_month(today)
+        return cls(cls._add_months(current.start, 1 - months), current.end)
+
+    @classmethod
+    def upcoming(cls, months: int = 1, today: Optional[date] = None) -> "Period":
+        """Período de amanhã até o fim dos próximos `months` meses"""
+        if months <= 0:
+            raise ValueError("Number of months must be positive")
+        today = today or date.today()
+        end = cls._add_months(cls.current_month(today).start, months + 1)
+        return cls(today + timedelta(days=1), end)
+
+    def bounds(self) -> tuple[str, str]:
+        """Limites em texto ISO, no mesmo formato das datas gravadas"""
+        return self._start.isoformat(), self._end.isoformat()
+
+    def month_keys(self) -> tuple[str, str]:
+        """
+        Limites no formato "YYYY-MM", usados pelos agregados mensais.
+
+        Raises:
+            ValueError: Se o período não começar e terminar no dia 1
+        """
+        if self._start.day != 1 or self._end.day != 1:
+            raise ValueError("Period must start and end on the first day of a month")
+        return self._start.isoformat()[:7], self._end.isoformat()[:7]
+
+    def sql(self, column: str = "date") -> tuple[str, tuple[str, str]]:
+        """
+        Gera o filtro SQL do período para a coluna informada.
+
+        Returns:
+            Tupla com o trecho "column >= ? AND column < ?" e seus parâmetros
+        """
+        return f"{column} >= ? AND {column} < ?", self.bounds()
+
+    def __contains__(self, value: date) -> bool:
+        if isinstance(value, datetime):
+            value = value.date()
+        return self._start <= value < self._end
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Period):
+            return NotImplemented
+        return (self._start, self._end) == (other._start, other._end)
+
+    def __hash__(self) -> int:
+        return hash((self._start, self._end))
+
+    def __repr__(self) -> str:
+        return f"Period({self._start.isoformat()}, {self._end.isoformat()})"
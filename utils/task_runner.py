@@ -0,0 +1,152 @@
+import contextvars
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Optional
+
+
+class Task:
+    """Tarefa enviada ao TaskRunner; cancelada, seus callbacks não rodam"""
+
+    def __init__(
+        self,
+        group: Optional[Hashable],
+        on_done: Optional[Callable[[Any], None]],
+        on_error: Optional[Callable[[Exception], None]],
+    ):
+        self.group = group
+        self.on_done = on_done
+        self.on_error = on_error
+        self.future: Optional[Future] = None
+        self._cancelled = False
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        """Descarta o resultado; se a tarefa ainda não começou, nem a executa"""
+        self._cancelled = True
+        if self.future is not None:
+            self.future.cancel()
+
+
+class TaskRunner:
+    """
+    Executa chamadas demoradas (consultas e hidratação) fora da thread do Tk.
+
+    As funções rodam em um pool de threads e os resultados voltam por uma
+    fila, lida na thread principal com `after()`; assim os callbacks podem
+    mexer nos widgets com segurança. O master só precisa oferecer `after`
+    e `after_cancel`, como qualquer widget do Tk.
+
+    Cada função roda com uma cópia do contexto (contextvars) de quem a
+    enviou, então a ação de interface em andamento continua valendo para
+    as consultas feitas no pool.
+    """
+
+    POLL_INTERVAL_MS = 30
+
+    def __init__(self, master, max_workers: int = 2, poll_interval_ms: int = 0):
+        """
+        Args:
+            master: Widget usado para agendar a leitura dos resultados
+            max_workers: Threads do pool
+            poll_interval_ms: Intervalo entre leituras da fila (padrão: 30 ms)
+        """
+        self._master = master
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="ui-task"
+        )
+        self._interval = poll_interval_ms or self.POLL_INTERVAL_MS
+        self._results: queue.Queue = queue.Queue()
+        self._tasks: set[Task] = set()
+        self._lock = threading.Lock()
+        self._poll_id = None
+
+    @property
+    def pending(self) -> int:
+        """Quantidade de tarefas aguardando resultado"""
+        with self._lock:
+            return len(self._tasks)
+
+    def submit(
+        self,
+        func: Callable[..., Any],
+        *args,
+        on_done: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        group: Optional[Hashable] = None,
+        **kwargs,
+    ) -> Task:
+        """
+        Agenda `func(*args, **kwargs)` no pool.
+
+        Args:
+            on_done: Recebe o retorno, na thread principal
+            on_error: Recebe a exceção, na thread principal (padrão: imprime)
+            group: Chave usada para cancelar tarefas relacionadas juntas
+
+        Returns:
+            Task que pode ser cancelada
+        """
+        task = Task(group, on_done, on_error)
+
+        def run():
+            if task.cancelled:
+                return
+            try:
+                self._results.put((task, True, func(*args, **kwargs)))
+            except Exception as e:
+                self._results.put((task, False, e))
+
+        with self._lock:
+            self._tasks.add(task)
+        task.future = self._executor.submit(contextvars.copy_context().run, run)
+        self._schedule_poll()
+        return task
+
+    def cancel(self, group: Optional[Hashable] = None) -> None:
+        """Cancela as tarefas do grupo informado, ou todas sem grupo"""
+        with self._lock:
+            tasks = [t for t in self._tasks if group is None or t.group == group]
+            self._tasks.difference_update(tasks)
+        for task in tasks:
+            task.cancel()
+
+    def shutdown(self) -> None:
+        """Cancela tudo e libera as threads do pool"""
+        self.cancel()
+        if self._poll_id is not None:
+            self._master.after_cancel(self._poll_id)
+            self._poll_id = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule_poll(self) -> None:
+        if self._poll_id is None:
+            self._poll_id = self._master.after(self._interval, self._poll)
+
+    def _poll(self) -> None:
+        """Entrega os resultados prontos aos callbacks (thread principal)"""
+        self._poll_id = None
+        while True:
+            try:
+                task, ok, value = self._results.get_nowait()
+            except queue.Empty:
+                break
+            with self._lock:
+                self._tasks.discard(task)
+            if task.cancelled:
+                continue
+            if ok:
+                if task.on_done is not None:
+                    task.on_done(value)
+            elif task.on_error is not None:
+                task.on_error(value)
+            else:
+                print(f"Error in background task: {value}")
+
+        with self._lock:
+            has_pending = bool(self._tasks)
+        if has_pending:
+            self._schedule_poll()
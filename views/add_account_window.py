@@ -1,13 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.services.payment_method_service import PaymentMethodService
+from src.container import ServiceContainer
 from src.models.payment_method.debit import Debit
 from src.models.payment_method.credit import Credit
 from src.models.payment_method.payment_type import PaymentType
 
 
 class AddAccountWindow(tk.Toplevel):
-    def __init__(self, master=None, wallet_window=None):
+    def __init__(self, master=None, wallet_window=None, container=None):
         super().__init__(master)
         self.wallet_window = wallet_window
         self.title("Adicionar Nova Conta")
@@ -28,7 +28,9 @@ class AddAccountWindow(tk.Toplevel):
             "medium_red": "#ae2012",
         }
 
-        self.payment_method_service = PaymentMethodService()
+        self.payment_method_service = (
+            container or ServiceContainer.default()
+        ).payment_method_service
 
         self.configure(bg=self.colors["light_gray"])
         self.create_widgets()
@@ -1,11 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from src.services.category_service import CategoryService
+from src.container import ServiceContainer
 from src.models.category import Category
 
 
 class AddCategoryWindow(tk.Toplevel):
-    def __init__(self, master=None, callback=None):
+    def __init__(self, master=None, callback=None, container=None):
         super().__init__(master)
         self.title("Adicionar Nova Categoria")
         self.geometry("400x300")
@@ -25,7 +25,9 @@ class AddCategoryWindow(tk.Toplevel):
             "medium_red": "#ae2012",
         }
 
-        self.category_service = CategoryService()
+        self.category_service = (
+            container or ServiceContainer.default()
+        ).category_service
 
         self.configure(bg=self.colors["light_gray"])
         self.create_widgets()
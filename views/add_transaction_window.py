@@ -1,18 +1,15 @@
 import tkinter as tk
 from tkinter import ttk
-from tkcalendar import DateEntry
 from datetime import datetime
-from src.services.transaction_service import TransactionService
+from src.container import ServiceContainer
 from src.models.transaction.income import Income
 from src.models.transaction.expense import Expense
 from views.add_category_window import AddCategoryWindow
-from src.services.category_service import CategoryService
-from src.services.payment_method_service import PaymentMethodService
 from src.models.payment_method.payment_type import PaymentType
 
 
 class AddTransactionWindow(tk.Toplevel):
-    def __init__(self, master=None, callback=None):
+    def __init__(self, master=None, callback=None, container=None):
         super().__init__(master)
         self.title("Adicionar Transação")
         self.geometry("650x700")
@@ -34,9 +31,10 @@ class AddTransactionWindow(tk.Toplevel):
         }
         self.categories_data = {}
 
-        self.transaction_service = TransactionService()
-        self.category_service = CategoryService()
-        self.payment_method_service = PaymentMethodService()
+        self.container = container or ServiceContainer.default()
+        self.transaction_service = self.container.transaction_service
+        self.category_service = self.container.category_service
+        self.payment_method_service = self.container.payment_method_service
         self.payment_methods_data = {}
 
         self.configure(bg=self.colors["light_gray"])
@@ -178,6 +176,9 @@ class AddTransactionWindow(tk.Toplevel):
 
         # Data
         ttk.Label(parent, text="Data *").pack(anchor="w", pady=(0, 5))
+        # Importado aqui para não pesar na abertura do aplicativo
+        from tkcalendar import DateEntry
+
         self.date_entry = DateEntry(
             parent,
             font=("Segoe UI", 10),
@@ -352,7 +353,9 @@ class AddTransactionWindow(tk.Toplevel):
                 self.categories["values"] = updated_names
                 self.categories.set(new_category.name)
 
-        AddCategoryWindow(self, callback=update_categories)
+        AddCategoryWindow(
+            self, callback=update_categories, container=self.container
+        )
 
     def hide_categories(self):
         """Esconde o campo de categorias"""
@@ -448,7 +451,8 @@ class AddTransactionWindow(tk.Toplevel):
         category_name = self.categories.get() if hasattr(self, "categories") else None
         category = self.categories_data.get(category_name) if category_name else None
 
-        installment = self.installments.get() if hasattr(self, "installment") else None
+        installments_entry = getattr(self, "installments", None)
+        installment = installments_entry.get() if installments_entry else None
 
         # Validação
         errors = []
@@ -474,7 +478,7 @@ class AddTransactionWindow(tk.Toplevel):
         if transaction_type == "Despesa":
             if not category:
                 errors.append("Selecione uma categoria")
-            if payment_method == "Crédito":
+            if payment_method and payment_method.payment_type == PaymentType.CREDIT:
                 try:
                     installment = int(installment) if installment else 0
                     if installment <= 0 or installment > 360:
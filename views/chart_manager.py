@@ -0,0 +1,176 @@
+import math
+from typing import Hashable, Optional, Sequence
+from matplotlib.figure import Figure
+
+EMPTY_MESSAGE = "Sem dados disponíveis"
+
+
+class PieChart:
+    """Pizza de gastos por categoria, atualizada sem recriar a figura"""
+
+    FIGSIZE = (10, 8)
+    START_ANGLE = 140
+    LABEL_DISTANCE = 1.1
+    PCT_DISTANCE = 0.6
+
+    def __init__(self, ax):
+        self.ax = ax
+        self.patches, self.texts, self.autotexts = [], [], []
+        self.notice = ax.text(
+            0.5, 0.5, EMPTY_MESSAGE, ha="center", va="center", transform=ax.transAxes
+        )
+        ax.set_axis_off()
+
+    def update(self, labels: Sequence[str], values: Sequence[float]) -> None:
+        """
+        Aplica os novos dados às fatias existentes.
+
+        Com a mesma quantidade de fatias, só os ângulos e textos mudam; se a
+        quantidade mudar, as fatias são refeitas.
+        """
+        total = float(sum(values))
+        empty = not values or total <= 0
+        self.notice.set_visible(empty)
+
+        if empty or len(self.patches) != len(values):
+            for artist in (*self.patches, *self.texts, *self.autotexts):
+                artist.remove()
+            self.patches, self.texts, self.autotexts = [], [], []
+            if not empty:
+                self.patches, self.texts, self.autotexts = self.ax.pie(
+                    values,
+                    labels=labels,
+                    autopct="%1.1f%%",
+                    startangle=self.START_ANGLE,
+                    labeldistance=self.LABEL_DISTANCE,
+                    pctdistance=self.PCT_DISTANCE,
+                )
+                self.ax.axis("equal")
+            return
+
+        theta = self.START_ANGLE
+        for patch, text, autotext, label, value in zip(
+            self.patches, self.texts, self.autotexts, labels, values
+        ):
+            share = value / total
+            patch.set_theta1(theta)
+            patch.set_theta2(theta + 360 * share)
+            middle = math.radians(theta + 180 * share)
+            x, y = math.cos(middle), math.sin(middle)
+            text.set_text(label)
+            text.set_position((self.LABEL_DISTANCE * x, self.LABEL_DISTANCE * y))
+            text.set_horizontalalignment("left" if x > 0 else "right")
+            autotext.set_text(f"{share * 100:1.1f}%")
+            autotext.set_position((self.PCT_DISTANCE * x, self.PCT_DISTANCE * y))
+            theta += 360 * share
+
+
+class LineChart:
+    """Linha de gastos mensais, atualizada com set_data"""
+
+    FIGSIZE = (8, 4)
+
+    def __init__(self, ax):
+        self.ax = ax
+        (self.line,) = ax.plot([], [], marker="o", color="teal")
+        self.notice = ax.text(
+            0.5, 0.5, EMPTY_MESSAGE, ha="center", va="center", transform=ax.transAxes
+        )
+        ax.set_title("Gastos Mensais")
+        ax.set_ylabel("Valor (R$)")
+        ax.grid(True)
+
+    def update(self, labels: Sequence[str], values: Sequence[float]) -> None:
+        """Aplica os novos pontos à linha existente"""
+        empty = not values
+        self.notice.set_visible(empty)
+        self.line.set_visible(not empty)
+        if empty:
+            self.ax.set_xticks([])
+            return
+
+        positions = range(len(values))
+        self.line.set_data(positions, values)
+        self.ax.set_xticks(positions, labels, rotation=45)
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+
+class ChartManager:
+    """
+    Mantém uma figura e um canvas por tipo de gráfico da tela de métricas.
+
+    Alternar entre os gráficos só troca o canvas exibido; os dados são
+    aplicados nos artistas existentes e, se a versão dos dados for a mesma
+    já desenhada, nada é redesenhado. As figuras são criadas com Figure (e
+    não com pyplot), então não ficam registradas globalmente.
+    """
+
+    CHARTS = {"pizza": PieChart, "linha": LineChart}
+
+    def __init__(self, master):
+        """
+        Args:
+            master: Widget onde os canvas são exibidos
+        """
+        self.master = master
+        self._charts: dict[str, tuple] = {}
+        self._versions: dict[str, Hashable] = {}
+        self._visible: Optional[str] = None
+
+    def _chart(self, kind: str):
+        """Gráfico e canvas de `kind`, criados uma única vez"""
+        if kind not in self._charts:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+            chart_class = self.CHARTS[kind]
+            figure = Figure(figsize=chart_class.FIGSIZE, layout="tight")
+            chart = chart_class(figure.add_subplot())
+            canvas = FigureCanvasTkAgg(figure, master=self.master)
+            self._charts[kind] = (chart, canvas)
+        return self._charts[kind]
+
+    def show(
+        self,
+        kind: str,
+        labels: Sequence[str],
+        values: Sequence[float],
+        version: Optional[Hashable] = None,
+    ) -> bool:
+        """
+        Exibe o gráfico `kind` com os dados informados.
+
+        Args:
+            kind: "pizza" ou "linha"
+            labels: Rótulos das fatias ou dos pontos
+            values: Valores correspondentes
+            version: Identifica os dados (padrão: os próprios rótulos e valores)
+
+        Returns:
+            True se o gráfico foi redesenhado, False se veio do cache
+        """
+        if version is None:
+            version = (tuple(labels), tuple(values))
+        chart, canvas = self._chart(kind)
+
+        redrawn = self._versions.get(kind) != version
+        if redrawn:
+            chart.update(list(labels), list(values))
+            self._versions[kind] = version
+            canvas.draw_idle()
+
+        if self._visible != kind:
+            if self._visible is not None:
+                self._charts[self._visible][1].get_tk_widget().pack_forget()
+            canvas.get_tk_widget().pack(pady=20)
+            self._visible = kind
+        return redrawn
+
+    def close(self) -> None:
+        """Descarta figuras e canvas"""
+        for _, canvas in self._charts.values():
+            canvas.get_tk_widget().destroy()
+            canvas.figure.clear()
+        self._charts.clear()
+        self._versions.clear()
+        self._visible = None
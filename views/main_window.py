@@ -1,14 +1,18 @@
 import tkinter as tk
 from tkinter import ttk
-from views.add_transaction_window import AddTransactionWindow
-from views.wallet_window import WalletWindow
-from views.metrics_window import MetricsWindow
 from views.transactions_panel import TransactionsPanel
+from src.container import ServiceContainer
+from src.database.db_manager import DatabaseManager
+from utils.task_runner import TaskRunner
 
 
 class MainWindow(tk.Tk):
-    def __init__(self):
+    def __init__(self, container=None):
         super().__init__()
+        # Serviços compartilhados por todas as telas
+        self.container = container or ServiceContainer.default()
+        # Consultas das telas rodam fora da thread do Tk
+        self.tasks = TaskRunner(self)
         self.title("Organizador de Despesas")
         self.geometry("1000x650")
         self.resizable(True, True)
@@ -97,6 +101,24 @@ class MainWindow(tk.Tk):
             background=self.color_palette["light_gray"],
         )
 
+        # Lista de transações do painel inicial
+        style.configure(
+            "Transactions.Treeview",
+            font=("Segoe UI", 12),
+            rowheight=28,
+            background=self.color_palette["white"],
+            fieldbackground=self.color_palette["white"],
+            foreground=self.color_palette["dark_blue"],
+            borderwidth=0,
+        )
+        style.configure(
+            "Transactions.Treeview.Heading",
+            font=("Segoe UI", 12),
+            background=self.color_palette["white"],
+            foreground=self.color_palette["dark_blue"],
+            relief="flat",
+        )
+
     def create_widgets(self):
         # Frame principal que contém sidebar e content
         main_container = tk.Frame(self, bg=self.color_palette["light_gray"])
@@ -145,23 +167,33 @@ class MainWindow(tk.Tk):
         # Carregar conteúdo inicial
         self.show_home()
 
-    def switch_content(self, new_frame_class):
-        # Remove o conteúdo atual
+    def clear_content(self):
+        """Cancela as cargas da tela atual e remove seus widgets"""
+        self.tasks.cancel()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
+
+    def switch_content(self, new_frame_class):
+        # Remove o conteúdo atual
+        self.clear_content()
         # Insere novo conteúdo
-        frame = new_frame_class(self.content_frame, self.color_palette)
+        frame = new_frame_class(
+            self.content_frame, self.color_palette, self.container, self.tasks
+        )
         frame.pack(expand=True, fill="both")
 
     def show_home(self):
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
+        with self.container.action("Home"):
+            self.build_home()
+
+    def build_home(self):
+        self.clear_content()
 
         title = ttk.Label(self.content_frame, text="Tela inicial", style="Title.TLabel")
         title.pack(pady=(0, 20), anchor="w")
 
         self.transactions_panel = TransactionsPanel(
-            self.content_frame, self.color_palette
+            self.content_frame, self.color_palette, self.container, self.tasks
         )
         self.transactions_panel.pack(expand=True, fill="both")
 
@@ -173,16 +205,35 @@ class MainWindow(tk.Tk):
         )
         add_btn.pack(pady=20, ipadx=20, ipady=5)
 
+    # As demais telas são importadas no primeiro uso, fora da abertura
     def open_add_transaction(self):
-        AddTransactionWindow(
-            master=self, callback=self.transactions_panel.refresh_transactions
-        )
+        from views.add_transaction_window import AddTransactionWindow
+
+        with self.container.action("Adicionar Transação"):
+            AddTransactionWindow(
+                master=self,
+                callback=self.transactions_panel.refresh_transactions,
+                container=self.container,
+            )
 
     def open_wallet(self):
-        self.switch_content(WalletWindow)
+        from views.wallet_window import WalletWindow
+
+        with self.container.action("Carteira"):
+            self.switch_content(WalletWindow)
 
     def open_metrics(self):
-        self.switch_content(MetricsWindow)
+        from views.metrics_window import MetricsWindow
+
+        with self.container.action("Métricas"):
+            self.switch_content(MetricsWindow)
 
     def quit(self):
+        self.tasks.shutdown()
+        if self.container.instrumentation is not None:
+            # Consultas por tela aberta durante a sessão
+            for line in self.container.instrumentation.report():
+                print(line)
         self.destroy()
+        self.container.close()
+        DatabaseManager.close_all_pools()
@@ -1,31 +1,39 @@
 import locale
 from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter import ttk
-from src.services.transaction_service import TransactionService
+from src.container import ServiceContainer
 from utils import date
+from utils.task_runner import TaskRunner
+from views.chart_manager import ChartManager
 
 
 class MetricsWindow(tk.Frame):
-    def __init__(self, master, color_palette):
+    def __init__(self, master, color_palette, container=None, tasks=None):
         super().__init__(master, bg=color_palette["light_gray"])
         self.color_palette = color_palette
         self.selected_view = tk.StringVar(value="categoria")
-        self.transaction_service = TransactionService()
-        self.figures = []
+        self.transaction_service = (
+            container or ServiceContainer.default()
+        ).transaction_service
+        # Sem o runner da MainWindow, a tela cria o seu e o encerra ao sair
+        self.owns_tasks = tasks is None
+        self.tasks = tasks or TaskRunner(self)
+        self.charts = None
+        # Últimos dados de cada modo, exibidos na hora ao alternar
+        self.last_data = {}
         self.create_widgets()
 
         self.bind("<Destroy>", self.on_destroy)
 
     def on_destroy(self, event):
-        """Fecha todos os recursos gráficos quando o frame for destruído"""
-
-        for fig in self.figures:
-            plt.close(fig)
-
-        self.figures.clear()
+        """Fecha os gráficos e o runner próprio quando o frame for destruído"""
+        if event.widget is not self:
+            return
+        if self.charts is not None:
+            self.charts.close()
+        if self.owns_tasks:
+            self.tasks.shutdown()
 
     def create_widgets(self):
         # Frame principal
@@ -72,28 +80,65 @@ class MetricsWindow(tk.Frame):
         )
         self.metrics_frame.pack(fill="both", expand=True)
 
+        # Valores recriados a cada carga; os gráficos são reaproveitados
+        self.values_frame = tk.Frame(self.metrics_frame, bg=self.color_palette["white"])
+        self.values_frame.pack(fill="x")
+        chart_frame = tk.Frame(self.metrics_frame, bg=self.color_palette["white"])
+        chart_frame.pack(fill="both", expand=True)
+        self.charts = ChartManager(chart_frame)
+
         self.populate_metrics("categoria")
 
     def update_view(self):
-        for widget in self.metrics_frame.winfo_children():
-            widget.destroy()
-
-        self.on_destroy(None)
         self.populate_metrics(self.selected_view.get())
 
     def populate_metrics(self, modo):
+        """
+        Exibe as métricas do modo e as atualiza em segundo plano.
+
+        Se o modo já foi carregado, os dados anteriores aparecem na hora;
+        senão, um aviso de carregamento fica no lugar até a consulta terminar.
+        """
+        self.tasks.cancel(group=self)
+        if modo in self.last_data:
+            self.show_metrics(modo, self.last_data[modo])
+        else:
+            for widget in self.values_frame.winfo_children():
+                widget.destroy()
+            ttk.Label(
+                self.values_frame, text="Carregando métricas...", style="TLabel"
+            ).pack(anchor="w", pady=5)
+        self.tasks.submit(
+            self.load_metrics,
+            modo,
+            on_done=lambda data: self.show_metrics(modo, data),
+            group=self,
+        )
+
+    def load_metrics(self, modo):
+        """Consulta os dados do modo escolhido (executado fora da thread do Tk)"""
+        snapshot = self.transaction_service.get_dashboard_snapshot()
+        if modo == "mes":
+            return snapshot, self.transaction_service.get_monthly_expenses()
+        return snapshot, None
+
+    def show_metrics(self, modo, data):
+        """Substitui o aviso de carregamento pelas métricas e pelo gráfico"""
+        if not self.values_frame.winfo_exists() or modo != self.selected_view.get():
+            return
+        self.last_data[modo] = data
+        for widget in self.values_frame.winfo_children():
+            widget.destroy()
+
+        snapshot, monthly_data = data
         if modo == "categoria":
-            # Obter dados para visualização por categoria
-            expenses_per_category = (
-                self.transaction_service.find_expenses_per_category_for_current_month()
-            )
-            total_expense = (
-                self.transaction_service.find_total_expense_for_current_month()
-            )
-            most_used_category = (
-                self.transaction_service.find_most_used_category_for_current_month()
-            )
-            monthly_transactions = self.transaction_service.count_transactions()
+            # Todas as métricas do mês vêm de uma única consulta
+            expenses_per_category = [
+                category.to_dict() for category in snapshot.categories
+            ]
+            total_expense = snapshot.total_expense
+            most_used_category = snapshot.top_category
+            monthly_transactions = snapshot.transaction_count
 
             dados = [
                 ("Total Gasto:", f"R$ {total_expense:.2f}"),
@@ -101,12 +146,13 @@ class MetricsWindow(tk.Frame):
                 ("Transações no mês:", monthly_transactions),
             ]
 
-            # Criar gráfico de pizza com os dados reais
-            grafico = self.criar_grafico_pizza(expenses_per_category)
+            grafico = (
+                "pizza",
+                [item["name"] for item in expenses_per_category],
+                [float(item["total_expense"]) for item in expenses_per_category],
+            )
 
         elif modo == "mes":
-            # Obter dados para visualização por mês (você precisará implementar isso no service)
-            monthly_data = self.transaction_service.get_monthly_expenses()
             total_current = monthly_data[-1]["total"] if monthly_data else 0.0
             total_previous = monthly_data[-2]["total"] if len(monthly_data) > 1 else 0.0
             average = (
@@ -115,6 +161,8 @@ class MetricsWindow(tk.Frame):
                 else 0
             )
 
+            daily_average = snapshot.daily_expense_average()
+
             current_month_en = datetime.now().strftime("%B").capitalize()
             previous_month_en = (
                 (datetime.now().replace(day=1) - timedelta(days=1))
@@ -129,64 +177,21 @@ class MetricsWindow(tk.Frame):
                 (f"Total em {current_month_name}:", f"R$ {total_current:.2f}"),
                 (f"Total em {previous_month_name}:", f"R$ {total_previous:.2f}"),
                 ("Média mensal:", f"R$ {average:.2f}"),
+                ("Média diária no mês:", f"R$ {daily_average:.2f}"),
             ]
 
-            # Criar gráfico de linha com os dados reais
-            grafico = self.criar_grafico_linha(monthly_data)
+            grafico = (
+                "linha",
+                [item["month"] for item in monthly_data],
+                [float(item["total"]) for item in monthly_data],
+            )
 
         # Exibir métricas
         for label, valor in dados:
-            row = ttk.Frame(self.metrics_frame)
+            row = ttk.Frame(self.values_frame)
             row.pack(anchor="w", pady=5)
             ttk.Label(row, text=label, style="TLabel").pack(side="left", padx=(0, 10))
             ttk.Label(row, text=valor, style="TLabel").pack(side="left")
 
-        # Exibir gráfico
-        canvas = FigureCanvasTkAgg(grafico, master=self.metrics_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(pady=20)
-
-    def criar_grafico_pizza(self, data):
-        if not data:
-            # Retorna um gráfico vazio se não houver dados
-            fig, ax = plt.subplots(figsize=(8, 8))
-            ax.text(0.5, 0.5, "Sem dados disponíveis", ha="center", va="center")
-            ax.axis("off")
-            self.figures.append(fig)
-            return fig
-
-        categories = []
-        values = []
-        for item in data:
-            categories.append(item["name"])
-            values.append(item["total_expense"])
-
-        fig, ax = plt.subplots(figsize=(10, 8))
-        ax.pie(values, labels=categories, autopct="%1.1f%%", startangle=140)
-        ax.axis("equal")
-        self.figures.append(fig)
-        return fig
-
-    def criar_grafico_linha(self, monthly_data):
-        if not monthly_data:
-            # Retorna um gráfico vazio se não houver dados
-            fig, ax = plt.subplots(figsize=(5, 3))
-            ax.text(0.5, 0.5, "Sem dados disponíveis", ha="center", va="center")
-            ax.axis("off")
-            self.figures.append(fig)
-            return fig
-
-        months = [item["month"] for item in monthly_data]
-        values = [item["total"] for item in monthly_data]
-
-        fig, ax = plt.subplots(figsize=(8, 4))
-        ax.plot(months, values, marker="o", color="teal")
-        ax.set_title("Gastos Mensais")
-        ax.set_ylabel("Valor (R$)")
-        ax.grid(True)
-
-        # Rotacionar labels dos meses para melhor visualização
-        plt.xticks(rotation=45)
-        plt.tight_layout()
-        self.figures.append(fig)
-        return fig
+        # Exibir gráfico, reaproveitando a figura do tipo
+        self.charts.show(*grafico)
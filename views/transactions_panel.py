@@ -1,68 +1,78 @@
 import tkinter as tk
+from datetime import date
 from tkinter import ttk
-from tkcalendar import DateEntry
-from src.services.transaction_service import TransactionService
+from src.container import ServiceContainer
+from src.models.transaction.transaction import Transaction
 from src.models.transaction.transaction_type import TransactionType
 from src.models.transaction.expense import Expense
+from src.repositories.transaction_filter import TransactionFilter
+from utils.period import Period
+from utils.task_runner import TaskRunner
 
 
 class TransactionsPanel(tk.Frame):
-    def __init__(self, parent, color_palette):
+    # Transações buscadas por vez conforme a lista é rolada
+    PAGE_SIZE = 100
+    # Fração já rolada a partir da qual a próxima página é buscada
+    PREFETCH_AT = 0.8
+    # Linha exibida enquanto uma página é carregada
+    LOADING_ROW = "loading"
+    # Espera após a última tecla antes de buscar, e resultados exibidos
+    SEARCH_DELAY_MS = 150
+    SEARCH_LIMIT = 100
+    # Meses seguintes mostrados em "Próximas parcelas"
+    UPCOMING_MONTHS = 1
+
+    COLUMNS = (
+        ("type", "Tipo de transação", "w"),
+        ("date", "Data", "w"),
+        ("category", "Categoria", "w"),
+        ("account", "Conta", "w"),
+        ("amount", "Valor", "e"),
+    )
+
+    def __init__(self, parent, color_palette, container=None, tasks=None):
         super().__init__(parent, bg=color_palette["light_gray"])
         self.color_palette = color_palette
-        self.transaction_service = TransactionService()
-        self.canvas = None
-        self.inner_frame = None
+        self.transaction_service = (
+            container or ServiceContainer.default()
+        ).transaction_service
+        # Sem o runner da MainWindow, a tela cria o seu e o encerra ao sair
+        self.owns_tasks = tasks is None
+        self.tasks = tasks or TaskRunner(self)
+        self.tree = None
+        self.scrollbar = None
+        # Posição (data, ID) da última transação carregada
+        self.cursor = (None, None)
+        self.exhausted = False
+        self.loading = False
+        self.search_text = tk.StringVar()
+        self.search_after = None
+        # Alterna a lista entre o histórico e as parcelas ainda por vencer
+        self.show_upcoming = tk.BooleanVar(value=False)
 
         self.create_widgets()
 
-    def create_widgets(self):
-        main_frame = tk.Frame(self, bg=self.color_palette["light_gray"])
-        main_frame.pack(fill="both", expand=True)
-
-        self.canvas = tk.Canvas(
-            main_frame, bg=self.color_palette["white"], highlightthickness=0
-        )
-        scrollbar = ttk.Scrollbar(
-            main_frame, orient="vertical", command=self.canvas.yview
-        )
-
-        self.canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-
-        self.inner_frame = tk.Frame(self.canvas, bg=self.color_palette["white"])
-
-        self.canvas.create_window(
-            (0, 0), window=self.inner_frame, anchor="nw", tags="inner_frame"
-        )
-
-        self.canvas.bind(
-            "<Configure>",
-            lambda e: self.canvas.itemconfig("inner_frame", width=e.width),
-        )
+        self.bind("<Destroy>", self.on_destroy)
 
-        def on_frame_configure(event):
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-            self.canvas.itemconfig("inner_frame", width=event.width)
+    def on_destroy(self, event):
+        """Encerra o runner próprio quando o frame for destruído"""
+        if event.widget is self and self.owns_tasks:
+            self.tasks.shutdown()
 
-        self.inner_frame.bind("<Configure>", on_frame_configure)
-
-        def on_canvas_configure(event):
-            self.canvas.itemconfig("inner_frame", width=event.width)
-
-        self.canvas.bind("<Configure>", on_canvas_configure)
+    def create_widgets(self):
+        main_frame = tk.Frame(self, bg=self.color_palette["white"])
+        main_frame.pack(fill="both", expand=True)
 
         # Cria o cabeçalho
-        self.create_header()
+        self.create_header(main_frame)
         # Cria a lista de transações
-        self.create_transaction_list()
+        self.create_transaction_list(main_frame)
 
-    def create_header(self):
+    def create_header(self, parent):
         """Cria o cabeçalho do painel de transações"""
         self.header_frame = tk.Frame(
-            self.inner_frame, bg=self.color_palette["white"], padx=20, pady=20
+            parent, bg=self.color_palette["white"], padx=20, pady=20
         )
         self.header_frame.pack(fill="x", pady=(0, 20))
 
@@ -78,76 +88,209 @@ class TransactionsPanel(tk.Frame):
         dates_frame = tk.Frame(self.header_frame, bg=self.color_palette["white"])
         dates_frame.pack(side="right", anchor="e")
 
-    def create_transaction_list(self):
-        """Cria a lista de transações"""
-        # Tabela com headers e valores
-        table = tk.Frame(self.inner_frame, bg=self.color_palette["white"])
+        # Busca pela descrição, atualizada enquanto o usuário digita
+        search_entry = ttk.Entry(dates_frame, textvariable=self.search_text, width=30)
+        search_entry.pack(side="right")
+        search_entry.bind("<KeyRelease>", self.schedule_search)
+        ttk.Label(
+            dates_frame,
+            text="Buscar:",
+            style="TLabel",
+            background=self.color_palette["white"],
+        ).pack(side="right", padx=(0, 5))
+
+        ttk.Checkbutton(
+            dates_frame,
+            text="Próximas parcelas",
+            variable=self.show_upcoming,
+            command=self.refresh_transactions,
+        ).pack(side="right", padx=(0, 15))
+
+    def create_transaction_list(self, parent):
+        """
+        Cria a lista de transações.
+
+        A Treeview é um único widget, qualquer que seja o tamanho do histórico,
+        e as transações chegam em páginas à medida que a lista é rolada.
+        """
+        table = tk.Frame(parent, bg=self.color_palette["white"])
         table.pack(fill="both", expand=True)
 
-        # Configurar colunas para expandirem
-        for col in range(5):
-            table.grid_columnconfigure(col, weight=1)
+        self.tree = ttk.Treeview(
+            table,
+            columns=[name for name, _, _ in self.COLUMNS],
+            show="headings",
+            selectmode="browse",
+            style="Transactions.Treeview",
+        )
+        for name, heading, anchor in self.COLUMNS:
+            self.tree.heading(name, text=heading, anchor=anchor)
+            self.tree.column(name, anchor=anchor, stretch=True, width=120)
 
-        # Cabeçalhos da tabela
-        ttk.Label(table, text="Tipo de transação", style="TLabel").grid(
-            row=0, column=0, sticky="w", padx=5, pady=(0, 5)
+        self.scrollbar = ttk.Scrollbar(
+            table, orient="vertical", command=self.tree.yview
         )
-        ttk.Label(table, text="Data", style="TLabel").grid(
-            row=0, column=1, sticky="w", padx=5, pady=(0, 5)
+        self.tree.configure(yscrollcommand=self.on_scroll)
+
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
+
+        self.load_next_page()
+
+    def on_scroll(self, first, last):
+        """Atualiza a barra de rolagem e busca a próxima página perto do fim"""
+        self.scrollbar.set(first, last)
+        if float(last) >= self.PREFETCH_AT and not self.exhausted:
+            self.after_idle(self.load_next_page)
+
+    def load_next_page(self):
+        """Busca a próxima página em segundo plano e a acrescenta à lista"""
+        if self.loading or self.exhausted or not self.tree.winfo_exists():
+            return
+
+        self.loading = True
+        self.tree.insert(
+            "",
+            "end",
+            iid=self.LOADING_ROW,
+            values=("Carregando...",) + ("",) * (len(self.COLUMNS) - 1),
         )
-        ttk.Label(table, text="Categoria", style="TLabel").grid(
-            row=0, column=2, sticky="w", padx=5, pady=(0, 5)
+        # Parcelas futuras ficam em "Próximas parcelas", não no histórico
+        self.tasks.submit(
+            self.transaction_service.get_page,
+            *self.cursor,
+            limit=self.PAGE_SIZE,
+            filters=TransactionFilter().until(date.today()),
+            on_done=self.show_page,
+            on_error=self.show_page_error,
+            group=self,
         )
-        ttk.Label(table, text="Conta", style="TLabel").grid(
-            row=0, column=3, sticky="w", padx=5, pady=(0, 5)
+
+    def end_loading(self):
+        self.loading = False
+        if self.tree.exists(self.LOADING_ROW):
+            self.tree.delete(self.LOADING_ROW)
+
+    def show_page(self, page):
+        """Acrescenta ao fim da lista a página recebida"""
+        if not self.tree.winfo_exists():
+            return
+        self.end_loading()
+        for transaction in page:
+            iid = str(transaction.id)
+            if not self.tree.exists(iid):
+                self.tree.insert(
+                    "", "end", iid=iid, values=self.format_row(transaction)
+                )
+        if page:
+            self.cursor = (page[-1].date, page[-1].id)
+        self.exhausted = len(page) < self.PAGE_SIZE
+
+    def show_page_error(self, error):
+        """Interrompe a paginação se a consulta falhar"""
+        print(f"Error loading transactions page: {error}")
+        if self.tree.winfo_exists():
+            self.end_loading()
+            self.exhausted = True
+
+    @staticmethod
+    def format_row(transaction: Transaction) -> tuple[str, ...]:
+        """Valores exibidos nas colunas para uma transação"""
+        category = (
+            transaction.category.name
+            if isinstance(transaction, Expense) and transaction.category
+            else ""
         )
-        ttk.Label(table, text="Valor", style="TLabel").grid(
-            row=0, column=4, sticky="e", padx=5, pady=(0, 5)
+        return (
+            TransactionType.get_visual_label(
+                transaction_type=transaction.transaction_type
+            ),
+            transaction.date.strftime("%d/%m/%Y"),
+            category,
+            transaction.payment_method.name if transaction.payment_method else "",
+            f"R${transaction.amount:.2f}",
         )
 
-        # Lista de transações
-        transactions = self.transaction_service.get_all_transactions()
-        for i, transaction in enumerate(transactions, start=1):
-            category = (
-                transaction.category.name
-                if isinstance(transaction, Expense) and transaction.category
-                else ""
-            )
-            transaction_type = TransactionType.get_visual_label(
-                transaction_type=transaction.transaction_type
-            )
+    def schedule_search(self, event=None):
+        """Agenda a busca para quando o usuário parar de digitar"""
+        if self.search_after is not None:
+            self.after_cancel(self.search_after)
+        self.search_after = self.after(self.SEARCH_DELAY_MS, self.run_search)
 
-            ttk.Label(table, text=transaction_type, style="TLabel").grid(
-                row=i, column=0, sticky="w", padx=5, pady=2
-            )
-            ttk.Label(
-                table, text=transaction.date.strftime("%d/%m/%Y"), style="TLabel"
-            ).grid(row=i, column=1, sticky="w", padx=5, pady=2)
-            ttk.Label(table, text=category, style="TLabel").grid(
-                row=i, column=2, sticky="w", padx=5, pady=2
-            )
-            ttk.Label(
-                table,
-                text=(
-                    transaction.payment_method.name
-                    if transaction.payment_method
-                    else ""
-                ),
-                style="TLabel",
-            ).grid(row=i, column=3, sticky="w", padx=5, pady=2)
-            ttk.Label(table, text=f"R${transaction.amount:.2f}", style="TLabel").grid(
-                row=i, column=4, sticky="e", padx=5, pady=2
+    def run_search(self):
+        """Troca a lista pelos resultados da busca (ou volta à lista paginada)"""
+        self.search_after = None
+        text = self.search_text.get().strip()
+        if not text:
+            self.refresh_transactions()
+            return
+
+        self.tasks.cancel(group=self)
+        self.tree.delete(*self.tree.get_children())
+        self.tree.yview_moveto(0)
+        # Os resultados da busca não são paginados
+        self.exhausted = True
+        self.loading = True
+        self.tree.insert(
+            "",
+            "end",
+            iid=self.LOADING_ROW,
+            values=("Buscando...",) + ("",) * (len(self.COLUMNS) - 1),
+        )
+        self.tasks.submit(
+            self.transaction_service.search,
+            text,
+            # Como o histórico, a busca não mostra parcelas futuras
+            filters=TransactionFilter().until(date.today()),
+            limit=self.SEARCH_LIMIT,
+            on_done=self.show_results,
+            on_error=self.show_page_error,
+            group=self,
+        )
+
+    def show_results(self, results):
+        """Exibe uma lista não paginada: a busca ou as próximas parcelas"""
+        if not self.tree.winfo_exists():
+            return
+        self.end_loading()
+        for transaction in results:
+            self.tree.insert(
+                "", "end", iid=str(transaction.id), values=self.format_row(transaction)
             )
 
-        self.inner_frame.update_idletasks()
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    def load_upcoming(self):
+        """Troca a lista pelas parcelas que vencem a partir de amanhã"""
+        self.tasks.cancel(group=self)
+        self.tree.delete(*self.tree.get_children())
+        self.tree.yview_moveto(0)
+        self.exhausted = True
+        self.loading = True
+        self.tree.insert(
+            "",
+            "end",
+            iid=self.LOADING_ROW,
+            values=("Carregando...",) + ("",) * (len(self.COLUMNS) - 1),
+        )
+        self.tasks.submit(
+            self.transaction_service.get_installments_due,
+            Period.upcoming(self.UPCOMING_MONTHS),
+            on_done=self.show_results,
+            on_error=self.show_page_error,
+            group=self,
+        )
 
     def refresh_transactions(self):
-        """Atualiza a lista de transações"""
-        # Encontra e destrói o frame da tabela (mantendo o cabeçalho)
-        for widget in self.inner_frame.winfo_children():
-            if widget != self.header_frame:
-                widget.destroy()
-
-        # Recria a lista de transações
-        self.create_transaction_list()
+        """Atualiza a lista de transações, voltando à primeira página"""
+        if self.search_text.get().strip():
+            self.run_search()
+            return
+        if self.show_upcoming.get():
+            self.load_upcoming()
+            return
+        self.tasks.cancel(group=self)
+        self.loading = False
+        self.tree.delete(*self.tree.get_children())
+        self.tree.yview_moveto(0)
+        self.cursor = (None, None)
+        self.exhausted = False
+        self.load_next_page()
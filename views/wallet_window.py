@@ -1,34 +1,66 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from views.add_account_window import AddAccountWindow
-from src.services.payment_method_service import PaymentMethodService
-from src.services.transaction_service import TransactionService
+from src.container import ServiceContainer
 from src.models.payment_method.payment_type import PaymentType
+from utils.task_runner import TaskRunner
 
 
 class WalletWindow(tk.Frame):
-    def __init__(self, parent, color_palette):
+    def __init__(self, parent, color_palette, container=None, tasks=None):
         super().__init__(parent, bg=color_palette["light_gray"])
         self.color_palette = color_palette
         self.parent = parent
 
-        self.payment_method_service = PaymentMethodService()
-        self.transactions_service = TransactionService()
+        self.container = container or ServiceContainer.default()
+        self.payment_method_service = self.container.payment_method_service
+        self.transactions_service = self.container.transaction_service
+        # Sem o runner da MainWindow, a tela cria o seu e o encerra ao sair
+        self.owns_tasks = tasks is None
+        self.tasks = tasks or TaskRunner(self)
         self.create_widgets()
 
+        self.bind("<Destroy>", self.on_destroy)
+
+    def on_destroy(self, event):
+        """Encerra o runner próprio quando o frame for destruído"""
+        if event.widget is self and self.owns_tasks:
+            self.tasks.shutdown()
+
     def open_add_account_window(self):
         if hasattr(self, "_add_window") and self._add_window.winfo_exists():
             self._add_window.lift()
             return
 
-        self._add_window = AddAccountWindow(master=self.parent, wallet_window=self)
+        self._add_window = AddAccountWindow(
+            master=self.parent, wallet_window=self, container=self.container
+        )
         self._add_window.grab_set()
 
     def create_widgets(self):
+        """Mostra um aviso de carregamento e busca as contas em segundo plano"""
+        self.tasks.cancel(group=self)
+        ttk.Label(self, text="Carregando contas...", style="Title.TLabel").pack(
+            anchor="w", padx=20, pady=20
+        )
+        self.tasks.submit(self.load_accounts, on_done=self.show_accounts, group=self)
+
+    def load_accounts(self):
+        """Consulta contas e totais do mês (executado fora da thread do Tk)"""
         contas = self.payment_method_service.get_all_payment_methods()
         incomes_and_expenses = (
             self.transactions_service.find_current_month_totals_by_payment_method()
         )
+        return contas, incomes_and_expenses
+
+    def show_accounts(self, data):
+        """Substitui o aviso de carregamento pelas contas"""
+        if not self.winfo_exists():
+            return
+        for widget in self.winfo_children():
+            widget.destroy()
+
+        contas, incomes_and_expenses = data
         total_balance = 0.0
         total_incomes = 0.0
         total_expenses = 0.0